@@ -0,0 +1,66 @@
+"""
+Gemeinsamer Client für die All-Inkl KAS API
+
+Verwendung aus den Skripten in scripts/:
+
+    from kas import KasClient
+
+    with KasClient(kas_user, kas_password) as client:
+        client.add_dns_record("baltic-ihub.com", "notstromaggregat", "A", "76.76.21.21")
+"""
+
+from .auth import KAS_AUTH_URL, KasAuthenticator
+from .cache import ZoneCache
+from .client import DEFAULT_NAMESERVER, KasClient, normalize_zone_host
+from .executor import ExecutionReport, ZoneExecutor
+from .mcp import MCP_HUB_URL, McpHubClient, McpHubTransport
+from .metrics import CallEvent, Metrics
+from .parser import KasResponse, parse_dns_records, parse_response
+from .provider import Capabilities, Driver, KasDriver
+from .retry import RetryPolicy, classify, is_already_exists
+from .scheduler import FloodScheduler
+from .transport import (
+    KAS_API_URL,
+    SoapTransport,
+    StubTransport,
+    Transport,
+    create_session,
+    create_soap_request,
+)
+from .zone import DnsRecord, Zone
+from .zonefile import ZoneFileDriver
+
+__all__ = [
+    "DEFAULT_NAMESERVER",
+    "KAS_API_URL",
+    "KAS_AUTH_URL",
+    "MCP_HUB_URL",
+    "CallEvent",
+    "Capabilities",
+    "DnsRecord",
+    "Driver",
+    "ExecutionReport",
+    "FloodScheduler",
+    "KasAuthenticator",
+    "KasClient",
+    "KasDriver",
+    "KasResponse",
+    "McpHubClient",
+    "McpHubTransport",
+    "Metrics",
+    "RetryPolicy",
+    "SoapTransport",
+    "StubTransport",
+    "Transport",
+    "Zone",
+    "ZoneCache",
+    "ZoneExecutor",
+    "ZoneFileDriver",
+    "classify",
+    "create_session",
+    "create_soap_request",
+    "is_already_exists",
+    "normalize_zone_host",
+    "parse_dns_records",
+    "parse_response",
+]
@@ -0,0 +1,7 @@
+"""
+Einstiegspunkt für python3 -m kas
+"""
+
+from .cli import main
+
+main()
@@ -0,0 +1,154 @@
+"""
+Session-Token Authentifizierung gegen den KAS Auth-Endpoint
+
+Statt in jedem SOAP-Request das Passwort mitzuschicken (kas_auth_type
+"plain"), wird einmal über KasAuth.php ein Token geholt und danach mit
+kas_auth_type "session" verwendet. Das Token wird im Speicher mit Ablaufzeit
+gehalten und bei Bedarf automatisch erneuert.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+import requests
+
+from .parser import parse_response
+
+# All-Inkl KAS Auth Endpoint (über KAS_AUTH_URL z.B. auf kas.fakeserver umlenkbar)
+KAS_AUTH_URL = os.getenv("KAS_AUTH_URL", "https://kasapi.kasserver.com/soap/KasAuth.php")
+
+# Lebensdauer des Tokens in Sekunden (KAS erlaubt maximal 3600)
+DEFAULT_SESSION_LIFETIME = 1800
+
+# Token wird so viele Sekunden vor Ablauf bereits erneuert
+REFRESH_MARGIN = 30
+
+AUTH_HEADERS = {
+    "Content-Type": "text/xml; charset=utf-8",
+    "SOAPAction": "urn:xmethodsKasApiAuthentication#KasAuth"
+}
+
+# Fehlermeldungen, bei denen das Token verworfen und neu geholt wird
+SESSION_FAULTS = ("session", "kas_auth_data_incorrect")
+
+
+def create_auth_request(kas_user: str, kas_password: str,
+                        session_lifetime: int = DEFAULT_SESSION_LIFETIME) -> str:
+    """Erstelle SOAP Request für KasAuth"""
+    auth_params = {
+        "kas_login": kas_user,
+        "kas_auth_type": "plain",
+        "kas_auth_data": kas_password,
+        "session_lifetime": session_lifetime,
+        "session_update_lifetime": "Y"
+    }
+
+    params_json = json.dumps(auth_params)
+
+    return f'''<?xml version="1.0" encoding="UTF-8"?>
+<SOAP-ENV:Envelope
+    xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:ns1="urn:xmethodsKasApiAuthentication"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+    SOAP-ENV:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">
+  <SOAP-ENV:Body>
+    <ns1:KasAuth>
+      <Params xsi:type="xsd:string">{params_json}</Params>
+    </ns1:KasAuth>
+  </SOAP-ENV:Body>
+</SOAP-ENV:Envelope>'''
+
+
+def extract_token(xml_response) -> Optional[str]:
+    """Extrahiere das Session-Token aus der KasAuth Antwort"""
+    response = parse_response(xml_response)
+    if response.fault_string is None and isinstance(response.value, str) and response.value.strip():
+        return response.value.strip()
+    return None
+
+
+def is_session_fault(fault: str) -> bool:
+    """Prüfe ob ein Fehler auf ein ungültiges oder abgelaufenes Token hinweist"""
+    fault = fault.lower()
+    return any(marker in fault for marker in SESSION_FAULTS)
+
+
+class KasAuthenticator:
+    """Holt und cached ein KAS Session-Token
+
+    Da session_update_lifetime aktiv ist, verlängert jede Verwendung die
+    Lebensdauer; touch() schiebt deshalb die lokale Ablaufzeit mit.
+    """
+
+    def __init__(self, kas_user: str, kas_password: str, session: requests.Session,
+                 auth_url: str = KAS_AUTH_URL,
+                 session_lifetime: int = DEFAULT_SESSION_LIFETIME,
+                 timeout: float = 60):
+        self.kas_user = kas_user
+        self.kas_password = kas_password
+        self.session = session
+        self.auth_url = auth_url
+        self.session_lifetime = session_lifetime
+        self.timeout = timeout
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        # Fault der letzten fehlgeschlagenen Anmeldung (None: Netzwerkfehler oder Erfolg)
+        self.last_fault: Optional[str] = None
+
+    @property
+    def is_valid(self) -> bool:
+        """True wenn ein Token vorliegt, das nicht kurz vor dem Ablauf steht"""
+        return self._token is not None and time.monotonic() < self._expires_at - REFRESH_MARGIN
+
+    def get_token(self) -> Optional[str]:
+        """Gib das gecachte Token zurück oder melde dich neu an"""
+        with self._lock:
+            if not self.is_valid:
+                self._login()
+            return self._token
+
+    def touch(self):
+        """Verlängere die lokale Ablaufzeit nach erfolgreicher Verwendung"""
+        with self._lock:
+            if self._token is not None:
+                self._expires_at = time.monotonic() + self.session_lifetime
+
+    def invalidate(self):
+        """Verwirf das Token, der nächste Aufruf meldet sich neu an"""
+        with self._lock:
+            self._token = None
+            self._expires_at = 0.0
+
+    def _login(self):
+        """Hole ein neues Token über KasAuth.php"""
+        self._token = None
+        self.last_fault = None
+        soap_envelope = create_auth_request(self.kas_user, self.kas_password, self.session_lifetime)
+
+        try:
+            response = self.session.post(
+                self.auth_url,
+                data=soap_envelope.encode("utf-8"),
+                headers=AUTH_HEADERS,
+                timeout=self.timeout
+            )
+            # KAS meldet Faults mit HTTP 500, der Body enthält die Fehlermeldung
+            if response.status_code != 500:
+                response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Fehler bei der KAS-Anmeldung: {e}")
+            return
+
+        token = extract_token(response.content)
+        if token is None:
+            print(f"❌ Kein Session-Token erhalten: {response.text[:200]}")
+            self.last_fault = parse_response(response.content).fault_string or "kein Token"
+            return
+
+        self._token = token
+        self._expires_at = time.monotonic() + self.session_lifetime
@@ -0,0 +1,293 @@
+"""
+Benchmarks für die heißen Pfade der DNS-Werkzeuge
+
+Gemessen wird für Zonen von 10 bis 10.000 Einträgen:
+
+- envelope:    SOAP-Envelopes für add_dns_settings bauen (create_soap_request)
+- parse:       get_dns_settings-Antwort parsen und Records extrahieren
+- diff:        Plan aus gewünschtem Zustand und Live-Zone berechnen (plan_zone)
+- apply_stub:  Plan über KasClient + StubTransport anwenden (ohne Netzwerk)
+- apply_http:  Plan per SOAP gegen kas.fakeserver anwenden (localhost)
+
+Die Ergebnisse gehen als JSON nach --output und können mit einer
+gespeicherten Baseline verglichen werden; langsamer als --threshold gilt als
+Regression (Exit-Code 1).
+
+Aufruf (aus scripts/):
+
+    python3 -m kas.bench                                  # alles, Ausgabe auf stdout
+    python3 -m kas.bench --sizes 10 1000 --only parse diff
+    python3 -m kas.bench --save-baseline                  # benchmarks/baseline.json schreiben
+    python3 -m kas.bench --compare                        # gegen die Baseline prüfen
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from .client import KasClient
+from .fakeserver import FakeKasServer, create_soap_response
+from .parser import parse_response
+from .reconcile import apply_plan, plan_zone
+from .scheduler import FloodScheduler
+from .transport import StubTransport, create_soap_request
+from .zone import DnsRecord, Zone
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+BENCHMARKS = ("envelope", "parse", "diff", "apply_stub", "apply_http")
+
+# apply_http macht zwei HTTP-Requests pro Eintrag, darüber wird es zäh
+DEFAULT_HTTP_MAX_SIZE = 1000
+
+# Langsamer als Baseline * (1 + threshold) gilt als Regression
+DEFAULT_THRESHOLD = 0.20
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "benchmarks", "baseline.json")
+
+ZONE_HOST = "bench.example"
+CNAME_TARGET = "bench.vercel-dns.example."
+
+
+def make_records(size: int) -> List[Dict]:
+    """size A-Records im Format der KAS-Antwort (record_*)"""
+    return [{
+        "record_id": str(i + 1),
+        "record_name": f"host{i:05d}",
+        "record_type": "A",
+        "record_data": f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}",
+        "record_aux": 0,
+    } for i in range(size)]
+
+
+def make_desired(size: int) -> List[DnsRecord]:
+    """Gewünschter Zustand: jeder zweite Name wird CNAME, der Rest bleibt gleich"""
+    desired = []
+    for record in make_records(size):
+        index = int(record["record_id"]) - 1
+        if index % 2:
+            desired.append(DnsRecord(record["record_name"], "CNAME", CNAME_TARGET))
+        else:
+            desired.append(DnsRecord(record["record_name"], "A", record["record_data"]))
+    return desired
+
+
+def measure(func: Callable[[], object], repeat: int,
+            setup: Optional[Callable[[], object]] = None) -> List[float]:
+    """Laufzeiten von func in Sekunden; setup läuft vor jeder Messung (ungemessen)"""
+    timings = []
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        started = time.perf_counter()
+        func(arg) if setup is not None else func()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def bench_envelope(size: int, repeat: int) -> List[float]:
+    params = [{
+        "zone_host": ZONE_HOST + ".",
+        "record_name": record["record_name"],
+        "record_type": record["record_type"],
+        "record_data": record["record_data"],
+        "record_aux": "0",
+    } for record in make_records(size)]
+    return measure(lambda: [create_soap_request("bench", "token", "add_dns_settings",
+                                                p, kas_auth_type="session") for p in params],
+                   repeat)
+
+
+def bench_parse(size: int, repeat: int) -> List[float]:
+    xml = create_soap_response("KasApi", {"Response": {
+        "KasFloodDelay": 0.5, "ReturnString": "TRUE", "ReturnInfo": make_records(size)
+    }}).encode("utf-8")
+    return measure(lambda: parse_response(xml).records, repeat)
+
+
+def bench_diff(size: int, repeat: int) -> List[float]:
+    records = make_records(size)
+    desired = make_desired(size)
+    return measure(lambda: plan_zone(ZONE_HOST, desired,
+                                     Zone.from_records(ZONE_HOST, records)), repeat)
+
+
+def _apply(client: KasClient, desired: List[DnsRecord]):
+    plan = plan_zone(ZONE_HOST, desired, client.get_zone(ZONE_HOST))
+    # apply_plan meldet jede Änderung, das gehört nicht zur Messung
+    with contextlib.redirect_stdout(io.StringIO()):
+        failed, _ = apply_plan(client, plan, max_workers=1)
+    if failed:
+        raise RuntimeError(f"{len(failed)} Änderung(en) fehlgeschlagen")
+
+
+def bench_apply_stub(size: int, repeat: int) -> List[float]:
+    records = make_records(size)
+    desired = make_desired(size)
+
+    def setup():
+        return KasClient(transport=StubTransport({ZONE_HOST: records}), use_cache=False)
+
+    return measure(lambda client: _apply(client, desired), repeat, setup)
+
+
+def bench_apply_http(size: int, repeat: int) -> List[float]:
+    records = make_records(size)
+    desired = make_desired(size)
+    timings = []
+    for _ in range(repeat):
+        with FakeKasServer(zones={ZONE_HOST: records}) as server:
+            with KasClient("bench", "bench", api_url=server.api_url, auth_url=server.auth_url,
+                           scheduler=FloodScheduler(fallback_delay=0.0),
+                           use_cache=False) as client:
+                timings.extend(measure(lambda: _apply(client, desired), 1))
+    return timings
+
+
+BENCH_FUNCTIONS = {
+    "envelope": bench_envelope,
+    "parse": bench_parse,
+    "diff": bench_diff,
+    "apply_stub": bench_apply_stub,
+    "apply_http": bench_apply_http,
+}
+
+
+def run(benchmarks: List[str], sizes: List[int], repeat: int,
+        http_max_size: int = DEFAULT_HTTP_MAX_SIZE) -> Dict:
+    """Führe alle Benchmarks aus und gib das Ergebnis-Dokument zurück"""
+    results = []
+    for name in benchmarks:
+        for size in sizes:
+            if name == "apply_http" and size > http_max_size:
+                continue
+            # Große Zonen seltener wiederholen, damit der Lauf überschaubar bleibt
+            runs = repeat if size <= 1000 else max(1, repeat // 3)
+            timings = BENCH_FUNCTIONS[name](size, runs)
+            best = min(timings)
+            results.append({
+                "benchmark": name,
+                "size": size,
+                "repeat": len(timings),
+                "best": best,
+                "mean": statistics.mean(timings),
+                "per_record_us": best / size * 1e6,
+            })
+            print(f"  {name:<11} {size:>6} Einträge: {best * 1000:9.2f} ms "
+                  f"({best / size * 1e6:7.2f} µs/Eintrag)", file=sys.stderr)
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def load_baseline(path: str) -> Optional[Dict]:
+    """Gespeicherte Baseline, None (mit Meldung) wenn sie fehlt oder kaputt ist"""
+    if not os.path.exists(path):
+        print(f"❌ Keine Baseline unter {path}")
+        print("   Aufnehmen mit: python3 -m kas.bench --save-baseline")
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Baseline nicht lesbar: {e}")
+        return None
+    if not isinstance(baseline, dict) or not baseline.get("results"):
+        print(f"❌ Baseline {path} enthält keine Ergebnisse")
+        return None
+    return baseline
+
+
+def compare(current: Dict, baseline: Dict,
+            threshold: float = DEFAULT_THRESHOLD) -> Optional[List[str]]:
+    """Vergleiche mit der Baseline, gibt die Regressionen als Textzeilen zurück
+
+    None, wenn keine einzige Messung in der Baseline vorkommt.
+    """
+    reference = {(r["benchmark"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    compared = 0
+    for result in current["results"]:
+        base = reference.get((result["benchmark"], result["size"]))
+        if base is None or base["best"] <= 0:
+            print(f"⚠️  {result['benchmark']:<11} {result['size']:>6}: nicht in der Baseline")
+            continue
+        compared += 1
+        change = result["best"] / base["best"] - 1
+        line = (f"{result['benchmark']:<11} {result['size']:>6}: "
+                f"{base['best'] * 1000:9.2f} ms → {result['best'] * 1000:9.2f} ms ({change:+.0%})")
+        if change > threshold:
+            regressions.append(line)
+            line = "❌ " + line
+        else:
+            line = "✅ " + line
+        print(line)
+    return regressions if compared else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks für die DNS-Werkzeuge")
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS),
+                        help="Nur diese Benchmarks")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES),
+                        help="Zonengrößen (Anzahl Einträge)")
+    parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen pro Messung")
+    parser.add_argument("--http-max-size", type=int, default=DEFAULT_HTTP_MAX_SIZE,
+                        help="Größte Zone für apply_http")
+    parser.add_argument("--output", help="Ergebnisse als JSON in diese Datei (sonst stdout)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Pfad der Baseline")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Ergebnisse als neue Baseline speichern")
+    parser.add_argument("--compare", action="store_true", help="Gegen die Baseline vergleichen")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Erlaubte Verlangsamung (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        # Vor dem Messen prüfen, damit ein fehlender Vergleich nicht erst am Ende auffällt
+        baseline = load_baseline(args.baseline)
+        if baseline is None:
+            sys.exit(1)
+
+    print(f"⏱️  Benchmarks: {', '.join(args.only)}", file=sys.stderr)
+    current = run(args.only, args.sizes, args.repeat, args.http_max_size)
+
+    document = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(document + "\n")
+    elif not args.save_baseline and not args.compare:
+        print(document)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            f.write(document + "\n")
+        print(f"✅ Baseline gespeichert: {args.baseline}", file=sys.stderr)
+
+    if args.compare:
+        regressions = compare(current, baseline, args.threshold)
+        if regressions is None:
+            print(f"❌ Keine Messung passt zur Baseline {args.baseline} "
+                  f"(--only/--sizes prüfen oder neu aufnehmen)")
+            sys.exit(1)
+        if regressions:
+            print(f"\n❌ {len(regressions)} Regression(en) über {args.threshold:.0%}")
+            sys.exit(1)
+        print("\n✅ Keine Regressionen")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Lokaler Zonen-Cache auf der Festplatte
+
+Jede Zone wird als eigene JSON-Datei abgelegt (Schlüssel: zone_host und
+nameserver). Ein get_dns_settings-Aufruf füllt den Cache, innerhalb der TTL
+wird er wiederverwendet. Schreibende Aufrufe über den KasClient machen den
+Eintrag der betroffenen Zone ungültig. Planen, Vergleichen und Auflisten
+funktionieren damit auch ohne API-Aufruf.
+"""
+
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_CACHE_DIR = os.getenv(
+    "KAS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "notstrom-kas", "zones")
+)
+
+# Gültigkeit eines Cache-Eintrags in Sekunden
+DEFAULT_TTL = 300
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r'[^A-Za-z0-9._-]', '_', value.rstrip('.').lower())
+
+
+class ZoneCache:
+    """JSON-Datei pro Zone mit Zeitstempel"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl: float = DEFAULT_TTL,
+                 clock: Callable[[], float] = time.time):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self._clock = clock
+
+    def path(self, zone_host: str, nameserver: str) -> str:
+        """Dateiname für eine Zone"""
+        return os.path.join(self.cache_dir, f"{_safe_name(zone_host)}@{_safe_name(nameserver)}.json")
+
+    def _load(self, zone_host: str, nameserver: str) -> Optional[Dict]:
+        try:
+            with open(self.path(zone_host, nameserver), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def age(self, zone_host: str, nameserver: str) -> Optional[float]:
+        """Alter des Eintrags in Sekunden, None wenn nicht vorhanden"""
+        entry = self._load(zone_host, nameserver)
+        if entry is None:
+            return None
+        return self._clock() - entry.get("fetched_at", 0)
+
+    def get(self, zone_host: str, nameserver: str,
+            max_age: Optional[float] = None) -> Optional[List[Dict]]:
+        """Gib die gecachten Einträge zurück, solange sie jünger als max_age sind
+
+        Ohne max_age gilt die TTL des Caches; max_age=float("inf") liefert
+        jeden vorhandenen Stand (Offline-Modus).
+        """
+        entry = self._load(zone_host, nameserver)
+        if entry is None:
+            return None
+        if max_age is None:
+            max_age = self.ttl
+        if self._clock() - entry.get("fetched_at", 0) > max_age:
+            return None
+        return entry.get("records", [])
+
+    def put(self, zone_host: str, nameserver: str, records: List[Dict]):
+        """Speichere die Einträge einer Zone (atomar per rename)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = {
+            "zone_host": zone_host.rstrip('.'),
+            "nameserver": nameserver,
+            "fetched_at": self._clock(),
+            "records": records
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, indent=1)
+            os.replace(tmp_path, self.path(zone_host, nameserver))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def invalidate(self, zone_host: Optional[str] = None):
+        """Verwirf den Cache einer Zone (alle Nameserver) oder den ganzen Cache"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        prefix = f"{_safe_name(zone_host)}@" if zone_host else ""
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(prefix) and name.endswith(".json"):
+                try:
+                    os.unlink(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    pass
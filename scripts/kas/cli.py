@@ -0,0 +1,388 @@
+"""
+Kommandozeile für alle DNS-Aufgaben (ersetzt die Einzel-Skripte)
+
+Alle Unterbefehle lesen Zonen und Einträge aus einer Desired-State-Datei
+('-' für stdin, Format siehe kas.reconcile) und erledigen alles in einem
+Prozess mit einer KAS-Session – egal ob fünf oder fünfhundert Einträge.
+
+Aufruf (aus scripts/):
+
+    python3 -m kas plan dns_zones.json            # Plan anzeigen
+    python3 -m kas plan dns_zones.json --offline  # Plan nur aus dem Zonen-Cache
+    python3 -m kas apply dns_zones.json           # Plan anwenden
+    python3 -m kas list baltic-ihub.com --refresh # Einträge einer Zone auflisten
+    python3 -m kas migrate dns_zones.json         # A/AAAA atomar auf die CNAMEs umstellen
+    python3 -m kas verify dns_zones.json          # Warten, bis die Resolver die Einträge sehen
+    cat records.json | python3 -m kas apply -     # Einträge von stdin
+
+Mit --transport wird gewählt, wie die Aufrufe beim KAS ankommen: kas (SOAP
+direkt, Standard), mcp (über den MCP Hub, MCP_HUB_TOKEN nötig) oder stub
+(im Speicher auf Basis des Zonen-Caches – ein Probelauf ohne Netzwerk).
+Voreinstellung über die Umgebungsvariable KAS_TRANSPORT.
+
+Mit --provider zonefile arbeiten plan, apply und list statt mit KAS auf
+RFC-1035-Zonendateien in --zone-dir (siehe kas.zonefile); Voreinstellung
+über DNS_PROVIDER. migrate bleibt KAS-spezifisch.
+
+Mit --metrics (mehrfach möglich, Voreinstellung KAS_METRICS, kommagetrennt)
+wird jeder KAS-Aufruf als Event gemeldet: jsonl:pfad, prom:pfad, stdout
+oder stderr (siehe kas.metrics). Am Ende steht ein Histogramm pro Aktion.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Iterable, List, Optional
+
+from .cache import ZoneCache
+from .client import DEFAULT_NAMESERVER, KasClient
+from .credentials import get_credentials
+from .executor import DEFAULT_MAX_WORKERS
+from .journal import DONE, FAILED, Journal, default_journal_path
+from .mcp import McpHubTransport
+from .metrics import Metrics, create_sink
+from .migrate import migrate_zone, print_result
+from .provider import Driver, KasDriver
+from .reconcile import Change, apply_plan, build_plan, load_desired_state
+from .transport import SoapTransport, StubTransport, Transport
+from .verify import (DEFAULT_BASE_INTERVAL, DEFAULT_RESOLVERS, DEFAULT_TIMEOUT,
+                     PropagationVerifier, UdpResolver, expectations_from_state,
+                     print_report, stub_resolvers)
+from .zone import Zone
+from .zonefile import ZoneFileDriver
+
+TRANSPORTS = ("kas", "mcp", "stub")
+PROVIDERS = ("kas", "zonefile")
+
+
+def create_transport(name: str, workers: int = 1, zones: Iterable[str] = ()) -> Transport:
+    """Transport nach Namen, beendet bei fehlenden Credentials"""
+    if name == "mcp":
+        token = os.getenv("MCP_HUB_TOKEN")
+        if not token:
+            print("❌ MCP_HUB_TOKEN nicht gesetzt")
+            sys.exit(1)
+        return McpHubTransport(token)
+
+    if name == "stub":
+        # Zonen aus dem Cache in den Speicher laden, Änderungen bleiben dort
+        cache = ZoneCache()
+        return StubTransport({
+            zone_host: cache.get(zone_host, DEFAULT_NAMESERVER, max_age=float("inf")) or []
+            for zone_host in zones
+        })
+
+    kas_user, kas_password = get_credentials()
+    if not kas_user or not kas_password:
+        print("❌ Credentials nicht gefunden!")
+        sys.exit(1)
+    return SoapTransport(kas_user, kas_password, pool_size=max(workers, 1))
+
+
+def open_client(args, zones: Iterable[str] = ()) -> KasClient:
+    """KasClient mit dem gewählten Transport"""
+    transport = create_transport(args.transport, getattr(args, "workers", 1), zones)
+    # Der Stub darf den echten Zonen-Cache nicht überschreiben
+    return KasClient(transport=transport, use_cache=transport.name != "stub",
+                     metrics=args.metrics)
+
+
+def open_driver(args, zones: Iterable[str] = ()) -> Driver:
+    """Driver für --provider: KAS (mit --transport) oder Zonendateien"""
+    if args.provider == "zonefile":
+        return ZoneFileDriver(args.zone_dir)
+    return KasDriver(open_client(args, zones),
+                     max_concurrency=getattr(args, "workers", DEFAULT_MAX_WORKERS))
+
+
+def cached_zone(zone_host: str) -> Optional[Zone]:
+    """Zone aus dem Cache, egal wie alt (Offline-Modus)"""
+    records = ZoneCache().get(zone_host, DEFAULT_NAMESERVER, max_age=float("inf"))
+    return Zone.from_records(zone_host, records) if records is not None else None
+
+
+def open_journal(args) -> Optional[Journal]:
+    """Journal aus --journal oder neben der Eingabedatei (stdin: nur mit --journal)"""
+    path = args.journal
+    if path is None and args.records != "-":
+        path = default_journal_path(args.records)
+    if path is None:
+        if args.resume:
+            print("❌ --resume braucht bei stdin ein --journal")
+            sys.exit(1)
+        return None
+    return Journal(path)
+
+
+def print_plan(plan: List[Change], label: str = "Plan"):
+    print(f"📋 {label}: {len(plan)} Änderung(en)\n")
+    for change in plan:
+        print(f"  {change.describe()}")
+
+
+def cmd_plan(args):
+    """Plan berechnen und anzeigen, nichts ändern"""
+    state = load_desired_state(args.records)
+
+    if args.offline:
+        plan = build_plan(state, cached_zone)
+        if plan is None:
+            sys.exit(1)
+        print_plan(plan, "Plan (offline)")
+        return
+
+    with open_driver(args, state) as driver:
+        plan = build_plan(state, lambda zone_host: driver.get_zone(zone_host))
+        if plan is None:
+            sys.exit(1)
+        print_plan(plan)
+    print("\n✅ Keine Änderungen angewendet")
+
+
+def cmd_apply(args):
+    """Plan mit frisch geladenen Zonen berechnen und anwenden"""
+    state = load_desired_state(args.records)
+    journal = open_journal(args)
+
+    with open_driver(args, state) as driver:
+        plan = build_plan(state, lambda zone_host: driver.get_zone(zone_host, max_age=0))
+        if plan is None:
+            sys.exit(1)
+
+        if args.resume:
+            completed = journal.completed()
+            skipped = [change for change in plan if change.key in completed]
+            plan = [change for change in plan if change.key not in completed]
+            if skipped:
+                print(f"⏭️  {len(skipped)} Änderung(en) laut Journal bereits erledigt\n")
+        print_plan(plan)
+
+        if journal is not None:
+            journal.start_run()
+        if not plan:
+            if journal is not None:
+                journal.finish_run(success=True)
+            print("\n✅ Zonen sind aktuell")
+            return
+
+        if journal is not None:
+            print(f"\n📓 Journal: {journal.path}")
+        print()
+        failed, report = apply_plan(driver, plan, args.workers, journal)
+        if journal is not None:
+            journal.finish_run(success=not failed)
+
+    print("\n" + "="*60)
+    print(f"✅ Angewendet: {len(plan) - len(failed)}/{len(plan)}")
+    print(f"⏱️  {report.summary()}")
+    for line in driver.summary():
+        print(line)
+    if failed:
+        sys.exit(1)
+    print(f"\n🌐 Propagation prüfen: python3 -m kas verify {args.records}")
+
+
+def cmd_list(args):
+    """Einträge einer oder mehrerer Zonen ausgeben"""
+    zones = {}
+    if args.offline:
+        for zone_host in args.zones:
+            zones[zone_host] = cached_zone(zone_host)
+    else:
+        max_age = 0 if args.refresh else None
+        with open_driver(args, args.zones) as driver:
+            for zone_host in args.zones:
+                zones[zone_host] = driver.get_zone(zone_host, max_age=max_age)
+
+    missing = [zone_host for zone_host, zone in zones.items() if zone is None]
+    for zone_host in missing:
+        print(f"❌ Konnte DNS-Einträge für {zone_host} nicht abrufen", file=sys.stderr)
+
+    if args.json:
+        json.dump({zone_host: zone.to_records() for zone_host, zone in zones.items()
+                   if zone is not None}, sys.stdout, indent=2)
+        print()
+    else:
+        for zone_host, zone in zones.items():
+            if zone is None:
+                continue
+            print(f"🌐 {zone_host}: {len(zone)} Einträge")
+            for record in sorted(zone, key=lambda r: (r.name, r.type)):
+                print(f"  {record.record_id or '-':>10}  {record.name or '@':<30} "
+                      f"{record.type:<6} {record.data}")
+            print()
+
+    if missing:
+        sys.exit(1)
+
+
+def cmd_migrate(args):
+    """Alle CNAMEs der Datei atomar gegen bestehende A/AAAA-Records tauschen"""
+    if args.provider != "kas":
+        print("❌ migrate gibt es nur für --provider kas")
+        sys.exit(1)
+    state = load_desired_state(args.records)
+    journal = open_journal(args)
+    completed = journal.completed() if args.resume else set()
+    if journal is not None:
+        journal.start_run()
+
+    results = []
+    skipped = 0
+    with open_client(args, state) as client:
+        for zone_host, records in state.items():
+            # Namen nach CNAME-Ziel gruppieren, Zone wird pro Ziel einmal gelesen
+            targets = {}
+            for record in records:
+                if record.type == "CNAME":
+                    targets.setdefault(record.data, []).append(record.name)
+            for target, names in targets.items():
+                keys = {name: f"migrate:{zone_host}:{name}:{target}" for name in names}
+                skipped += sum(1 for name in names if keys[name] in completed)
+                names = [name for name in names if keys[name] not in completed]
+                if not names:
+                    continue
+                zone_results = migrate_zone(client, zone_host, names, target)
+                if zone_results is None:
+                    print(f"❌ Konnte DNS-Einträge für {zone_host} nicht abrufen")
+                    sys.exit(1)
+                for result in zone_results:
+                    print_result(result)
+                    if journal is not None:
+                        journal.record(DONE if result.success else FAILED,
+                                       keys[result.record_name],
+                                       rolled_back=result.rolled_back)
+                results.extend(zone_results)
+
+    if skipped:
+        print(f"⏭️  {skipped} Name(n) laut Journal bereits umgestellt\n")
+
+    failed = [result for result in results if not result.success]
+    if journal is not None:
+        journal.finish_run(success=not failed)
+    print("="*60)
+    print(f"✅ Umgestellt: {len(results) - len(failed)}/{len(results)}")
+    print(f"⏱️  {client.scheduler.summary()}")
+    if client.retry.retries:
+        print(f"🔁 {client.retry.summary()}")
+    if failed:
+        sys.exit(1)
+
+
+def cmd_verify(args):
+    """Resolver parallel abfragen, bis alle Einträge überall sichtbar sind"""
+    state = load_desired_state(args.records)
+    expectations = expectations_from_state(state)
+    if not expectations:
+        print("⚠️  Keine A/AAAA/CNAME-Einträge zu prüfen")
+        return
+
+    labels = args.resolver or list(DEFAULT_RESOLVERS)
+    if args.stub:
+        resolvers = stub_resolvers(expectations, labels)
+    else:
+        resolvers = [UdpResolver(label) for label in labels]
+
+    print(f"🌐 Prüfe {len(expectations)} Eintrag/Einträge bei {len(resolvers)} Resolver(n) "
+          f"(Timeout {args.timeout:.0f}s)\n")
+    verifier = PropagationVerifier(resolvers, timeout=args.timeout,
+                                   base_interval=args.interval)
+    results = verifier.verify(expectations)
+    print_report(results)
+
+    missing = [result for result in results if not result.seen]
+    print("="*60)
+    print(f"✅ Sichtbar: {len(results) - len(missing)}/{len(results)} (Name × Resolver)")
+    if results and not missing:
+        print(f"⏱️  Vollständig propagiert nach {max(r.elapsed for r in results):.1f}s")
+    if missing:
+        sys.exit(1)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python3 -m kas",
+                                     description="DNS-Einträge bei All-Inkl (KAS) verwalten")
+    parser.add_argument("--transport", choices=TRANSPORTS,
+                        default=os.getenv("KAS_TRANSPORT", "kas"),
+                        help="Weg zum KAS: SOAP direkt, MCP Hub oder Stub im Speicher")
+    parser.add_argument("--provider", choices=PROVIDERS,
+                        default=os.getenv("DNS_PROVIDER", "kas"),
+                        help="DNS-Backend: All-Inkl KAS oder RFC-1035-Zonendateien")
+    parser.add_argument("--zone-dir", default=os.getenv("DNS_ZONE_DIR", "zones"),
+                        help="Verzeichnis der Zonendateien (<zone>.zone) für --provider zonefile")
+    parser.add_argument("--metrics", action="append",
+                        default=[spec for spec in os.getenv("KAS_METRICS", "").split(",") if spec],
+                        help="Metrics-Sink pro Aufruf: jsonl:pfad, prom:pfad, stdout, stderr")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    plan = commands.add_parser("plan", help="Plan anzeigen, nichts ändern")
+    plan.add_argument("records", help="JSON-Datei mit Zone → Einträgen ('-' für stdin)")
+    plan.add_argument("--offline", action="store_true",
+                      help="Plan nur aus dem Zonen-Cache berechnen")
+    plan.set_defaults(func=cmd_plan)
+
+    apply = commands.add_parser("apply", help="Plan berechnen und anwenden")
+    apply.add_argument("records", help="JSON-Datei mit Zone → Einträgen ('-' für stdin)")
+    apply.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                       help="Anzahl Zonen, die parallel bearbeitet werden")
+    apply.add_argument("--journal", help="Journal-Datei (Standard: <datei>.journal.jsonl)")
+    apply.add_argument("--resume", action="store_true",
+                       help="Laut Journal erledigte Änderungen überspringen")
+    apply.set_defaults(func=cmd_apply)
+
+    listing = commands.add_parser("list", help="Einträge von Zonen auflisten")
+    listing.add_argument("zones", nargs="+", help="Zonen, z.B. baltic-ihub.com")
+    listing.add_argument("--refresh", action="store_true", help="Cache ignorieren")
+    listing.add_argument("--offline", action="store_true", help="Nur aus dem Zonen-Cache lesen")
+    listing.add_argument("--json", action="store_true", help="Ausgabe als JSON")
+    listing.set_defaults(func=cmd_list)
+
+    migrate = commands.add_parser("migrate", help="A/AAAA-Records atomar auf CNAME umstellen")
+    migrate.add_argument("records", help="JSON-Datei mit Zone → Einträgen ('-' für stdin)")
+    migrate.add_argument("--journal", help="Journal-Datei (Standard: <datei>.journal.jsonl)")
+    migrate.add_argument("--resume", action="store_true",
+                         help="Laut Journal umgestellte Namen überspringen")
+    migrate.set_defaults(func=cmd_migrate)
+
+    verify = commands.add_parser("verify", help="DNS-Propagation der Einträge prüfen")
+    verify.add_argument("records", help="JSON-Datei mit Zone → Einträgen ('-' für stdin)")
+    verify.add_argument("--resolver", action="append",
+                        help="Resolver als host oder host:port, mehrfach möglich "
+                             f"(Standard: {', '.join(DEFAULT_RESOLVERS)})")
+    verify.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="Höchstens so viele Sekunden warten")
+    verify.add_argument("--interval", type=float, default=DEFAULT_BASE_INTERVAL,
+                        help="Erste Pause zwischen zwei Abfragen, verdoppelt sich bis 60s")
+    verify.add_argument("--stub", action="store_true",
+                        help="Resolver im Speicher statt Netzwerk (Probelauf)")
+    verify.set_defaults(func=cmd_verify)
+
+    return parser
+
+
+def open_metrics(specs: List[str]) -> Optional[Metrics]:
+    """Metrics mit den angegebenen Sinks, None ohne --metrics"""
+    if not specs:
+        return None
+    try:
+        return Metrics([create_sink(spec) for spec in specs])
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.metrics = open_metrics(args.metrics)
+    try:
+        args.func(args)
+    finally:
+        if args.metrics is not None:
+            args.metrics.close()
+            if args.metrics.actions:
+                print("\n" + args.metrics.summary(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+All-Inkl KAS API Client
+
+Die Operationen (Einträge anlegen, ändern, löschen, Zone lesen) samt
+Zonen-Cache und Auswertung der Antworten stehen hier genau einmal. Wie die
+Aufrufe beim KAS ankommen, entscheidet der Transport (kas.transport):
+standardmäßig SOAP direkt mit gepoolter Keep-Alive HTTP-Session, alternativ
+über den MCP Hub oder im Speicher.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+from .auth import DEFAULT_SESSION_LIFETIME, KAS_AUTH_URL
+from .cache import ZoneCache
+from .metrics import CallEvent, Metrics
+from .parser import KasResponse
+from .retry import IDEMPOTENT, RetryPolicy, classify, is_already_exists  # noqa: F401 (Import für bestehende Aufrufer)
+from .scheduler import FloodScheduler
+# SOAP-Helfer liegen in kas.transport, Import hier für bestehende Aufrufer
+from .transport import (  # noqa: F401
+    DEFAULT_POOL_SIZE,
+    DEFAULT_TIMEOUT,
+    KAS_API_URL,
+    SOAP_HEADERS,
+    SoapTransport,
+    Transport,
+    create_session,
+    create_soap_request,
+)
+from .zone import Zone
+
+# Re-Exporte (is_already_exists, SOAP-Helfer) gehören für bestehende Aufrufer dazu
+__all__ = [
+    "DEFAULT_NAMESERVER",
+    "SOAP_HEADERS",
+    "KasClient",
+    "create_session",
+    "create_soap_request",
+    "is_already_exists",
+    "normalize_zone_host",
+]
+
+DEFAULT_NAMESERVER = "ns5.kasserver.com"
+
+
+def normalize_zone_host(zone_host: str) -> str:
+    """KAS erwartet den Zonennamen mit abschließendem Punkt"""
+    if not zone_host.endswith('.'):
+        zone_host += '.'
+    return zone_host
+
+
+class KasClient:
+    """Client für die All-Inkl KAS API
+
+    Ohne transport werden Aufrufe per SOAP direkt an die KAS API geschickt
+    (SoapTransport mit Session-Token und Flood-Delay, siehe dort); mit
+    transport=McpHubTransport(...) oder StubTransport(...) laufen dieselben
+    Operationen über den MCP Hub bzw. im Speicher. Gelesene Zonen landen im
+    ZoneCache (use_cache=False schaltet ihn ab), schreibende Aufrufe machen
+    den Cache der Zone ungültig. Mit metrics=Metrics(...) wird pro Aufruf
+    ein CallEvent gemeldet. Kann als Context-Manager verwendet werden.
+    """
+
+    def __init__(self, kas_user: Optional[str] = None, kas_password: Optional[str] = None,
+                 api_url: str = KAS_API_URL,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 use_session_token: bool = True,
+                 session_lifetime: int = DEFAULT_SESSION_LIFETIME,
+                 scheduler: Optional[FloodScheduler] = None,
+                 use_cache: bool = True,
+                 cache: Optional[ZoneCache] = None,
+                 transport: Optional[Transport] = None,
+                 auth_url: str = KAS_AUTH_URL,
+                 retry: Optional[RetryPolicy] = None,
+                 metrics: Optional[Metrics] = None):
+        if transport is None:
+            transport = SoapTransport(kas_user, kas_password, api_url=api_url,
+                                      pool_size=pool_size, timeout=timeout,
+                                      use_session_token=use_session_token,
+                                      session_lifetime=session_lifetime,
+                                      scheduler=scheduler, auth_url=auth_url)
+        self.transport = transport
+        self.retry = retry or RetryPolicy()
+        self.metrics = metrics
+        self.cache = None
+        if use_cache:
+            self.cache = cache or ZoneCache()
+
+    @property
+    def scheduler(self) -> FloodScheduler:
+        return self.transport.scheduler
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Schließe alle offenen Verbindungen"""
+        self.transport.close()
+
+    def call(self, action: str, params: Dict,
+             timeout: Optional[float] = None) -> Optional[KasResponse]:
+        """Rufe eine KAS-Aktion auf, gibt die geparste Antwort oder None zurück
+
+        Vorübergehende Fehler (Netzwerk, Flood Protection, Timeout) werden
+        nach der RetryPolicy wiederholt.
+        """
+        response, _ = self._call(action, params, timeout)
+        return response
+
+    def _call(self, action: str, params: Dict, timeout: Optional[float] = None,
+              zone_host: Optional[str] = None) -> tuple[Optional[KasResponse], int]:
+        """Wie call(), zusätzlich mit der Anzahl der Versuche"""
+        if self.metrics is None:
+            return self.retry.run(lambda: self.transport.call(action, params, timeout))
+
+        self.transport.take_io()
+        started = time.perf_counter()
+        response, attempts = self.retry.run(lambda: self.transport.call(action, params, timeout))
+        self._emit(action, zone_host or params.get("zone_host", ""),
+                   time.perf_counter() - started, [(response, attempts)])
+        return response, attempts
+
+    def _emit(self, action: str, zone_host: str, latency: float,
+              results: List[tuple[Optional[KasResponse], int]]):
+        """Melde einen Aufruf (oder Batch) an die Metrics"""
+        sent, received, flood_wait = self.transport.take_io()
+        response = results[-1][0]
+        outcomes = {classify(response) for response, _ in results}
+        self.metrics.emit(CallEvent(
+            transport=self.transport.name,
+            action=action,
+            zone=zone_host.rstrip("."),
+            latency=latency,
+            flood_wait=flood_wait,
+            flood_delay=response.flood_delay if response is not None else None,
+            bytes_sent=sent,
+            bytes_received=received,
+            retries=sum(attempts - 1 for _, attempts in results),
+            outcome=outcomes.pop() if len(outcomes) == 1 else "mixed",
+            calls=len(results),
+        ))
+
+    @staticmethod
+    def _result(response: Optional[KasResponse], success_message: str) -> tuple[bool, str]:
+        """Werte die Antwort eines schreibenden Aufrufs aus"""
+        if response is None:
+            return False, "API-Aufruf fehlgeschlagen"
+
+        if response.ok:
+            return True, success_message
+
+        if classify(response) == IDEMPOTENT:
+            return True, "Existiert bereits"
+
+        return False, response.summary()
+
+    def _write(self, action: str, params: Dict, success_message: str,
+               zone_host: Optional[str] = None) -> tuple[bool, str]:
+        """Führe einen schreibenden Aufruf aus und werte das Ergebnis aus"""
+        response, attempts = self._call(action, params, zone_host=zone_host)
+        success, message = self._result(response, success_message)
+        # Nach einem Timeout kann der erste Versuch trotzdem angekommen sein:
+        # ein dann fehlender Eintrag ist beim Löschen kein Fehler
+        if not success and attempts > 1 and action == "delete_dns_settings" \
+                and "not_found" in message:
+            return True, "Bereits gelöscht"
+        return success, message
+
+    def get_dns_settings(self, zone_host: str,
+                         nameserver: str = DEFAULT_NAMESERVER) -> Optional[KasResponse]:
+        """Hole alle DNS-Einträge einer Zone"""
+        return self.call("get_dns_settings", {
+            "zone_host": normalize_zone_host(zone_host),
+            "nameserver": nameserver
+        })
+
+    def get_dns_records(self, zone_host: str,
+                        nameserver: str = DEFAULT_NAMESERVER,
+                        max_age: Optional[float] = None) -> Optional[List[Dict]]:
+        """Hole alle DNS-Einträge einer Zone als Liste, None bei Fehlern
+
+        Liegt die Zone im Cache und ist jünger als max_age (Standard: TTL
+        des Caches), wird kein API-Aufruf gemacht. max_age=0 erzwingt das
+        Neuladen.
+        """
+        if self.cache is not None and max_age != 0:
+            records = self.cache.get(zone_host, nameserver, max_age)
+            if records is not None:
+                return records
+
+        response = self.get_dns_settings(zone_host, nameserver)
+        if response is None or not response.ok:
+            return None
+
+        records = response.records
+        if self.cache is not None:
+            self.cache.put(zone_host, nameserver, records)
+        return records
+
+    def get_zone(self, zone_host: str,
+                 nameserver: str = DEFAULT_NAMESERVER,
+                 max_age: Optional[float] = None) -> Optional[Zone]:
+        """Hole eine Zone als indiziertes Zone-Objekt, None bei Fehlern"""
+        records = self.get_dns_records(zone_host, nameserver, max_age)
+        if records is None:
+            return None
+        return Zone.from_records(zone_host, records)
+
+    def _invalidate(self, zone_host: Optional[str]):
+        """Verwirf den Cache nach einem schreibenden Aufruf
+
+        delete/update kennen nur die record_id; ohne zone_host wird deshalb
+        der ganze Cache verworfen.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(zone_host)
+
+    @staticmethod
+    def _add_params(zone_host: str, record_name: str, record_type: str,
+                    record_data: str, record_aux: str = "0") -> Dict:
+        return {
+            "zone_host": normalize_zone_host(zone_host),
+            "record_name": record_name,
+            "record_type": record_type,
+            "record_data": record_data,
+            "record_aux": record_aux
+        }
+
+    def add_dns_record(self, zone_host: str, record_name: str, record_type: str,
+                       record_data: str, record_aux: str = "0") -> tuple[bool, str]:
+        """Füge einen DNS-Eintrag hinzu"""
+        result = self._write("add_dns_settings", self._add_params(
+            zone_host, record_name, record_type, record_data, record_aux
+        ), "Erfolgreich hinzugefügt")
+        self._invalidate(zone_host)
+        return result
+
+    def add_dns_records(self, zone_host: str, records: List) -> List[tuple[bool, str]]:
+        """Füge mehrere DnsRecords einer Zone hinzu
+
+        Unterstützt der Transport Batches (MCP Hub), geht alles in einem
+        Request raus, sonst nacheinander.
+        """
+        self.transport.take_io()
+        started = time.perf_counter()
+        results = self.retry.run_many(self.transport.call_many, [
+            ("add_dns_settings", self._add_params(zone_host, record.name, record.type,
+                                                  record.data, record.aux))
+            for record in records
+        ])
+        if self.metrics is not None and results:
+            self._emit("add_dns_settings", zone_host, time.perf_counter() - started, results)
+        self._invalidate(zone_host)
+        return [self._result(response, "Erfolgreich hinzugefügt") for response, _ in results]
+
+    def delete_dns_record(self, record_id: str,
+                          zone_host: Optional[str] = None) -> tuple[bool, str]:
+        """Lösche einen DNS-Eintrag"""
+        result = self._write("delete_dns_settings", {
+            "record_id": str(record_id)
+        }, "Erfolgreich gelöscht", zone_host)
+        self._invalidate(zone_host)
+        return result
+
+    def update_dns_record(self, record_id: str, record_name: str, record_type: str,
+                          record_data: str, record_aux: str = "0",
+                          zone_host: Optional[str] = None) -> tuple[bool, str]:
+        """Ändere einen bestehenden DNS-Eintrag"""
+        result = self._write("update_dns_settings", {
+            "record_id": str(record_id),
+            "record_name": record_name,
+            "record_type": record_type,
+            "record_data": record_data,
+            "record_aux": record_aux
+        }, "Erfolgreich geändert", zone_host)
+        self._invalidate(zone_host)
+        return result
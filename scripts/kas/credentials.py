@@ -0,0 +1,404 @@
+"""
+KAS Credentials über eine feste Kette von Quellen
+
+Reihenfolge (die erste Quelle mit Login und Passwort gewinnt):
+
+1. env:        ALL_INKL_KAS_USER / ALL_INKL_KAS_PASSWORD
+2. env_file:   .env.local aus dem MCP HUB Projekt (KAS_ENV_FILE)
+3. agent:      lokaler Credential-Agent (Unix-Socket, siehe unten)
+4. 1password:  op item get (KAS_OP_ITEM / KAS_OP_VAULT) – dauert einige Sekunden
+5. mcp_hub:    MCP Hub (MCP_HUB_TOKEN)
+
+Jede Quelle wird pro Prozess höchstens einmal gefragt, das Ergebnis bleibt
+im Speicher. Mit KAS_CREDENTIAL_AGENT=1 (oder --agent) werden Credentials
+aus einer langsamen Quelle zusätzlich an einen kurzlebigen Agenten
+übergeben: ein Hintergrundprozess, der sie über einen Unix-Socket (nur für
+den eigenen Benutzer, Verzeichnis 0700, Socket 0600) ausliefert und sich
+nach KAS_AGENT_TTL Sekunden beendet. Folgeaufrufe sparen sich so den Weg
+über 1Password.
+
+Aufruf (aus scripts/):
+
+    python3 -m kas.credentials               # Quelle und Login anzeigen
+    python3 -m kas.credentials --agent       # Agent starten (Standard 15 Minuten)
+    python3 -m kas.credentials --stop        # Agent beenden
+"""
+
+import argparse
+import json
+import os
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, List, Optional
+
+# .env.local aus dem MCP HUB Projekt
+ENV_FILE = os.getenv("KAS_ENV_FILE", "/Users/rthode/Projects/13 MCP HUB/.env.local")
+
+# 1Password-Eintrag mit den KAS-Zugangsdaten
+OP_ITEM = os.getenv("KAS_OP_ITEM", "All-Inkl KAS (w014c572)")
+OP_VAULT = os.getenv("KAS_OP_VAULT", "Automation")
+OP_TIMEOUT = 30
+
+AGENT_SOCKET = os.getenv("KAS_AGENT_SOCKET", os.path.join(
+    os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+    f"kas-agent-{os.getuid() if hasattr(os, 'getuid') else 0}", "agent.sock"))
+AGENT_TTL = float(os.getenv("KAS_AGENT_TTL", "900"))
+
+# Quellen, nach denen sich ein Agent lohnt
+SLOW_SOURCES = ("1password", "mcp_hub")
+
+Credentials = tuple[Optional[str], Optional[str]]
+
+
+def clean_value(value: str) -> str:
+    """Entferne Anführungszeichen, String-Literale wie \\n und echte Newlines"""
+    value = value.strip(' "\'')
+    value = value.replace('\\n', '').replace('\\r', '').replace('\\t', '')
+    value = value.replace('\n', '').replace('\r', '').replace('\t', '')
+    return value.strip()
+
+
+def read_env_file(path: str = ENV_FILE) -> dict:
+    """Lies KEY=VALUE Zeilen aus einer .env Datei"""
+    values = {}
+    if not os.path.exists(path):
+        return values
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if "=" not in line or line.lstrip().startswith("#"):
+                continue
+            key, value = line.split("=", 1)
+            values[key.strip()] = value.rstrip('\n\r')
+    return values
+
+
+def _pair(kas_user: Optional[str], kas_password: Optional[str]) -> Credentials:
+    """Bereinigtes Paar oder (None, None), wenn etwas fehlt"""
+    kas_user = clean_value(kas_user or "")
+    kas_password = clean_value(kas_password or "")
+    if not kas_user or not kas_password:
+        return None, None
+    return kas_user, kas_password
+
+
+def from_env() -> Credentials:
+    """Credentials aus Environment Variables"""
+    return _pair(os.getenv("ALL_INKL_KAS_USER"), os.getenv("ALL_INKL_KAS_PASSWORD"))
+
+
+def from_env_file(path: str = ENV_FILE) -> Credentials:
+    """Credentials aus einer .env Datei"""
+    values = read_env_file(path)
+    return _pair(values.get("ALL_INKL_KAS_USER"), values.get("ALL_INKL_KAS_PASSWORD"))
+
+
+def from_1password(item: str = OP_ITEM, vault: str = OP_VAULT) -> Credentials:
+    """Credentials aus 1Password (op CLI, muss angemeldet sein)"""
+    try:
+        result = subprocess.run(
+            ['op', 'item', 'get', item, '--vault', vault, '--format', 'json'],
+            capture_output=True, text=True, check=True, timeout=OP_TIMEOUT
+        )
+        item_data = json.loads(result.stdout)
+    except FileNotFoundError:
+        return None, None  # op nicht installiert
+    except (subprocess.SubprocessError, ValueError) as e:
+        print(f"⚠️  Fehler beim Lesen aus 1Password: {e}")
+        return None, None
+
+    username = password = None
+    for field in item_data.get('fields', []):
+        if field.get('label') == 'username' or field.get('id') == 'username':
+            username = field.get('value')
+        elif field.get('label') == 'password' or field.get('id') == 'password':
+            password = field.get('value')
+    return _pair(username, password)
+
+
+def from_mcp_hub() -> Credentials:
+    """MCP Hub als letzte Quelle
+
+    Der Hub gibt die KAS-Zugangsdaten nicht heraus, er führt die Aufrufe
+    selbst aus. Mit MCP_HUB_TOKEN daher --transport mcp verwenden.
+    """
+    if os.getenv("MCP_HUB_TOKEN"):
+        print("⚠️  MCP Hub liefert keine KAS-Credentials – mit MCP_HUB_TOKEN --transport mcp verwenden")
+    return None, None
+
+
+def _owned(path: str, kind: Callable[[int], bool]) -> bool:
+    """path ist vom Typ kind (lstat, Symlinks zählen nicht) und gehört dem eigenen Benutzer"""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return kind(info.st_mode) and (not hasattr(os, "getuid") or info.st_uid == os.getuid())
+
+
+def _private_dir(directory: str) -> bool:
+    """Agent-Verzeichnis mit 0700 anlegen; ein fremdes (z.B. in /tmp untergeschoben) ablehnen"""
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        print(f"❌ Agent-Verzeichnis nicht anlegbar: {e}")
+        return False
+    if not _owned(directory, stat.S_ISDIR):
+        print(f"❌ Agent-Verzeichnis gehört nicht dem eigenen Benutzer: {directory}")
+        return False
+    if os.lstat(directory).st_mode & 0o077:
+        os.chmod(directory, 0o700)
+    return True
+
+
+def _agent_socket_ok(path: str) -> bool:
+    """Socket und Verzeichnis gehören dem eigenen Benutzer (sonst gehen keine Secrets darüber)"""
+    return (_owned(os.path.dirname(path) or ".", stat.S_ISDIR)
+            and _owned(path, stat.S_ISSOCK))
+
+
+def _agent_request(command: str, path: str = AGENT_SOCKET, timeout: float = 1.0) -> Optional[bytes]:
+    """Schicke ein Kommando an den Agenten, None wenn keiner läuft (oder der Socket fremd ist)"""
+    if not hasattr(socket, "AF_UNIX") or not _agent_socket_ok(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(command.encode("ascii") + b"\n")
+            chunks = []
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return b"".join(chunks)
+    except OSError:
+        return None
+
+
+def from_agent(path: str = AGENT_SOCKET) -> Credentials:
+    """Credentials vom laufenden Agenten"""
+    data = _agent_request("GET", path)
+    if not data:
+        return None, None
+    try:
+        values = json.loads(data)
+    except ValueError:
+        return None, None
+    return _pair(values.get("kas_user"), values.get("kas_password"))
+
+
+def _same_user(conn: socket.socket) -> bool:
+    """Nur Verbindungen des eigenen Benutzers (Linux: SO_PEERCRED, sonst Verzeichnisrechte)"""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
+
+def serve_agent(kas_user: str, kas_password: str,
+                path: str = AGENT_SOCKET, ttl: float = AGENT_TTL):
+    """Liefere die Credentials über den Socket aus, bis ttl abgelaufen ist"""
+    import fcntl
+
+    if not _private_dir(os.path.dirname(path) or "."):
+        return
+
+    # Lock-Datei: es läuft höchstens ein Agent pro Socket
+    lock = open(path + ".lock", 'w')
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return
+
+    if os.path.exists(path):
+        os.unlink(path)
+    payload = json.dumps({"kas_user": kas_user, "kas_password": kas_password}).encode("utf-8")
+    deadline = time.monotonic() + ttl
+    old_umask = os.umask(0o177)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(path)
+            os.umask(old_umask)
+            server.listen()
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                server.settimeout(remaining)
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    break
+                with conn:
+                    if not _same_user(conn):
+                        continue
+                    conn.settimeout(1.0)
+                    try:
+                        command = conn.recv(16).strip()
+                        if command == b"STOP":
+                            break
+                        if command == b"GET":
+                            conn.sendall(payload)
+                    except OSError:
+                        continue
+    finally:
+        os.umask(old_umask)
+        if os.path.exists(path):
+            os.unlink(path)
+        lock.close()
+
+
+def start_agent(kas_user: str, kas_password: str,
+                path: str = AGENT_SOCKET, ttl: float = AGENT_TTL) -> bool:
+    """Starte den Agenten im Hintergrund; Credentials gehen über stdin, nicht argv"""
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    scripts_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "kas.credentials", "--serve", "--socket", path, "--ttl", str(ttl)],
+        cwd=scripts_dir, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL, start_new_session=True
+    )
+    process.stdin.write(json.dumps({"kas_user": kas_user,
+                                    "kas_password": kas_password}).encode("utf-8"))
+    process.stdin.close()
+    # Warten, bis der Socket da ist, damit der nächste Aufruf ihn findet
+    for _ in range(50):
+        if os.path.exists(path):
+            return True
+        if process.poll() is not None:
+            return False
+        time.sleep(0.02)
+    return False
+
+
+def stop_agent(path: str = AGENT_SOCKET) -> bool:
+    """Beende einen laufenden Agenten"""
+    return _agent_request("STOP", path) is not None
+
+
+def _agent_enabled() -> bool:
+    return os.getenv("KAS_CREDENTIAL_AGENT", "").lower() in ("1", "true", "yes")
+
+
+class CredentialResolver:
+    """Fragt die Quellen der Reihe nach, einmal pro Prozess
+
+    backends: [(name, funktion)], jede Funktion gibt (user, passwort) oder
+    (None, None) zurück. Das Ergebnis (auch ein Fehlschlag) wird gemerkt;
+    source nennt die Quelle, die geliefert hat.
+    """
+
+    def __init__(self, backends: List[tuple[str, Callable[[], Credentials]]],
+                 use_agent: Optional[bool] = None, agent_socket: str = AGENT_SOCKET):
+        self.backends = backends
+        self.use_agent = _agent_enabled() if use_agent is None else use_agent
+        self.agent_socket = agent_socket
+        self.source: Optional[str] = None
+        self._result: Optional[Credentials] = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Credentials:
+        with self._lock:
+            if self._result is None:
+                self._result = self._resolve()
+            return self._result
+
+    def _resolve(self) -> Credentials:
+        for name, backend in self.backends:
+            kas_user, kas_password = backend()
+            if kas_user and kas_password:
+                self.source = name
+                if self.use_agent and name in SLOW_SOURCES:
+                    start_agent(kas_user, kas_password, self.agent_socket)
+                return kas_user, kas_password
+        return None, None
+
+    def reset(self):
+        """Vergiss das Ergebnis (z.B. nach geänderten Zugangsdaten)"""
+        with self._lock:
+            self._result = None
+            self.source = None
+
+
+def default_backends(env_file: str = ENV_FILE,
+                     agent_socket: str = AGENT_SOCKET) -> List[tuple[str, Callable[[], Credentials]]]:
+    """Die Quellen in fester Reihenfolge"""
+    return [
+        ("env", from_env),
+        ("env_file", lambda: from_env_file(env_file)),
+        ("agent", lambda: from_agent(agent_socket)),
+        ("1password", from_1password),
+        ("mcp_hub", from_mcp_hub),
+    ]
+
+
+_resolvers: dict = {}
+_resolvers_lock = threading.Lock()
+
+
+def get_resolver(env_file: str = ENV_FILE) -> CredentialResolver:
+    """Prozessweiter Resolver (einer pro env_file)"""
+    with _resolvers_lock:
+        if env_file not in _resolvers:
+            _resolvers[env_file] = CredentialResolver(default_backends(env_file))
+        return _resolvers[env_file]
+
+
+def get_credentials(env_file: str = ENV_FILE) -> Credentials:
+    """Hole Credentials aus der ersten Quelle, die welche hat (einmal pro Prozess)"""
+    return get_resolver(env_file).resolve()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="KAS Credentials auflösen und zwischenspeichern")
+    parser.add_argument("--agent", action="store_true",
+                        help="Credentials an einen kurzlebigen lokalen Agenten übergeben")
+    parser.add_argument("--stop", action="store_true", help="Laufenden Agenten beenden")
+    parser.add_argument("--ttl", type=float, default=AGENT_TTL, help="Lebensdauer des Agenten in Sekunden")
+    parser.add_argument("--socket", default=AGENT_SOCKET, help="Pfad des Agent-Sockets")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        values = json.loads(sys.stdin.read() or "{}")
+        serve_agent(values.get("kas_user", ""), values.get("kas_password", ""),
+                    args.socket, args.ttl)
+        return
+
+    if args.stop:
+        print("✅ Agent beendet" if stop_agent(args.socket) else "⚠️  Kein Agent aktiv")
+        return
+
+    started = time.perf_counter()
+    resolver = CredentialResolver(default_backends(agent_socket=args.socket), use_agent=False,
+                                  agent_socket=args.socket)
+    kas_user, kas_password = resolver.resolve()
+    if not kas_user:
+        print("❌ Credentials nicht gefunden!")
+        sys.exit(1)
+    print(f"✅ {kas_user} aus {resolver.source} ({time.perf_counter() - started:.2f}s)")
+
+    if args.agent:
+        if resolver.source == "agent":
+            print("ℹ️  Agent läuft bereits")
+        elif start_agent(kas_user, kas_password, args.socket, args.ttl):
+            print(f"🔐 Agent läuft für {args.ttl:.0f}s: {args.socket}")
+        else:
+            print("❌ Agent konnte nicht gestartet werden")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Parallele Ausführung von DNS-Operationen über mehrere Zonen
+
+Operationen werden pro Zone in eine Warteschlange gestellt. Jede Zone läuft
+in einem eigenen Worker-Thread strikt der Reihe nach (Löschen vor Anlegen
+bleibt erhalten), verschiedene Zonen laufen parallel.
+
+Das Flood-Limit gilt pro KAS-Account: alle Zonen eines Accounts teilen sich
+einen KasClient und damit dessen FloodScheduler, der die eigentlichen
+API-Aufrufe serialisiert. Zonen unterschiedlicher Accounts (z.B. Domains
+verschiedener Verkäufer) und alles außerhalb der API-Aufrufe – Cache,
+Planung, Parsing – laufen echt parallel.
+"""
+
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class ZoneResult:
+    """Ergebnisse und Laufzeiten aller Operationen einer Zone"""
+
+    def __init__(self, zone_host: str):
+        self.zone_host = zone_host
+        self.results: List[Any] = []
+        self.latencies: List[float] = []
+        self.error: Optional[BaseException] = None
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    @property
+    def duration(self) -> float:
+        """Gesamtdauer der Zone in Sekunden"""
+        return self.finished_at - self.started_at
+
+    @property
+    def mean_latency(self) -> float:
+        """Mittlere Dauer einer Operation"""
+        if not self.latencies:
+            return 0.0
+        return sum(self.latencies) / len(self.latencies)
+
+
+class ExecutionReport:
+    """Ergebnis eines Laufs über alle Zonen"""
+
+    def __init__(self, zones: Dict[str, ZoneResult], wall_time: float):
+        self.zones = zones
+        self.wall_time = wall_time
+
+    @property
+    def operations(self) -> int:
+        return sum(len(zone.latencies) for zone in self.zones.values())
+
+    @property
+    def serial_time(self) -> float:
+        """Summe der Zonen-Laufzeiten (so lange hätte ein serieller Lauf gedauert)"""
+        return sum(zone.duration for zone in self.zones.values())
+
+    def summary(self) -> str:
+        """Mehrzeilige Zusammenfassung mit Latenz pro Zone"""
+        lines = [f"{self.operations} Operation(en) in {len(self.zones)} Zone(n): "
+                 f"{self.wall_time:.1f}s Wall-Clock (seriell {self.serial_time:.1f}s)"]
+        for zone in self.zones.values():
+            status = f" ❌ {zone.error}" if zone.error else ""
+            lines.append(f"  {zone.zone_host}: {len(zone.latencies)} Op(s) in {zone.duration:.1f}s, "
+                         f"Ø {zone.mean_latency:.2f}s/Op{status}")
+        return "\n".join(lines)
+
+
+class ZoneExecutor:
+    """Führt Operationen pro Zone seriell und zonenübergreifend parallel aus"""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_workers = max_workers
+        self._clock = clock
+        self._queues: "OrderedDict[str, List[tuple]]" = OrderedDict()
+
+    def submit(self, zone_host: str, func: Callable, *args, **kwargs):
+        """Stelle eine Operation für eine Zone in die Warteschlange"""
+        self._queues.setdefault(zone_host, []).append((func, args, kwargs))
+
+    def _run_zone(self, zone_host: str, operations: List[tuple]) -> ZoneResult:
+        result = ZoneResult(zone_host)
+        result.started_at = self._clock()
+        try:
+            for func, args, kwargs in operations:
+                started = self._clock()
+                result.results.append(func(*args, **kwargs))
+                result.latencies.append(self._clock() - started)
+        except Exception as e:
+            # Eine fehlerhafte Zone bricht nur ihre eigene Reihenfolge ab
+            result.error = e
+        result.finished_at = self._clock()
+        return result
+
+    def run(self) -> ExecutionReport:
+        """Arbeite alle Warteschlangen ab und leere sie"""
+        queues, self._queues = self._queues, OrderedDict()
+        started = self._clock()
+
+        if not queues:
+            return ExecutionReport({}, 0.0)
+
+        workers = max(1, min(self.max_workers, len(queues)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kas-zone") as pool:
+            futures = OrderedDict(
+                (zone_host, pool.submit(self._run_zone, zone_host, operations))
+                for zone_host, operations in queues.items()
+            )
+            zones = OrderedDict((zone_host, future.result()) for zone_host, future in futures.items())
+
+        return ExecutionReport(zones, self._clock() - started)
@@ -0,0 +1,296 @@
+"""
+Lokaler Ersatz für die KAS SOAP API (Tests und Lastmessungen ohne Netzwerk)
+
+Beantwortet KasAuth.php (Session-Token) und KasApi.php mit den Aktionen
+get_dns_settings, add_dns_settings, delete_dns_settings und
+update_dns_settings. Die Zonen liegen im Speicher (StubTransport), die
+Antworten sind SOAP-Encoding wie bei kasapi.kasserver.com – der KasClient
+merkt keinen Unterschied.
+
+Emuliert werden:
+
+- latency:      feste Antwortzeit pro Request in Sekunden
+- flood_delay:  wird als KasFloodDelay gemeldet; kommt der nächste Request
+                desselben Logins zu früh, antwortet der Server mit dem
+                Fault "flood_protection" (wie KAS)
+
+Aufruf (aus scripts/):
+
+    python3 -m kas.fakeserver --port 8765 --latency 0.05 --flood-delay 0.5 \\
+        --zones zones_seed.json
+
+    export KAS_API_URL=http://127.0.0.1:8765/soap/KasApi.php
+    export KAS_AUTH_URL=http://127.0.0.1:8765/soap/KasAuth.php
+    export ALL_INKL_KAS_USER=test ALL_INKL_KAS_PASSWORD=test
+    python3 -m kas list baltic-ihub.com
+
+Aus Python (z.B. für Benchmarks) läuft der Server im Hintergrund-Thread:
+
+    with FakeKasServer(flood_delay=0.1) as server:
+        client = KasClient("test", "test", api_url=server.api_url,
+                           auth_url=server.auth_url, use_cache=False)
+"""
+
+import argparse
+import json
+import secrets
+import threading
+import time
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+from xml.sax.saxutils import escape
+
+from .parser import KasResponse
+from .transport import StubTransport
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+SOAP_NAMESPACES = (
+    'xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/" '
+    'xmlns:ns1="https://kasserver.com/" '
+    'xmlns:xsd="http://www.w3.org/2001/XMLSchema" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xmlns:ns2="http://xml.apache.org/xml-soap" '
+    'xmlns:SOAP-ENC="http://schemas.xmlsoap.org/soap/encoding/" '
+    'SOAP-ENV:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/"'
+)
+
+
+def encode_value(value: Any, tag: str = "value") -> str:
+    """Kodiere einen Python-Wert im SOAP-Encoding von KAS (Gegenstück zu parse_response)"""
+    if value is None:
+        return f'<{tag} xsi:nil="true"/>'
+    if isinstance(value, bool):
+        return f'<{tag} xsi:type="xsd:boolean">{"true" if value else "false"}</{tag}>'
+    if isinstance(value, int):
+        return f'<{tag} xsi:type="xsd:int">{value}</{tag}>'
+    if isinstance(value, float):
+        return f'<{tag} xsi:type="xsd:float">{value}</{tag}>'
+    if isinstance(value, dict):
+        items = "".join(f'<item><key xsi:type="xsd:string">{escape(str(key))}</key>'
+                        f'{encode_value(item)}</item>' for key, item in value.items())
+        return f'<{tag} xsi:type="ns2:Map">{items}</{tag}>'
+    if isinstance(value, (list, tuple)):
+        items = "".join(encode_value(item, "item") for item in value)
+        return (f'<{tag} SOAP-ENC:arrayType="xsd:anyType[{len(value)}]" '
+                f'xsi:type="SOAP-ENC:Array">{items}</{tag}>')
+    return f'<{tag} xsi:type="xsd:string">{escape(str(value))}</{tag}>'
+
+
+def create_soap_response(method: str, value: Any) -> str:
+    """Komplette SOAP-Antwort mit <return> für KasApi bzw. KasAuth"""
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<SOAP-ENV:Envelope {SOAP_NAMESPACES}><SOAP-ENV:Body>'
+            f'<ns1:{method}Response>{encode_value(value, "return")}</ns1:{method}Response>'
+            f'</SOAP-ENV:Body></SOAP-ENV:Envelope>')
+
+
+def create_soap_fault(fault_string: str, fault_code: str = "SOAP-ENV:Server") -> str:
+    """SOAP-Fault wie von KAS (wird mit HTTP 500 ausgeliefert)"""
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<SOAP-ENV:Envelope {SOAP_NAMESPACES}><SOAP-ENV:Body><SOAP-ENV:Fault>'
+            f'<faultcode>{escape(fault_code)}</faultcode>'
+            f'<faultstring>{escape(fault_string)}</faultstring>'
+            f'</SOAP-ENV:Fault></SOAP-ENV:Body></SOAP-ENV:Envelope>')
+
+
+def extract_params(body: bytes) -> Optional[Dict]:
+    """Lies das JSON aus <Params> eines KasApi/KasAuth-Requests"""
+    try:
+        root = ET.fromstring(body)
+    except ET.ParseError:
+        return None
+    for elem in root.iter():
+        if elem.tag.rpartition("}")[2] == "Params":
+            try:
+                params = json.loads(elem.text or "")
+            except ValueError:
+                return None
+            return params if isinstance(params, dict) else None
+    return None
+
+
+class FakeKas:
+    """Zustand des Fake-Servers: Zonen, Session-Tokens, Flood-Zeitpunkte"""
+
+    def __init__(self, zones: Optional[Dict[str, List[Dict]]] = None,
+                 latency: float = 0.0, flood_delay: float = 0.0,
+                 credentials: Optional[Dict[str, str]] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.store = StubTransport(zones, flood_delay=flood_delay)
+        self.latency = latency
+        self.flood_delay = flood_delay
+        # Ohne credentials wird jeder Login akzeptiert
+        self.credentials = credentials
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens: Dict[str, str] = {}
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.flood_faults = 0
+
+    def _check_login(self, login: str, password: str) -> bool:
+        return self.credentials is None or self.credentials.get(login) == password
+
+    def auth(self, params: Dict) -> tuple[int, str]:
+        """KasAuth: gib ein Session-Token zurück"""
+        login = params.get("kas_login", "")
+        if not self._check_login(login, params.get("kas_auth_data", "")):
+            return 500, create_soap_fault("kas_password_incorrect")
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._tokens[token] = login
+        return 200, create_soap_response("KasAuth", token)
+
+    def api(self, params: Dict) -> tuple[int, str]:
+        """KasApi: prüfe Anmeldung und Flood-Delay, führe die Aktion aus"""
+        login = params.get("kas_login", "")
+        auth_type = params.get("kas_auth_type", "plain")
+        auth_data = params.get("kas_auth_data", "")
+
+        if auth_type == "session":
+            with self._lock:
+                valid = self._tokens.get(auth_data) == login
+            if not valid:
+                return 500, create_soap_fault("kas_session_invalid")
+        elif not self._check_login(login, auth_data):
+            return 500, create_soap_fault("kas_password_incorrect")
+
+        with self._lock:
+            now = self._clock()
+            if now < self._next_allowed.get(login, 0.0):
+                self.flood_faults += 1
+                return 500, create_soap_fault("flood_protection")
+            self._next_allowed[login] = now + self.flood_delay
+
+        action = params.get("kas_action", "")
+        response = self.store.handle(action, params.get("KasRequestParams") or {})
+        return self._encode(action, response)
+
+    def _encode(self, action: str, response: KasResponse) -> tuple[int, str]:
+        if response.fault_string is not None:
+            return 500, create_soap_fault(response.fault_string, response.fault_code or "SOAP-ENV:Server")
+        return 200, create_soap_response("KasApi", {
+            "Request": {"KasRequestTime": int(time.time()), "KasRequestType": action},
+            "Response": response.value["Response"]
+        })
+
+    def dispatch(self, path: str, body: bytes) -> tuple[int, str]:
+        """Beantworte einen POST auf KasAuth.php oder KasApi.php"""
+        with self._lock:
+            self.requests += 1
+        if self.latency > 0:
+            self._sleep(self.latency)
+
+        params = extract_params(body)
+        if params is None:
+            return 500, create_soap_fault("Bad Request", "SOAP-ENV:Client")
+        if path.endswith("KasAuth.php"):
+            return self.auth(params)
+        if path.endswith("KasApi.php"):
+            return self.api(params)
+        return 404, create_soap_fault(f"Unbekannter Endpoint: {path}", "SOAP-ENV:Client")
+
+
+def _make_handler(fake: FakeKas):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Keep-Alive: ohne TCP_NODELAY kosten Nagle + Delayed ACK ~40 ms pro Request
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            status, body = fake.dispatch(self.path, self.rfile.read(length))
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            # Kein Log pro Request, das verfälscht Lastmessungen
+            pass
+
+    return Handler
+
+
+class FakeKasServer:
+    """HTTP-Server um FakeKas, als Context-Manager im Hintergrund-Thread"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = 0, **fake_options):
+        self.fake = FakeKas(**fake_options)
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self.fake))
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/soap"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/KasApi.php"
+
+    @property
+    def auth_url(self) -> str:
+        return f"{self.base_url}/KasAuth.php"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever,
+                                        name="fake-kas", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lokaler Fake-Server für die KAS SOAP API")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Antwortzeit pro Request in Sekunden")
+    parser.add_argument("--flood-delay", type=float, default=0.0,
+                        help="KasFloodDelay in Sekunden (zu frühe Requests → flood_protection)")
+    parser.add_argument("--zones", help="JSON-Datei mit Zone → Einträgen als Anfangszustand")
+    args = parser.parse_args(argv)
+
+    zones = {}
+    if args.zones:
+        with open(args.zones, 'r', encoding='utf-8') as f:
+            zones = json.load(f)
+
+    server = FakeKasServer(args.host, args.port, zones=zones,
+                           latency=args.latency, flood_delay=args.flood_delay)
+    print(f"🧪 Fake-KAS läuft auf {server.base_url}")
+    print(f"   export KAS_API_URL={server.api_url}")
+    print(f"   export KAS_AUTH_URL={server.auth_url}")
+    print(f"   Zonen: {', '.join(server.fake.store.zones) or '-'} | "
+          f"Latenz {args.latency}s | Flood-Delay {args.flood_delay}s")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"\n📊 {server.fake.requests} Requests, {server.fake.flood_faults}x flood_protection")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Append-only Journal für DNS-Läufe (JSON Lines)
+
+Vor dem Anwenden wird jede geplante Operation mit einem stabilen Schlüssel
+als "planned" eingetragen, nach der Ausführung als "done" oder "failed".
+Eine Zeile pro Ereignis, jede Zeile wird sofort geschrieben – bricht ein
+Lauf ab, steht im Journal genau, was schon durch ist.
+
+Jeder Lauf beginnt mit "run_started" und endet mit "run_finished" (samt
+success). Mit --resume werden nur Operationen übersprungen, die seit dem
+letzten erfolgreich beendeten Lauf "done" sind – also aus dem abgebrochenen
+oder fehlgeschlagenen Lauf (und dessen Fortsetzungen). Ältere Einträge
+bleiben zum Nachlesen stehen, zählen aber nicht mehr.
+
+    {"ts": "2026-01-13T10:00:00+00:00", "event": "done", "key": "add:baltic-ihub.com:...",
+     "run": "3f2a9c1e", "message": "Erfolgreich hinzugefügt"}
+"""
+
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Set
+
+PLANNED = "planned"
+DONE = "done"
+FAILED = "failed"
+RUN_STARTED = "run_started"
+RUN_FINISHED = "run_finished"
+
+
+def default_journal_path(records_path: str) -> str:
+    """Journal neben der Eingabedatei (dns_zones.json → dns_zones.journal.jsonl)"""
+    base, _ = os.path.splitext(records_path)
+    return f"{base}.journal.jsonl"
+
+
+class Journal:
+    """JSONL-Datei mit einem Ereignis pro Zeile, threadsicher"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.run_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def entries(self) -> Iterable[Dict]:
+        """Alle lesbaren Einträge; eine halb geschriebene letzte Zeile wird ignoriert"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and "key" in entry:
+                    yield entry
+
+    def status(self) -> Dict[str, str]:
+        """Letztes Ereignis pro Schlüssel (ohne Lauf-Marker)"""
+        return {entry["key"]: entry.get("event", "") for entry in self.entries()
+                if entry.get("event") not in (RUN_STARTED, RUN_FINISHED)}
+
+    def completed(self) -> Set[str]:
+        """Bestätigte Operationen seit dem letzten erfolgreich beendeten Lauf"""
+        done: Set[str] = set()
+        for entry in self.entries():
+            event = entry.get("event")
+            if event == RUN_FINISHED:
+                if entry.get("success"):
+                    done.clear()
+            elif event == DONE:
+                done.add(entry["key"])
+            elif event != RUN_STARTED:
+                done.discard(entry["key"])
+        return done
+
+    def start_run(self) -> str:
+        """Beginne einen neuen Lauf; folgende Ereignisse tragen seine ID"""
+        self.run_id = uuid.uuid4().hex[:8]
+        self.record(RUN_STARTED, f"run:{self.run_id}")
+        return self.run_id
+
+    def finish_run(self, success: bool):
+        """Beende den Lauf; nach Erfolg zählen seine Einträge nicht mehr für --resume"""
+        if self.run_id is not None:
+            self.record(RUN_FINISHED, f"run:{self.run_id}", success=success)
+            self.run_id = None
+
+    def record(self, event: str, key: str, **details):
+        """Hänge ein Ereignis an und schreibe es sofort auf die Platte"""
+        entry = {"ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                 "event": event, "key": key}
+        if self.run_id is not None:
+            entry["run"] = self.run_id
+        entry.update(details)
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+                f.flush()
@@ -0,0 +1,209 @@
+"""
+Client für den MCP Hub (JSON-RPC 2.0 über HTTP)
+
+Mehrere tools/call-Aufrufe werden als JSON-RPC-Batch (Array von Requests)
+in einem einzigen POST verschickt. Jeder Request bekommt eine eindeutige id,
+die Antworten werden über diese id wieder ihrem Aufruf zugeordnet – die
+Reihenfolge im Antwort-Array spielt keine Rolle. Statt N Round-Trips (und
+ggf. N Cold-Starts der Serverless-Funktion) gibt es damit nur einen.
+
+McpHubTransport macht den Hub zu einem Transport des KasClient.
+"""
+
+import itertools
+import json
+import threading
+from typing import Dict, List, Optional
+
+import requests
+
+from .parser import KasResponse
+from .scheduler import FloodScheduler
+from .transport import Transport, create_session
+
+# MCP Hub URL
+MCP_HUB_URL = "https://mcp-hub-lemon.vercel.app/mcp"
+
+DEFAULT_TIMEOUT = 30
+
+# KAS-Aktion → Tool im MCP Hub
+MCP_TOOLS = {
+    "add_dns_settings": "allinkl.add_dns_record",
+    "delete_dns_settings": "allinkl.delete_dns_record",
+    "update_dns_settings": "allinkl.update_dns_record",
+    "get_dns_settings": "allinkl.get_dns_settings",
+}
+
+
+def create_tool_call(request_id: int, tool_name: str, args: Dict) -> Dict:
+    """Erstelle einen JSON-RPC Request für tools/call"""
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {
+            "name": tool_name,
+            "arguments": args
+        }
+    }
+
+
+class McpHubClient:
+    """JSON-RPC Client für den MCP Hub mit Batch-Unterstützung
+
+    Kann als Context Manager verwendet werden, dann wird die Session am
+    Ende geschlossen.
+    """
+
+    def __init__(self, token: str, hub_url: str = MCP_HUB_URL,
+                 session: Optional[requests.Session] = None,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.hub_url = hub_url
+        self.timeout = timeout
+        self.session = session or create_session()
+        self._owns_session = session is None
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {token}"
+        }
+        self._ids = itertools.count(1)
+        self._ids_lock = threading.Lock()
+        # Anzahl HTTP-Requests und Bytes (für Zusammenfassung und Metrics)
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._owns_session:
+            self.session.close()
+
+    def _next_id(self) -> int:
+        with self._ids_lock:
+            return next(self._ids)
+
+    def _post(self, payload) -> Optional[object]:
+        """Sende einen Request oder Batch, None bei Fehlern"""
+        self.requests += 1
+        data = json.dumps(payload).encode("utf-8")
+        self.bytes_sent += len(data)
+        try:
+            response = self.session.post(
+                self.hub_url,
+                data=data,
+                headers=self._headers,
+                timeout=self.timeout
+            )
+            self.bytes_received += len(response.content)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Fehler beim MCP Hub Aufruf: {e}")
+            if getattr(e, 'response', None) is not None:
+                print(f"   Response: {e.response.text[:200]}")
+            return None
+        except ValueError as e:
+            print(f"❌ Ungültige Antwort vom MCP Hub: {e}")
+            return None
+
+    def call_tool(self, tool_name: str, args: Dict) -> Optional[Dict]:
+        """Rufe ein einzelnes Tool auf"""
+        result = self._post(create_tool_call(self._next_id(), tool_name, args))
+        return result if isinstance(result, dict) else None
+
+    def call_tools(self, calls: List[tuple]) -> List[Optional[Dict]]:
+        """Rufe mehrere Tools in einem Batch-Request auf
+
+        calls ist eine Liste von (tool_name, args). Das Ergebnis hat dieselbe
+        Reihenfolge; fehlt die Antwort zu einer id, steht dort None.
+        """
+        if not calls:
+            return []
+
+        batch = [create_tool_call(self._next_id(), tool_name, args) for tool_name, args in calls]
+        result = self._post(batch)
+
+        if isinstance(result, dict):
+            # Hub ohne Batch-Unterstützung antwortet mit einem einzelnen Fehler
+            print("⚠️  MCP Hub unterstützt keine Batches, sende einzeln")
+            return [self.call_tool(tool_name, args) for tool_name, args in calls]
+        if not isinstance(result, list):
+            return [None] * len(batch)
+
+        by_id = {item.get("id"): item for item in result if isinstance(item, dict)}
+        return [by_id.get(request["id"]) for request in batch]
+
+
+def mcp_to_kas_response(result: Optional[Dict]) -> Optional[KasResponse]:
+    """Übersetze die JSON-RPC Antwort eines allinkl.*-Tools in eine KasResponse
+
+    Fehler werden zum Fault; bei Erfolg liegt das Tool-Ergebnis ("data",
+    bei get_dns_settings die Liste der Einträge) in ReturnInfo.
+    """
+    if result is None:
+        return None
+
+    if "error" in result:
+        error = result.get("error") or {}
+        return KasResponse(fault_code=str(error.get("code", "mcp_error")),
+                           fault_string=error.get("message", "Unbekannter Fehler"))
+
+    result_data = result.get("result")
+    if isinstance(result_data, dict) and result_data.get("success"):
+        return KasResponse({"Response": {
+            "ReturnString": "TRUE",
+            "ReturnInfo": result_data.get("data", result_data.get("records"))
+        }})
+
+    return KasResponse(fault_code="mcp_unexpected",
+                       fault_string=f"Unerwartete Antwort: {result_data}")
+
+
+class McpHubTransport(Transport):
+    """KAS-Aufrufe über die allinkl.*-Tools des MCP Hub
+
+    call_many() schickt alle Aufrufe als einen JSON-RPC-Batch; die Flood
+    Protection übernimmt der Hub.
+    """
+
+    name = "mcp"
+    batch = True
+
+    def __init__(self, token: str, hub_url: str = MCP_HUB_URL,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 scheduler: Optional[FloodScheduler] = None):
+        super().__init__(scheduler)
+        self.hub = McpHubClient(token, hub_url=hub_url, timeout=timeout)
+
+    def close(self):
+        self.hub.close()
+
+    @staticmethod
+    def tool_call(action: str, params: Dict) -> tuple:
+        """(tool_name, args) für eine KAS-Aktion"""
+        args = dict(params)
+        if "zone_host" in args:
+            # Der Hub erwartet den Zonennamen ohne abschließenden Punkt
+            args["zone_host"] = args["zone_host"].rstrip(".")
+        return MCP_TOOLS.get(action, f"allinkl.{action}"), args
+
+    def call(self, action: str, params: Dict,
+             timeout: Optional[float] = None) -> Optional[KasResponse]:
+        return self.call_many([(action, params)])[0]
+
+    def call_many(self, calls: List[tuple]) -> List[Optional[KasResponse]]:
+        if not calls:
+            return []
+        with self.scheduler.slot() as slot:
+            sent, received = self.hub.bytes_sent, self.hub.bytes_received
+            results = self.hub.call_tools([self.tool_call(action, params)
+                                           for action, params in calls])
+            self.scheduler.record(None)
+            self._account(self.hub.bytes_sent - sent, self.hub.bytes_received - received,
+                          slot.last_wait)
+        return [mcp_to_kas_response(result) for result in results]
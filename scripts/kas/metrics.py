@@ -0,0 +1,229 @@
+"""
+Strukturierte Messwerte für jeden KAS-Aufruf
+
+Der KasClient meldet pro Aufruf ein CallEvent: Aktion, Zone, Dauer (inkl.
+Wiederholungen), davon Wartezeit für die Flood Protection, gesendete und
+empfangene Bytes, Anzahl Wiederholungen und den von KAS gemeldeten
+KasFloodDelay. Die Events gehen an beliebig viele Sinks:
+
+- JsonlSink:       eine JSON-Zeile pro Aufruf in eine Datei
+- StdoutSink:      eine JSON-Zeile pro Aufruf auf stdout (bzw. stderr)
+- PrometheusSink:  am Ende des Laufs Zähler und Histogramme im
+                   Prometheus-Textformat (z.B. für den node_exporter textfile collector)
+
+Am Ende eines Laufs zeigt summary() pro Aktion ein Latenz-Histogramm und
+wohin die Zeit gegangen ist (Netzwerk vs. Flood-Delay).
+
+Aufruf (aus scripts/):
+
+    python3 -m kas --metrics jsonl:metrics.jsonl apply dns_zones.json
+    python3 -m kas --metrics stdout --metrics prom:kas.prom apply dns_zones.json
+"""
+
+import json
+import sys
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, TextIO
+
+# Obergrenzen der Latenz-Buckets in Sekunden (wie Prometheus-Histogramme)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class CallEvent:
+    """Messwerte eines KAS-Aufrufs (calls > 1: ein Batch mehrerer Aufrufe)"""
+
+    __slots__ = ("ts", "transport", "action", "zone", "latency", "flood_wait",
+                 "flood_delay", "bytes_sent", "bytes_received", "retries",
+                 "outcome", "calls")
+
+    def __init__(self, transport: str, action: str, zone: str, latency: float,
+                 flood_wait: float = 0.0, flood_delay: Optional[float] = None,
+                 bytes_sent: int = 0, bytes_received: int = 0, retries: int = 0,
+                 outcome: str = "ok", calls: int = 1, ts: Optional[float] = None):
+        self.ts = ts if ts is not None else time.time()
+        self.transport = transport
+        self.action = action
+        self.zone = zone
+        self.latency = latency
+        self.flood_wait = flood_wait
+        self.flood_delay = flood_delay
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.retries = retries
+        self.outcome = outcome
+        self.calls = calls
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class JsonlSink:
+    """Hängt jedes Event als JSON-Zeile an eine Datei an"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def emit(self, event: CallEvent):
+        self._file.write(json.dumps(event.to_dict()) + "\n")
+        self._file.flush()
+
+    def close(self, metrics: "Metrics"):
+        self._file.close()
+
+
+class StdoutSink:
+    """Schreibt jedes Event als JSON-Zeile auf einen Stream"""
+
+    def __init__(self, stream: TextIO = sys.stdout):
+        self.stream = stream
+
+    def emit(self, event: CallEvent):
+        print(json.dumps(event.to_dict()), file=self.stream, flush=True)
+
+    def close(self, metrics: "Metrics"):
+        pass
+
+
+class PrometheusSink:
+    """Schreibt am Ende alle Zähler im Prometheus-Textformat"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def emit(self, event: CallEvent):
+        pass
+
+    def close(self, metrics: "Metrics"):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(metrics.to_prometheus())
+
+
+def create_sink(spec: str):
+    """Sink aus einer Angabe wie jsonl:pfad, prom:pfad, stdout oder stderr"""
+    kind, _, path = spec.partition(":")
+    if kind == "stdout":
+        return StdoutSink(sys.stdout)
+    if kind == "stderr":
+        return StdoutSink(sys.stderr)
+    if kind == "jsonl" and path:
+        return JsonlSink(path)
+    if kind in ("prom", "prometheus") and path:
+        return PrometheusSink(path)
+    raise ValueError(f"Unbekannter Metrics-Sink: {spec} (jsonl:pfad, prom:pfad, stdout, stderr)")
+
+
+class ActionStats:
+    """Aufsummierte Werte einer Aktion plus Latenz-Histogramm"""
+
+    def __init__(self):
+        self.count = 0
+        self.calls = 0
+        self.latency = 0.0
+        self.flood_wait = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.outcomes: Dict[str, int] = {}
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latencies: List[float] = []
+
+    def add(self, event: CallEvent):
+        self.count += 1
+        self.calls += event.calls
+        self.latency += event.latency
+        self.flood_wait += event.flood_wait
+        self.bytes_sent += event.bytes_sent
+        self.bytes_received += event.bytes_received
+        self.retries += event.retries
+        self.outcomes[event.outcome] = self.outcomes.get(event.outcome, 0) + 1
+        self.buckets[bisect_left(LATENCY_BUCKETS, event.latency)] += 1
+        self.latencies.append(event.latency)
+
+    def quantile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Metrics:
+    """Nimmt CallEvents entgegen, verteilt sie an die Sinks und summiert pro Aktion"""
+
+    def __init__(self, sinks: Optional[List] = None):
+        self.sinks = list(sinks or [])
+        self.actions: Dict[str, ActionStats] = {}
+        self._lock = threading.Lock()
+
+    def emit(self, event: CallEvent):
+        with self._lock:
+            self.actions.setdefault(event.action, ActionStats()).add(event)
+            for sink in self.sinks:
+                sink.emit(event)
+
+    def close(self):
+        """Sinks schließen (PrometheusSink schreibt erst hier)"""
+        with self._lock:
+            for sink in self.sinks:
+                sink.close(self)
+
+    def to_prometheus(self) -> str:
+        """Alle Zähler im Prometheus-Textformat"""
+        lines = [
+            "# HELP kas_call_duration_seconds Dauer eines KAS-Aufrufs inkl. Wiederholungen",
+            "# TYPE kas_call_duration_seconds histogram",
+        ]
+        for action, stats in sorted(self.actions.items()):
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                cumulative += count
+                lines.append(f'kas_call_duration_seconds_bucket{{action="{action}",le="{bound}"}} '
+                             f'{cumulative}')
+            lines.append(f'kas_call_duration_seconds_bucket{{action="{action}",le="+Inf"}} '
+                         f'{stats.count}')
+            lines.append(f'kas_call_duration_seconds_sum{{action="{action}"}} {stats.latency}')
+            lines.append(f'kas_call_duration_seconds_count{{action="{action}"}} {stats.count}')
+
+        counters = (
+            ("kas_calls_total", "KAS-Aufrufe", "calls"),
+            ("kas_call_retries_total", "Wiederholungen", "retries"),
+            ("kas_flood_wait_seconds_total", "Wartezeit wegen Flood Protection", "flood_wait"),
+            ("kas_bytes_sent_total", "Gesendete Bytes", "bytes_sent"),
+            ("kas_bytes_received_total", "Empfangene Bytes", "bytes_received"),
+        )
+        for name, help_text, attribute in counters:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for action, stats in sorted(self.actions.items()):
+                lines.append(f'{name}{{action="{action}"}} {getattr(stats, attribute)}')
+
+        lines.append("# HELP kas_call_outcomes_total Aufrufe nach Ergebnis")
+        lines.append("# TYPE kas_call_outcomes_total counter")
+        for action, stats in sorted(self.actions.items()):
+            for outcome, count in sorted(stats.outcomes.items()):
+                lines.append(f'kas_call_outcomes_total{{action="{action}",outcome="{outcome}"}} '
+                             f'{count}')
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        """Histogramm und Zeitaufteilung pro Aktion für die Ausgabe am Ende"""
+        lines = []
+        for action, stats in sorted(self.actions.items()):
+            network = stats.latency - stats.flood_wait
+            lines.append(f"📊 {action}: {stats.count} Aufruf(e), {stats.latency:.2f}s gesamt "
+                         f"(Netzwerk {network:.2f}s, Flood-Delay {stats.flood_wait:.2f}s), "
+                         f"p50 {stats.quantile(0.5) * 1000:.0f} ms, "
+                         f"p95 {stats.quantile(0.95) * 1000:.0f} ms")
+            lines.append(f"   {stats.bytes_sent} B gesendet, {stats.bytes_received} B empfangen, "
+                         f"{stats.retries} Wiederholung(en)")
+            peak = max(stats.buckets) or 1
+            lower = 0.0
+            for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), stats.buckets):
+                if count:
+                    label = f"≤ {bound:g}s" if bound != float("inf") else f"> {lower:g}s"
+                    bar = "█" * max(1, round(count / peak * 30))
+                    lines.append(f"   {label:>8} {bar} {count}")
+                lower = bound
+        return "\n".join(lines)
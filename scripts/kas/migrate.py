@@ -0,0 +1,159 @@
+"""
+Atomare Umstellung von A/AAAA-Records auf einen CNAME
+
+Für jeden Namen wird die Zone einmal gelesen, die kollidierenden A/AAAA-
+Einträge (und ein CNAME mit anderem Ziel) gelöscht und anschließend der
+CNAME angelegt. Schlägt ein Schritt fehl, werden die bereits gelöschten
+Einträge wieder angelegt. Jeder Schritt wird mit seiner Dauer protokolliert.
+
+Aufruf (aus scripts/):
+
+    python3 -m kas.migrate baltic-ihub.com notstromaggregat backup-generator \\
+        --target 7c6be46a197dc3f0.vercel-dns-017.com.
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+from .client import KasClient
+from .credentials import get_credentials
+from .zone import DnsRecord, Zone
+
+# Typen, die neben einem CNAME nicht existieren dürfen
+CONFLICT_TYPES = ("A", "AAAA", "CNAME")
+
+
+class MigrationStep:
+    """Ein ausgeführter Schritt mit Ergebnis und Dauer"""
+
+    def __init__(self, action: str, record: DnsRecord, success: bool,
+                 message: str, duration: float):
+        self.action = action
+        self.record = record
+        self.success = success
+        self.message = message
+        self.duration = duration
+
+    def describe(self) -> str:
+        icon = "✅" if self.success else "❌"
+        return (f"{icon} {self.action} {self.record.type} {self.record.data} "
+                f"({self.duration:.2f}s): {self.message}")
+
+
+class MigrationResult:
+    """Ergebnis der Umstellung eines Namens"""
+
+    def __init__(self, zone_host: str, record_name: str, target: str):
+        self.zone_host = zone_host
+        self.record_name = record_name
+        self.target = target
+        self.steps: List[MigrationStep] = []
+        self.rolled_back = False
+        self.success = False
+
+    @property
+    def duration(self) -> float:
+        return sum(step.duration for step in self.steps)
+
+
+def _timed(result: MigrationResult, action: str, record: DnsRecord, func, *args) -> bool:
+    started = time.monotonic()
+    success, message = func(*args)
+    result.steps.append(MigrationStep(action, record, success, message,
+                                      time.monotonic() - started))
+    return success
+
+
+def migrate_to_cname(client: KasClient, zone: Zone, record_name: str,
+                     target: str) -> MigrationResult:
+    """Stelle einen Namen der bereits geladenen Zone auf einen CNAME um"""
+    zone_host = zone.zone_host
+    result = MigrationResult(zone_host, record_name, target)
+    cname = DnsRecord(record_name, "CNAME", target)
+
+    conflicts = [record for record_type in CONFLICT_TYPES
+                 for record in zone.find(record_name, record_type)]
+    if any(record.content == cname.content for record in conflicts):
+        # CNAME existiert schon – nur noch übrige A/AAAA-Records entfernen
+        conflicts = [record for record in conflicts if record.type != "CNAME"]
+        if not conflicts:
+            result.success = True
+            return result
+
+    deleted: List[DnsRecord] = []
+    for record in conflicts:
+        if not _timed(result, "delete", record,
+                      client.delete_dns_record, record.record_id, zone_host):
+            break
+        zone.remove(record.record_id)
+        deleted.append(record)
+    else:
+        has_cname = any(record.type == "CNAME" and record.content == cname.content
+                        for record in zone.find(record_name, "CNAME"))
+        if has_cname or _timed(result, "add", cname, client.add_dns_record,
+                               zone_host, cname.name, cname.type, cname.data, cname.aux):
+            result.success = True
+            return result
+
+    # Rollback: gelöschte Einträge in umgekehrter Reihenfolge wiederherstellen
+    result.rolled_back = True
+    for record in reversed(deleted):
+        if _timed(result, "restore", record, client.add_dns_record,
+                  zone_host, record.name, record.type, record.data, record.aux):
+            # Neue record_id ist unbekannt – Eintrag als ungespeichert führen
+            zone.add(DnsRecord(record.name, record.type, record.data, record.aux))
+    return result
+
+
+def migrate_zone(client: KasClient, zone_host: str, record_names: List[str],
+                 target: str) -> Optional[List[MigrationResult]]:
+    """Lies die Zone einmal und stelle alle Namen nacheinander um"""
+    zone = client.get_zone(zone_host, max_age=0)
+    if zone is None:
+        return None
+    return [migrate_to_cname(client, zone, name, target) for name in record_names]
+
+
+def print_result(result: MigrationResult):
+    """Ausgabe eines Namens mit allen Schritten"""
+    status = "✅" if result.success else ("↩️  zurückgerollt" if result.rolled_back else "❌")
+    print(f"🌐 {result.record_name}.{result.zone_host} → CNAME {result.target}: {status}")
+    if not result.steps:
+        print("  ✔️  Bereits umgestellt")
+    for step in result.steps:
+        print(f"  {step.describe()}")
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="A/AAAA-Records atomar auf CNAME umstellen")
+    parser.add_argument("zone_host", help="Zone, z.B. baltic-ihub.com")
+    parser.add_argument("record_names", nargs="+", help="Umzustellende Subdomains")
+    parser.add_argument("--target", required=True, help="CNAME-Ziel")
+    args = parser.parse_args(argv)
+
+    kas_user, kas_password = get_credentials()
+    if not kas_user or not kas_password:
+        print("❌ Credentials nicht gefunden!")
+        sys.exit(1)
+
+    with KasClient(kas_user, kas_password) as client:
+        results = migrate_zone(client, args.zone_host, args.record_names, args.target)
+        if results is None:
+            print(f"❌ Konnte DNS-Einträge für {args.zone_host} nicht abrufen")
+            sys.exit(1)
+        for result in results:
+            print_result(result)
+
+    failed = [result for result in results if not result.success]
+    print("="*60)
+    print(f"✅ Umgestellt: {len(results) - len(failed)}/{len(results)}")
+    print(f"⏱️  {client.scheduler.summary()}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
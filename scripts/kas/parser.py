@@ -0,0 +1,192 @@
+"""
+Inkrementeller Parser für KAS SOAP-Antworten
+
+Statt die Antwort mehrfach mit Substring-Suchen und Regex zu durchsuchen
+("TRUE" in xml, <faultstring>, <item xsi:type="ns2:Map">), wird sie einmal
+mit xml.etree.ElementTree.iterparse gelesen. Die SOAP-Encoding-Strukturen
+(ns2:Map, SOAP-ENC:Array, xsd:float, ...) werden dabei direkt in Python-
+Werte übersetzt; bereits verarbeitete Elemente werden sofort freigegeben.
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Optional, Union
+
+XSI_NS = "{http://www.w3.org/2001/XMLSchema-instance}"
+XSI_TYPE = XSI_NS + "type"
+XSI_NIL = XSI_NS + "nil"
+
+# Felder eines DNS-Eintrags in ReturnInfo → Schlüssel in den Record-Dicts
+RECORD_FIELDS = {
+    "record_id": "id",
+    "record_name": "name",
+    "record_type": "type",
+    "record_data": "data",
+    "record_aux": "aux",
+}
+
+
+class KasResponse:
+    """Ergebnis eines KAS-Aufrufs
+
+    value ist der komplette dekodierte Rückgabewert; die wichtigsten Teile
+    (ReturnString, ReturnInfo, KasFloodDelay, SOAP-Fault) liegen zusätzlich
+    als eigene Attribute vor.
+    """
+
+    def __init__(self, value: Any = None, fault_code: Optional[str] = None,
+                 fault_string: Optional[str] = None, size: int = 0):
+        self.value = value
+        self.fault_code = fault_code
+        self.fault_string = fault_string
+        self.size = size
+
+        response = value.get("Response") if isinstance(value, dict) else None
+        if not isinstance(response, dict):
+            response = {}
+        self.return_string = response.get("ReturnString")
+        self.return_info = response.get("ReturnInfo")
+        flood_delay = response.get("KasFloodDelay")
+        self.flood_delay = float(flood_delay) if flood_delay is not None else None
+
+    def __repr__(self):
+        if self.fault_string is not None:
+            return f"KasResponse(fault={self.fault_string!r})"
+        return f"KasResponse(return_string={self.return_string!r}, flood_delay={self.flood_delay!r})"
+
+    @property
+    def ok(self) -> bool:
+        """True wenn kein Fault vorliegt und KAS TRUE meldet"""
+        return self.fault_string is None and self.return_string == "TRUE"
+
+    @property
+    def records(self) -> List[Dict]:
+        """DNS-Einträge aus ReturnInfo (nur bei get_dns_settings)"""
+        if not isinstance(self.return_info, list):
+            return []
+        records = []
+        for item in self.return_info:
+            if not isinstance(item, dict) or "record_id" not in item or "record_type" not in item:
+                continue
+            record = {key: item.get(field, "") for field, key in RECORD_FIELDS.items()}
+            record["id"] = str(record["id"])
+            record["aux"] = str(record["aux"] if record["aux"] != "" else "0")
+            records.append(record)
+        return records
+
+    def summary(self, limit: int = 200) -> str:
+        """Kurzbeschreibung für Fehlermeldungen"""
+        if self.fault_string is not None:
+            return self.fault_string
+        return f"Unerwartete Antwort: {str(self.value)[:limit]}"
+
+
+class _Frame:
+    """Ein gerade geöffneter Wert (Map, Array oder Skalar)"""
+
+    __slots__ = ("kind", "container", "key")
+
+    def __init__(self, elem: ET.Element):
+        xsi_type = elem.get(XSI_TYPE, "")
+        self.key = None
+        if elem.get(XSI_NIL) == "true":
+            self.kind = "nil"
+            self.container = None
+        elif xsi_type.endswith(":Map") or xsi_type == "Map":
+            self.kind = "map"
+            self.container = {}
+        elif "Array" in xsi_type:
+            self.kind = "array"
+            self.container = []
+        else:
+            self.kind = xsi_type.rpartition(":")[2]
+            self.container = None
+
+    def add(self, value: Any):
+        if isinstance(self.container, list):
+            self.container.append(value)
+        else:
+            if self.container is None:
+                self.container = {}
+            self.container[self.key] = value
+            self.key = None
+
+    def finish(self, text: Optional[str]) -> Any:
+        if self.container is not None or self.kind in ("map", "array"):
+            return self.container
+        if self.kind == "nil":
+            return None
+        text = text or ""
+        try:
+            if self.kind in ("float", "double", "decimal"):
+                return float(text)
+            if self.kind in ("int", "integer", "long", "short"):
+                return int(text)
+        except ValueError:
+            return text
+        if self.kind == "boolean":
+            return text.strip().lower() in ("true", "1")
+        return text
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def parse_response(xml_response: Union[str, bytes]) -> KasResponse:
+    """Lies eine KAS SOAP-Antwort in einem Durchgang ein"""
+    if isinstance(xml_response, str):
+        xml_response = xml_response.encode("utf-8")
+
+    frames: List[_Frame] = []
+    item_is_value: List[bool] = []
+    value = None
+    fault_code = None
+    fault_string = None
+
+    try:
+        for event, elem in ET.iterparse(io.BytesIO(xml_response), events=("start", "end")):
+            name = _local_name(elem.tag)
+
+            if event == "start":
+                if name == "return" and not frames or name == "value" and frames:
+                    frames.append(_Frame(elem))
+                elif name == "item" and frames:
+                    # In einem Array ist jedes <item> ein Wert, in einer Map
+                    # nur der Container für <key>/<value>
+                    top = frames[-1]
+                    is_value = isinstance(top.container, list)
+                    if is_value:
+                        frames.append(_Frame(elem))
+                    elif top.container is None:
+                        top.container = {}
+                    item_is_value.append(is_value)
+                continue
+
+            if name == "key" and frames:
+                frames[-1].key = elem.text or ""
+            elif (name == "value" and frames) or (name == "return" and len(frames) == 1) \
+                    or (name == "item" and item_is_value and item_is_value.pop()):
+                frame = frames.pop()
+                decoded = frame.finish(elem.text)
+                if frames:
+                    frames[-1].add(decoded)
+                else:
+                    value = decoded
+            elif name == "faultcode":
+                fault_code = (elem.text or "").strip()
+            elif name == "faultstring":
+                fault_string = (elem.text or "").strip()
+
+            elem.clear()
+    except ET.ParseError as e:
+        return KasResponse(fault_code="parse_error",
+                           fault_string=f"Ungültige XML-Antwort: {e}",
+                           size=len(xml_response))
+
+    return KasResponse(value, fault_code, fault_string, size=len(xml_response))
+
+
+def parse_dns_records(xml_response: Union[str, bytes]) -> List[Dict]:
+    """Parse DNS Records aus der get_dns_settings Antwort"""
+    return parse_response(xml_response).records
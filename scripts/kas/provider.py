@@ -0,0 +1,139 @@
+"""
+Provider-neutrale Schnittstelle für DNS-Backends
+
+Der Abgleich (kas.reconcile) arbeitet mit DnsRecord/Zone und einem Driver.
+Ein Driver liest Zonen und legt Einträge an, ändert oder löscht sie; über
+Capabilities sagt er, was er kann:
+
+- batch:            add_records() schickt mehrere Einträge in einem Aufruf
+- max_concurrency:  so viele Zonen dürfen gleichzeitig bearbeitet werden
+- update:           Einträge lassen sich direkt ändern (sonst delete + add)
+- ttl:              TTL pro Eintrag wird gespeichert
+
+Drivers:
+
+- KasDriver:       All-Inkl KAS über KasClient (SOAP, MCP Hub oder Stub)
+- ZoneFileDriver:  RFC-1035-Zonendateien in einem Verzeichnis (kas.zonefile)
+"""
+
+from typing import List, Optional
+
+from .client import KasClient
+from .executor import DEFAULT_MAX_WORKERS
+from .zone import DnsRecord, Zone
+
+
+class Capabilities:
+    """Was ein Driver kann, damit der Abgleich den schnellsten Weg wählt"""
+
+    def __init__(self, batch: bool = False, max_concurrency: int = 1,
+                 update: bool = True, ttl: bool = False):
+        self.batch = batch
+        self.max_concurrency = max(1, max_concurrency)
+        self.update = update
+        self.ttl = ttl
+
+    def __repr__(self):
+        return (f"Capabilities(batch={self.batch}, max_concurrency={self.max_concurrency}, "
+                f"update={self.update}, ttl={self.ttl})")
+
+
+class Driver:
+    """Schnittstelle aller DNS-Backends
+
+    Schreibende Methoden geben (erfolg, meldung) zurück wie KasClient.
+    """
+
+    name = "driver"
+
+    @property
+    def capabilities(self) -> Capabilities:
+        return Capabilities()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Gib offene Ressourcen frei"""
+
+    def get_zone(self, zone_host: str, max_age: Optional[float] = None) -> Optional[Zone]:
+        """Aktuelle Einträge einer Zone, None bei Fehlern"""
+        raise NotImplementedError
+
+    def add_record(self, zone_host: str, record: DnsRecord) -> tuple[bool, str]:
+        raise NotImplementedError
+
+    def delete_record(self, zone_host: str, record: DnsRecord) -> tuple[bool, str]:
+        raise NotImplementedError
+
+    def update_record(self, zone_host: str, current: DnsRecord,
+                      desired: DnsRecord) -> tuple[bool, str]:
+        raise NotImplementedError
+
+    def add_records(self, zone_host: str, records: List[DnsRecord]) -> List[tuple[bool, str]]:
+        """Mehrere Einträge anlegen; Drivers mit batch überschreiben das"""
+        return [self.add_record(zone_host, record) for record in records]
+
+    def summary(self) -> List[str]:
+        """Zeilen für die Zusammenfassung am Ende eines Laufs"""
+        return []
+
+
+class KasDriver(Driver):
+    """All-Inkl KAS über einen KasClient
+
+    Die Flood Protection gilt pro Account; die Aufrufe taktet der
+    FloodScheduler des Clients über alle Threads hinweg. Parallele Zonen
+    sparen deshalb die Wartezeit auf Antworten und Login, nicht die
+    Sperrzeit. max_concurrency ist die Zahl der Worker, für die der Client
+    (HTTP-Pool) geöffnet wurde; batch hängt am Transport (MCP Hub: ja,
+    SOAP: nein).
+    """
+
+    name = "kas"
+
+    def __init__(self, client: KasClient, max_concurrency: int = DEFAULT_MAX_WORKERS):
+        self.client = client
+        self.max_concurrency = max_concurrency
+
+    @property
+    def capabilities(self) -> Capabilities:
+        return Capabilities(batch=self.client.transport.batch,
+                            max_concurrency=self.max_concurrency, update=True, ttl=False)
+
+    def close(self):
+        self.client.close()
+
+    def get_zone(self, zone_host: str, max_age: Optional[float] = None) -> Optional[Zone]:
+        return self.client.get_zone(zone_host, max_age=max_age)
+
+    def add_record(self, zone_host: str, record: DnsRecord) -> tuple[bool, str]:
+        return self.client.add_dns_record(zone_host, record.name, record.type,
+                                          record.data, record.aux)
+
+    def delete_record(self, zone_host: str, record: DnsRecord) -> tuple[bool, str]:
+        return self.client.delete_dns_record(record.record_id, zone_host=zone_host)
+
+    def update_record(self, zone_host: str, current: DnsRecord,
+                      desired: DnsRecord) -> tuple[bool, str]:
+        return self.client.update_dns_record(current.record_id, desired.name, desired.type,
+                                             desired.data, desired.aux, zone_host=zone_host)
+
+    def add_records(self, zone_host: str, records: List[DnsRecord]) -> List[tuple[bool, str]]:
+        return self.client.add_dns_records(zone_host, records)
+
+    def summary(self) -> List[str]:
+        lines = [f"⏱️  {self.client.scheduler.summary()}"]
+        if self.client.retry.retries:
+            lines.append(f"🔁 {self.client.retry.summary()}")
+        return lines
+
+
+def as_driver(target) -> Driver:
+    """Driver unverändert, KasClient als KasDriver (für bestehende Aufrufer)"""
+    if isinstance(target, KasClient):
+        return KasDriver(target)
+    return target
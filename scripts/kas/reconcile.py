@@ -0,0 +1,253 @@
+"""
+Deklarativer Abgleich von DNS-Zonen (Desired State → KAS oder anderer Provider)
+
+Liest eine JSON-Datei mit dem gewünschten Zustand (Zone → Einträge), holt
+jede Zone genau einmal über get_dns_settings und berechnet einen minimalen
+Plan aus add/update/delete. Nur die Unterschiede werden angewendet.
+
+Verwaltet werden ausschließlich die Namen, die in der Datei vorkommen:
+andere Einträge der Zone (NS, MX, ...) bleiben unberührt. Für einen
+verwalteten Namen werden dagegen alle Einträge entfernt, die nicht im
+gewünschten Zustand stehen – so verschwindet z.B. der alte A-Record, wenn
+stattdessen ein CNAME gewünscht ist.
+
+Format der Datei:
+
+    {
+      "baltic-ihub.com": [
+        {"record_name": "notstromaggregat", "record_type": "CNAME",
+         "record_data": "7c6be46a197dc3f0.vercel-dns-017.com."}
+      ]
+    }
+
+Aufruf (aus scripts/):
+
+    python3 -m kas plan dns_zones.json
+    python3 -m kas plan dns_zones.json --offline   # nur Zonen-Cache
+    python3 -m kas apply dns_zones.json
+
+Der Plan für 'plan' nutzt den Zonen-Cache (solange jünger als die TTL);
+vor dem Anwenden wird jede Zone frisch geladen.
+
+Angewendet wird über einen Driver (kas.provider). Dessen Capabilities
+bestimmen den Weg: mit batch gehen alle neuen Einträge einer Zone in einem
+Aufruf raus, max_concurrency begrenzt die parallel bearbeiteten Zonen,
+ohne update wird aus einer Änderung delete + add.
+"""
+
+import argparse
+import json
+import sys
+from typing import Callable, Dict, List, Optional
+
+from .zone import DnsRecord, Zone
+from .executor import DEFAULT_MAX_WORKERS, ExecutionReport, ZoneExecutor
+from .journal import DONE, FAILED, PLANNED, Journal
+from .provider import Driver, as_driver
+
+# Reihenfolge beim Anwenden: erst löschen, damit z.B. ein CNAME nicht mit
+# einem noch vorhandenen A-Record kollidiert
+ACTION_ORDER = {"delete": 0, "update": 1, "add": 2}
+
+
+class Change:
+    """Eine einzelne Änderung im Plan"""
+
+    def __init__(self, action: str, zone_host: str,
+                 desired: Optional[DnsRecord] = None, current: Optional[DnsRecord] = None):
+        self.action = action
+        self.zone_host = zone_host
+        self.desired = desired
+        self.current = current
+
+    def __repr__(self):
+        return f"Change({self.action!r}, {self.zone_host!r}, {self.describe()!r})"
+
+    @property
+    def record_name(self) -> str:
+        record = self.desired or self.current
+        return record.name
+
+    @property
+    def key(self) -> str:
+        """Stabiler Schlüssel für das Journal"""
+        parts = [self.action, self.zone_host, self.record_name]
+        if self.current is not None:
+            parts += [self.current.record_id or "", self.current.type, self.current.data]
+        if self.desired is not None:
+            parts += [self.desired.type, self.desired.data, self.desired.aux]
+        return ":".join(parts)
+
+    def describe(self) -> str:
+        """Einzeilige Beschreibung für die Ausgabe"""
+        fqdn = f"{self.record_name}.{self.zone_host}" if self.record_name else self.zone_host
+        if self.action == "add":
+            return f"+ {fqdn} {self.desired.type} {self.desired.data}"
+        if self.action == "delete":
+            return (f"- {fqdn} {self.current.type} {self.current.data}"
+                    f" (ID: {self.current.record_id})")
+        return (f"~ {fqdn} {self.current.type} {self.current.data}"
+                f" → {self.desired.data} (ID: {self.current.record_id})")
+
+
+def load_desired_state(path: str) -> Dict[str, List[DnsRecord]]:
+    """Lies die Desired-State-Datei ('-' für stdin)"""
+    if path == "-":
+        state = json.load(sys.stdin)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+
+    return {
+        zone_host.rstrip("."): [DnsRecord.from_dict(record) for record in records]
+        for zone_host, records in state.items()
+    }
+
+
+def plan_zone(zone_host: str, desired: List[DnsRecord], live: Zone) -> List[Change]:
+    """Berechne den minimalen Änderungsplan für eine Zone"""
+    wanted_by_name: Dict[str, List[DnsRecord]] = {}
+    for record in desired:
+        wanted_by_name.setdefault(record.name, []).append(record)
+
+    changes = []
+    for name in sorted(wanted_by_name):
+        present = live.find(name)
+
+        # Identische Einträge bleiben unverändert
+        present_by_content = {}
+        for record in present:
+            present_by_content.setdefault(record.content, []).append(record)
+        unmatched_wanted = []
+        for record in wanted_by_name[name]:
+            matches = present_by_content.get(record.content)
+            if matches:
+                present.remove(matches.pop())
+            else:
+                unmatched_wanted.append(record)
+
+        # Gleicher Typ mit anderem Inhalt → ein update statt delete + add
+        for record in unmatched_wanted:
+            match = next((r for r in present if r.type == record.type), None)
+            if match is not None:
+                present.remove(match)
+                changes.append(Change("update", zone_host, desired=record, current=match))
+            else:
+                changes.append(Change("add", zone_host, desired=record))
+
+        for record in present:
+            changes.append(Change("delete", zone_host, current=record))
+
+    changes.sort(key=lambda change: ACTION_ORDER[change.action])
+    return changes
+
+
+def apply_change(driver: Driver, change: Change) -> tuple[bool, str]:
+    """Wende eine einzelne Änderung an"""
+    if change.action == "add":
+        return driver.add_record(change.zone_host, change.desired)
+    if change.action == "update":
+        if driver.capabilities.update:
+            return driver.update_record(change.zone_host, change.current, change.desired)
+        success, message = driver.delete_record(change.zone_host, change.current)
+        if not success:
+            return success, message
+        return driver.add_record(change.zone_host, change.desired)
+    return driver.delete_record(change.zone_host, change.current)
+
+
+def _report(change: Change, success: bool, message: str, journal: Optional[Journal]):
+    print(f"  {'✅' if success else '❌'} {change.describe()}: {message}")
+    if journal is not None:
+        journal.record(DONE if success else FAILED, change.key, message=message)
+
+
+def _apply_and_report(driver: Driver, changes: List[Change],
+                      journal: Optional[Journal] = None) -> List[tuple[bool, str]]:
+    """Eine Änderung einzeln oder alle neuen Einträge einer Zone als Batch"""
+    if len(changes) > 1:
+        results = driver.add_records(changes[0].zone_host, [change.desired for change in changes])
+    else:
+        results = [apply_change(driver, changes[0])]
+    for change, (success, message) in zip(changes, results):
+        _report(change, success, message, journal)
+    return results
+
+
+def apply_plan(driver, plan: List[Change],
+               max_workers: int = DEFAULT_MAX_WORKERS,
+               journal: Optional[Journal] = None) -> tuple[List[Change], ExecutionReport]:
+    """Wende den Plan an: Zonen parallel, innerhalb einer Zone in Plan-Reihenfolge
+
+    driver ist ein Driver oder (wie bisher) ein KasClient. Mit journal wird
+    jede Änderung vorher als planned und danach als done/failed eingetragen.
+    """
+    driver = as_driver(driver)
+    capabilities = driver.capabilities
+    if journal is not None:
+        for change in plan:
+            journal.record(PLANNED, change.key, change=change.describe())
+
+    executor = ZoneExecutor(max_workers=min(max_workers, capabilities.max_concurrency))
+    zones: Dict[str, List[Change]] = {}
+    for change in plan:
+        zones.setdefault(change.zone_host, []).append(change)
+    for zone_host, zone_changes in zones.items():
+        adds = [change for change in zone_changes if change.action == "add"]
+        for change in zone_changes:
+            if capabilities.batch and change.action == "add":
+                continue
+            executor.submit(zone_host, _apply_and_report, driver, [change], journal)
+        if capabilities.batch and adds:
+            # Adds stehen im Plan am Ende, der Batch ändert die Reihenfolge nicht
+            executor.submit(zone_host, _apply_and_report, driver, adds, journal)
+    report = executor.run()
+
+    failed = []
+    for zone_host, zone_result in report.zones.items():
+        zone_changes = zones[zone_host]
+        results = [result for batch in zone_result.results for result in batch]
+        for change, (success, _) in zip(zone_changes, results):
+            if not success:
+                failed.append(change)
+        # Nach einer Exception wurden die restlichen Änderungen nicht ausgeführt
+        failed.extend(zone_changes[len(results):])
+    return failed, report
+
+
+def build_plan(state: Dict[str, List[DnsRecord]],
+               get_zone: Callable[[str], Optional[Zone]]) -> Optional[List[Change]]:
+    """Hole jede Zone einmal und berechne den Gesamtplan"""
+    plan = []
+    for zone_host, desired in state.items():
+        live = get_zone(zone_host)
+        if live is None:
+            print(f"❌ Konnte DNS-Einträge für {zone_host} nicht abrufen")
+            return None
+        plan.extend(plan_zone(zone_host, desired, live))
+    return plan
+
+
+def main(argv=None):
+    """Kompatibilität: --dry-run entspricht 'plan', sonst 'apply' (siehe kas.cli)"""
+    from .cli import main as cli_main
+
+    parser = argparse.ArgumentParser(description="DNS-Zonen mit gewünschtem Zustand abgleichen")
+    parser.add_argument("desired_state", help="JSON-Datei mit Zone → Einträgen ('-' für stdin)")
+    parser.add_argument("--dry-run", action="store_true", help="Plan nur anzeigen, nichts ändern")
+    parser.add_argument("--offline", action="store_true",
+                        help="Plan nur aus dem Zonen-Cache berechnen (impliziert --dry-run)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Anzahl Zonen, die parallel bearbeitet werden")
+    args = parser.parse_args(argv)
+
+    if args.offline:
+        cli_main(["plan", args.desired_state, "--offline"])
+    elif args.dry_run:
+        cli_main(["plan", args.desired_state])
+    else:
+        cli_main(["apply", args.desired_state, "--workers", str(args.workers)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Wiederholung fehlgeschlagener KAS-Aufrufe mit exponentiellem Backoff
+
+Jede Antwort wird eingeordnet:
+
+- ok:          Erfolg
+- idempotent:  "already exists" – der Eintrag ist da, zählt als Erfolg
+- retryable:   Netzwerkfehler (keine Antwort), Flood Protection, Timeouts,
+               vorübergehende Serverfehler → nach einer Pause erneut versuchen
+- permanent:   alles andere (falsche Daten, fehlende Rechte, abgelehnte
+               Anmeldung, ...) → sofort aufgeben
+
+Die Pause wächst exponentiell (base_delay * 2^(Versuch-1), höchstens
+max_delay) und wird mit Jitter gestreut, damit parallele Läufe nicht im
+Gleichtakt wiederholen. Ein einzelner Timeout bricht damit keinen
+Bulk-Lauf mehr ab.
+"""
+
+import random
+import time
+from typing import Callable, List, Optional
+
+from .parser import KasResponse
+
+OK = "ok"
+IDEMPOTENT = "idempotent"
+RETRYABLE = "retryable"
+PERMANENT = "permanent"
+
+# Fault-Texte (klein), bei denen sich ein neuer Versuch lohnt
+RETRYABLE_FAULTS = (
+    "flood_protection",
+    "timeout",
+    "timed out",
+    "temporar",
+    "try again",
+    "too_many",
+    "too many",
+    "unavailable",
+    "maintenance",
+    "parse_error",
+)
+
+# fault_code, wenn KasAuth die Anmeldung ablehnt (z.B. falsches Passwort)
+AUTH_FAILED = "kas_auth_failed"
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 30.0
+# Anteil der Pause, der zufällig gestreut wird (0 = kein Jitter, 1 = 0..Pause)
+DEFAULT_JITTER = 0.5
+
+
+def is_already_exists(message: str) -> bool:
+    """Prüfe ob eine Fehlermeldung einen bereits vorhandenen Eintrag meldet"""
+    message = message.lower()
+    return "already exists" in message or "bereits vorhanden" in message
+
+
+def classify(response: Optional[KasResponse]) -> str:
+    """Ordne eine Antwort ein: ok, idempotent, retryable oder permanent"""
+    if response is None:
+        return RETRYABLE
+    if response.ok:
+        return OK
+    if response.fault_code == AUTH_FAILED:
+        # Falsche Zugangsdaten werden durch Wiederholen nicht richtig
+        return PERMANENT
+    message = response.summary()
+    if is_already_exists(message):
+        return IDEMPOTENT
+    lowered = message.lower()
+    if any(marker in lowered for marker in RETRYABLE_FAULTS):
+        return RETRYABLE
+    return PERMANENT
+
+
+class RetryPolicy:
+    """Begrenzte Wiederholung mit exponentiellem Backoff und Jitter"""
+
+    def __init__(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 base_delay: float = DEFAULT_BASE_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY,
+                 jitter: float = DEFAULT_JITTER,
+                 sleep: Callable[[float], None] = time.sleep,
+                 rand: Callable[[], float] = random.random):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._sleep = sleep
+        self._rand = rand
+        self.retries = 0
+        self.gave_up = 0
+
+    def delay(self, attempt: int) -> float:
+        """Pause nach dem attempt-ten fehlgeschlagenen Versuch"""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter + self.jitter * self._rand())
+
+    def _wait(self, attempt: int, reason: str):
+        delay = self.delay(attempt)
+        print(f"⚠️  {reason} – Versuch {attempt + 1}/{self.max_attempts} in {delay:.1f}s")
+        self.retries += 1
+        self._sleep(delay)
+
+    def run(self, func: Callable[[], Optional[KasResponse]]) -> tuple[Optional[KasResponse], int]:
+        """Rufe func auf, bis die Antwort nicht mehr retryable ist
+
+        Gibt die letzte Antwort und die Anzahl der Versuche zurück.
+        """
+        attempt = 1
+        while True:
+            response = func()
+            if classify(response) != RETRYABLE:
+                return response, attempt
+            if attempt >= self.max_attempts:
+                self.gave_up += 1
+                return response, attempt
+            reason = response.summary() if response is not None else "Keine Antwort"
+            self._wait(attempt, reason)
+            attempt += 1
+
+    def run_many(self, call_many: Callable[[List[tuple]], List[Optional[KasResponse]]],
+                 calls: List[tuple]) -> List[tuple[Optional[KasResponse], int]]:
+        """Wie run(), aber für Batches: nur die retryable Aufrufe gehen erneut raus"""
+        results: List[tuple[Optional[KasResponse], int]] = [(None, 0)] * len(calls)
+        pending = list(range(len(calls)))
+        attempt = 1
+        while pending:
+            responses = call_many([calls[index] for index in pending])
+            retry = []
+            for index, response in zip(pending, responses):
+                results[index] = (response, attempt)
+                if classify(response) == RETRYABLE:
+                    retry.append(index)
+            if not retry:
+                break
+            if attempt >= self.max_attempts:
+                self.gave_up += len(retry)
+                break
+            self._wait(attempt, f"{len(retry)} Aufruf(e) ohne Erfolg")
+            pending = retry
+            attempt += 1
+        return results
+
+    def summary(self) -> str:
+        return f"{self.retries} Wiederholung(en), {self.gave_up} aufgegeben"
@@ -0,0 +1,153 @@
+"""
+Flood-Protection-Scheduler für die KAS API
+
+KAS liefert in jeder Antwort den Wert KasFloodDelay: so viele Sekunden muss
+bis zum nächsten Aufruf gewartet werden. Statt fester Pausen (time.sleep(5))
+wartet der Scheduler genau diese Zeit ab, bevor der nächste Request
+rausgeht. Zusätzlich können Operationen in eine Warteschlange gestellt und
+gesammelt abgearbeitet werden; gemessen wird der Durchsatz.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional
+
+from .parser import KasResponse
+
+# Pause, falls eine Antwort keinen KasFloodDelay enthält (z.B. bei Fehlern)
+FALLBACK_FLOOD_DELAY = 2.0
+# Zuschlag auf den Abstand zwischen zwei Sendezeitpunkten: parallele Requests
+# kommen nicht exakt im gesendeten Abstand bei KAS an (Jitter im Netz).
+# Ohne Flood-Delay entfällt er, dann gibt es keinen Abstand einzuhalten.
+SEND_MARGIN = 0.02
+
+
+class FloodScheduler:
+    """Hält die Flood-Delay-Vorgabe für den ganzen KAS-Account ein
+
+    Der Lock wird nur gehalten, um den nächsten Sendezeitpunkt zu
+    reservieren (letzter Sendezeitpunkt + KasFloodDelay). Gewartet und
+    gesendet wird ohne Lock: Aufrufe für verschiedene Zonen gehen im
+    Abstand des Flood-Delays raus, ihre Latenzen überlappen sich. Solange
+    noch keine Antwort einen KasFloodDelay geliefert hat, gilt
+    fallback_delay.
+    """
+
+    def __init__(self, fallback_delay: float = FALLBACK_FLOOD_DELAY,
+                 margin: float = SEND_MARGIN,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.fallback_delay = fallback_delay
+        self.margin = margin
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.RLock()
+        self._next_allowed = 0.0
+        # Zuletzt gemeldeter KasFloodDelay (Abstand für die nächste Reservierung)
+        self._delay = fallback_delay
+        self._pending = deque()
+        # Sendezeitpunkt und Wartezeit des laufenden Aufrufs (pro Thread)
+        self._local = threading.local()
+
+        self.calls = 0
+        self.waited = 0.0
+        self._started_at: Optional[float] = None
+        self._last_finished_at: Optional[float] = None
+
+    @property
+    def last_wait(self) -> float:
+        """Wartezeit vor dem laufenden Aufruf dieses Threads (gültig innerhalb von slot())"""
+        return getattr(self._local, "wait", 0.0)
+
+    @contextmanager
+    def slot(self):
+        """Reserviere den nächsten erlaubten Sendezeitpunkt und warte bis dahin
+
+        Innerhalb des with-Blocks muss record() mit der Antwort (oder None)
+        aufgerufen werden, damit die nächste Pause feststeht.
+        """
+        with self._lock:
+            now = self._clock()
+            if self._started_at is None:
+                self._started_at = now
+            send_at = max(now, self._next_allowed)
+            self._next_allowed = send_at + self._spacing(self._delay)
+            delay = send_at - now
+            self.waited += delay
+        self._local.wait = delay
+        self._local.sent_at = send_at
+        if delay > 0:
+            self._sleep(delay)
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self.calls += 1
+                self._last_finished_at = self._clock()
+
+    def sent(self):
+        """Tatsächlichen Sendezeitpunkt des laufenden Aufrufs festhalten
+
+        Liegt vor dem Request noch etwas anderes (z.B. die Anmeldung bei
+        KasAuth), zählt der Flood-Delay erst ab hier.
+        """
+        self._local.sent_at = self._clock()
+
+    def record(self, response: Optional[KasResponse]) -> float:
+        """Übernimm KasFloodDelay aus der Antwort für die folgenden Aufrufe
+
+        Der Abstand zählt ab dem Sendezeitpunkt dieses Aufrufs (so misst ihn
+        auch KAS); bereits reservierte spätere Zeitpunkte bleiben bestehen.
+        """
+        delay = response.flood_delay if response is not None else None
+        if delay is None:
+            delay = self.fallback_delay
+        sent_at = getattr(self._local, "sent_at", None)
+        with self._lock:
+            if sent_at is None:
+                sent_at = self._clock()
+            self._delay = delay
+            self._next_allowed = max(self._next_allowed, sent_at + self._spacing(delay))
+        return delay
+
+    def _spacing(self, delay: float) -> float:
+        """Abstand zwischen zwei Sendezeitpunkten: Flood-Delay plus Zuschlag"""
+        return delay + self.margin if delay > 0 else 0.0
+
+    def submit(self, func: Callable, *args, **kwargs):
+        """Stelle eine Operation in die Warteschlange"""
+        self._pending.append((func, args, kwargs))
+
+    @property
+    def pending(self) -> int:
+        """Anzahl noch nicht ausgeführter Operationen"""
+        return len(self._pending)
+
+    def drain(self) -> List[Any]:
+        """Führe alle Operationen der Warteschlange der Reihe nach aus"""
+        results = []
+        while self._pending:
+            func, args, kwargs = self._pending.popleft()
+            results.append(func(*args, **kwargs))
+        return results
+
+    @property
+    def elapsed(self) -> float:
+        """Sekunden zwischen dem ersten und dem letzten Aufruf"""
+        if self._started_at is None or self._last_finished_at is None:
+            return 0.0
+        return self._last_finished_at - self._started_at
+
+    @property
+    def throughput(self) -> float:
+        """Gemessene Aufrufe pro Sekunde"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.calls / self.elapsed
+
+    def summary(self) -> str:
+        """Kurze Zusammenfassung für die Ausgabe am Ende eines Laufs"""
+        return (f"{self.calls} API-Aufrufe in {self.elapsed:.1f}s "
+                f"({self.throughput:.2f}/s, davon {self.waited:.1f}s Flood-Delay)")
@@ -0,0 +1,58 @@
+"""--resume: nur Operationen des abgebrochenen Laufs (und seiner Fortsetzungen) gelten als erledigt"""
+
+import json
+
+from kas.journal import DONE, FAILED, PLANNED, Journal
+
+
+def _run(journal, done=(), failed=(), success=None):
+    journal.start_run()
+    for key in list(done) + list(failed):
+        journal.record(PLANNED, key)
+    for key in done:
+        journal.record(DONE, key)
+    for key in failed:
+        journal.record(FAILED, key)
+    if success is not None:
+        journal.finish_run(success)
+
+
+def test_interrupted_run_is_resumed(tmp_path):
+    journal = Journal(str(tmp_path / "dns_zones.journal.jsonl"))
+    _run(journal, done=["add:a", "add:b"])
+
+    assert journal.completed() == {"add:a", "add:b"}
+
+
+def test_successful_run_does_not_count_for_later_runs(tmp_path):
+    journal = Journal(str(tmp_path / "dns_zones.journal.jsonl"))
+    _run(journal, done=["add:a"], success=True)
+
+    assert journal.completed() == set()
+
+
+def test_resumed_runs_add_up_until_success(tmp_path):
+    journal = Journal(str(tmp_path / "dns_zones.journal.jsonl"))
+    _run(journal, done=["add:a"], success=True)
+    _run(journal, done=["add:b"], failed=["add:c"], success=False)
+    _run(journal, done=["add:d"], failed=["add:b"])
+
+    assert journal.completed() == {"add:d"}
+
+    _run(journal, done=["add:b", "add:c"], success=True)
+    assert journal.completed() == set()
+
+
+def test_entries_carry_the_run_and_survive_a_torn_line(tmp_path):
+    path = tmp_path / "dns_zones.journal.jsonl"
+    journal = Journal(str(path))
+    run_id = journal.start_run()
+    journal.record(DONE, "add:a", message="Erfolgreich hinzugefügt")
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"event": "done", "key": "add:')
+
+    entries = list(journal.entries())
+
+    assert {entry["run"] for entry in entries} == {run_id}
+    assert journal.completed() == {"add:a"}
+    assert json.loads(path.read_text(encoding='utf-8').splitlines()[1])["key"] == "add:a"
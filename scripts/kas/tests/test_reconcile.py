@@ -0,0 +1,135 @@
+"""Plan (plan_zone) und Anwenden pro Zone in Plan-Reihenfolge"""
+
+import threading
+import time
+
+from kas.executor import ZoneExecutor
+from kas.provider import Capabilities, Driver
+from kas.reconcile import apply_plan, plan_zone
+from kas.zone import DnsRecord, Zone
+
+ZONE = "baltic-ihub.com"
+TARGET = "7c6be46a197dc3f0.vercel-dns-017.com."
+
+
+def _live(*records):
+    return Zone.from_records(ZONE, [dict(id=str(number), name=name, type=type, data=data, aux="0")
+                                    for number, (name, type, data) in enumerate(records, 1)])
+
+
+def _actions(changes):
+    return [(change.action, change.record_name, (change.desired or change.current).type)
+            for change in changes]
+
+
+def test_identical_records_give_no_changes():
+    live = _live(("www", "CNAME", TARGET), ("", "MX", "mx.example.net"))
+
+    assert plan_zone(ZONE, [DnsRecord("www", "CNAME", TARGET)], live) == []
+
+
+def test_changed_data_is_an_update():
+    live = _live(("www", "CNAME", "old.example.net."))
+
+    changes = plan_zone(ZONE, [DnsRecord("www", "CNAME", TARGET)], live)
+
+    assert _actions(changes) == [("update", "www", "CNAME")]
+    assert changes[0].current.record_id == "1"
+
+
+def test_managed_name_is_replaced_and_others_stay():
+    live = _live(("notstromaggregat", "A", "192.0.2.1"),
+                 ("notstromaggregat", "AAAA", "2001:db8::1"),
+                 ("mail", "A", "192.0.2.25"))
+
+    changes = plan_zone(ZONE, [DnsRecord("notstromaggregat", "CNAME", TARGET)], live)
+
+    # Erst löschen, dann anlegen: der CNAME kollidiert sonst mit dem A-Record
+    assert _actions(changes) == [("delete", "notstromaggregat", "A"),
+                                 ("delete", "notstromaggregat", "AAAA"),
+                                 ("add", "notstromaggregat", "CNAME")]
+
+
+class RecordingDriver(Driver):
+    """Driver, der die Aufrufe pro Zone mitschreibt; langsame Zonen überlappen"""
+
+    def __init__(self, capabilities):
+        self._capabilities = capabilities
+        self.calls = []
+        self._lock = threading.Lock()
+
+    @property
+    def capabilities(self):
+        return self._capabilities
+
+    def _log(self, zone_host, action, record):
+        time.sleep(0.01)
+        with self._lock:
+            self.calls.append((zone_host, action, record.type))
+        return True, "ok"
+
+    def add_record(self, zone_host, record):
+        return self._log(zone_host, "add", record)
+
+    def add_records(self, zone_host, records):
+        return [self.add_record(zone_host, record) for record in records]
+
+    def delete_record(self, zone_host, record):
+        return self._log(zone_host, "delete", record)
+
+    def update_record(self, zone_host, current, desired):
+        return self._log(zone_host, "update", desired)
+
+
+def test_apply_keeps_plan_order_per_zone():
+    desired = [DnsRecord("notstromaggregat", "CNAME", TARGET), DnsRecord("www", "CNAME", TARGET)]
+    plan = []
+    for zone_host in (ZONE, "ihub-baltic.de"):
+        live = Zone.from_records(zone_host, [
+            dict(id="1", name="notstromaggregat", type="A", data="192.0.2.1", aux="0"),
+            dict(id="2", name="www", type="CNAME", data="old.example.net.", aux="0")])
+        plan += plan_zone(zone_host, desired, live)
+    driver = RecordingDriver(Capabilities(batch=True, max_concurrency=2, update=False))
+
+    failed, report = apply_plan(driver, plan, max_workers=2)
+
+    assert failed == []
+    assert report.operations == 3 * 2
+    for zone_host in (ZONE, "ihub-baltic.de"):
+        assert [call[1:] for call in driver.calls if call[0] == zone_host] == \
+            [("delete", "A"), ("delete", "CNAME"), ("add", "CNAME"), ("add", "CNAME")]
+
+
+def test_executor_runs_zones_in_parallel_and_in_order():
+    order = []
+    executor = ZoneExecutor(max_workers=2)
+    for index in range(3):
+        for zone_host in ("a.example", "b.example"):
+            executor.submit(zone_host, lambda zone_host=zone_host, index=index:
+                            time.sleep(0.01) or order.append((zone_host, index)))
+
+    report = executor.run()
+
+    for zone_host in ("a.example", "b.example"):
+        assert [index for zone, index in order if zone == zone_host] == [0, 1, 2]
+    assert report.wall_time < report.serial_time
+
+
+def test_executor_failure_stops_only_its_zone():
+    done = []
+
+    def fail():
+        raise RuntimeError("kaputt")
+
+    executor = ZoneExecutor()
+    executor.submit("a.example", done.append, "a1")
+    executor.submit("a.example", fail)
+    executor.submit("a.example", done.append, "a3")
+    executor.submit("b.example", done.append, "b1")
+    executor.submit("b.example", done.append, "b2")
+
+    report = executor.run()
+
+    assert sorted(done) == ["a1", "b1", "b2"]
+    assert str(report.zones["a.example"].error) == "kaputt"
+    assert report.zones["b.example"].error is None
@@ -0,0 +1,85 @@
+"""Einordnung von KAS-Antworten und Wiederholung über KasClient mit StubTransport"""
+
+from kas.client import KasClient
+from kas.parser import KasResponse
+from kas.retry import AUTH_FAILED, IDEMPOTENT, PERMANENT, RETRYABLE, RetryPolicy, classify
+from kas.scheduler import FloodScheduler
+from kas.transport import StubTransport
+
+ZONE = "baltic-ihub.com"
+
+
+class LostReplyTransport(StubTransport):
+    """Führt den ersten Aufruf von lose aus, verliert aber die Antwort (wie ein Timeout)"""
+
+    def __init__(self, lose: str, **kwargs):
+        super().__init__(**kwargs)
+        self.lose = lose
+        self.calls = []
+
+    def call(self, action, params, timeout=None):
+        self.calls.append(action)
+        response = super().call(action, params, timeout)
+        if action == self.lose and self.calls.count(action) == 1:
+            return None
+        return response
+
+
+def _client(transport):
+    return KasClient(transport=transport, use_cache=False,
+                     retry=RetryPolicy(sleep=lambda delay: None))
+
+
+def _transport(lose=""):
+    return LostReplyTransport(lose, zones={ZONE: [{"name": "www", "type": "A", "data": "192.0.2.1"}]},
+                              scheduler=FloodScheduler(fallback_delay=0.0))
+
+
+def test_classify():
+    assert classify(None) == RETRYABLE
+    assert classify(KasResponse(fault_string="flood_protection")) == RETRYABLE
+    assert classify(KasResponse(fault_string="record already exists")) == IDEMPOTENT
+    assert classify(KasResponse(fault_string="record_id_not_found")) == PERMANENT
+
+
+def test_auth_failed_is_not_retried():
+    response = KasResponse(fault_code=AUTH_FAILED, fault_string="kas_password_incorrect, try again")
+    policy = RetryPolicy(sleep=lambda delay: None)
+
+    result, attempts = policy.run(lambda: response)
+
+    assert classify(response) == PERMANENT
+    assert (result, attempts) == (response, 1)
+    assert policy.retries == 0
+
+
+def test_delete_not_found_after_retry_is_success():
+    transport = _transport(lose="delete_dns_settings")
+    client = _client(transport)
+    record_id = client.get_dns_records(ZONE)[0]["id"]
+
+    success, message = client.delete_dns_record(record_id, ZONE)
+
+    assert (success, message) == (True, "Bereits gelöscht")
+    assert transport.calls.count("delete_dns_settings") == 2
+    assert client.get_dns_records(ZONE) == []
+
+
+def test_delete_not_found_on_first_attempt_fails():
+    client = _client(_transport())
+
+    success, message = client.delete_dns_record("999", ZONE)
+
+    assert not success
+    assert "not_found" in message
+
+
+def test_add_after_lost_reply_is_idempotent():
+    transport = _transport(lose="add_dns_settings")
+    client = _client(transport)
+
+    success, _ = client.add_dns_record(ZONE, "notstromaggregat", "CNAME", "example.net.")
+
+    assert success
+    assert transport.calls.count("add_dns_settings") == 2
+    assert len(client.get_dns_records(ZONE)) == 2
@@ -0,0 +1,54 @@
+"""Zonendatei-Roundtrip: format_zone → parse_zone → plan_zone ohne Änderungen"""
+
+from kas.reconcile import plan_zone
+from kas.zone import DnsRecord, Zone
+from kas.zonefile import format_zone, parse_zone
+
+ZONE = "baltic-ihub.com"
+
+
+def _roundtrip(records):
+    parsed, _ = parse_zone(format_zone(ZONE, records), ZONE)
+    return parsed
+
+
+def test_hostnames_stay_absolute():
+    desired = [
+        DnsRecord("notstromaggregat", "CNAME", "7c6be46a197dc3f0.vercel-dns-017.com"),
+        DnsRecord("backup-generator", "CNAME", "7c6be46a197dc3f0.vercel-dns-017.com."),
+        DnsRecord("", "MX", "mx.example.net", aux="10"),
+        DnsRecord("", "NS", "ns5.kasserver.com"),
+        DnsRecord("_sip._tcp", "SRV", "5 5060 sip.example.net", aux="10"),
+    ]
+    parsed = _roundtrip(desired)
+
+    assert plan_zone(ZONE, desired, Zone(ZONE, parsed)) == []
+    assert {record.data for record in parsed if record.type == "CNAME"} == \
+        {"7c6be46a197dc3f0.vercel-dns-017.com."}
+
+
+def test_txt_strings_are_kept():
+    long_value = "v=DKIM1; k=rsa; p=" + "A" * 400
+    desired = [
+        DnsRecord("", "TXT", "v=spf1 include:spf.kasserver.com -all"),
+        DnsRecord("kas._domainkey", "TXT", long_value),
+        DnsRecord("multi", "TXT", '"first string" "second \\"quoted\\" string"'),
+    ]
+    parsed = _roundtrip(desired)
+
+    assert plan_zone(ZONE, desired, Zone(ZONE, parsed)) == []
+    by_name = {record.name: record.data for record in parsed}
+    assert by_name[""] == "v=spf1 include:spf.kasserver.com -all"
+    assert by_name["multi"] == '"first string" "second \\"quoted\\" string"'
+
+
+def test_second_roundtrip_is_stable():
+    desired = [
+        DnsRecord("www", "CNAME", "example.net"),
+        DnsRecord("multi", "TXT", '"a" "b"'),
+        DnsRecord("", "A", "192.0.2.1", ttl=300),
+    ]
+    first = format_zone(ZONE, _roundtrip(desired))
+    second = format_zone(ZONE, parse_zone(first, ZONE)[0])
+
+    assert first == second
@@ -0,0 +1,351 @@
+"""
+Transporte für KAS-Aufrufe
+
+Ein Transport nimmt eine KAS-Aktion (add_dns_settings, get_dns_settings, ...)
+mit ihren Parametern entgegen und liefert eine KasResponse. Wie der Aufruf
+beim KAS ankommt, ist Sache des Transports:
+
+- SoapTransport:    SOAP direkt an kasapi.kasserver.com (Session-Token, Flood-Delay)
+- McpHubTransport:  JSON-RPC an den MCP Hub, mehrere Aufrufe als ein Batch (kas.mcp)
+- StubTransport:    Zonen im Speicher, ganz ohne Netzwerk (Tests, Trockenläufe)
+
+Der KasClient baut darauf die Operationen (Einträge anlegen, löschen, Zone
+lesen) samt Cache und Auswertung der Antworten nur einmal auf.
+"""
+
+import itertools
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .auth import DEFAULT_SESSION_LIFETIME, KAS_AUTH_URL, KasAuthenticator, is_session_fault
+from .parser import KasResponse, parse_response
+from .retry import AUTH_FAILED
+from .scheduler import FloodScheduler
+
+# All-Inkl KAS API Endpoint (über KAS_API_URL z.B. auf kas.fakeserver umlenkbar)
+KAS_API_URL = os.getenv("KAS_API_URL", "https://kasapi.kasserver.com/soap/KasApi.php")
+
+DEFAULT_TIMEOUT = 60
+DEFAULT_POOL_SIZE = 4
+
+SOAP_HEADERS = {
+    "Content-Type": "text/xml; charset=utf-8",
+    "SOAPAction": "https://kasserver.com/#KasApi"
+}
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Erstelle eine Session mit Keep-Alive und festem Connection-Pool"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_soap_request(kas_user: str, kas_auth_data: str, action: str, params: Dict,
+                        kas_auth_type: str = "plain") -> str:
+    """Erstelle SOAP Request - exakt wie im MCP Hub
+
+    kas_auth_data ist je nach kas_auth_type das Passwort ("plain") oder
+    ein Session-Token ("session").
+    """
+    request_params = {
+        "kas_login": kas_user,
+        "kas_auth_type": kas_auth_type,
+        "kas_auth_data": kas_auth_data,
+        "kas_action": action,
+        "KasRequestParams": params
+    }
+
+    params_json = json.dumps(request_params)
+
+    soap_envelope = f'''<?xml version="1.0" encoding="UTF-8"?>
+<SOAP-ENV:Envelope
+    xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:ns1="https://kasserver.com/"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+    SOAP-ENV:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">
+  <SOAP-ENV:Body>
+    <ns1:KasApi>
+      <Params xsi:type="xsd:string">{params_json}</Params>
+    </ns1:KasApi>
+  </SOAP-ENV:Body>
+</SOAP-ENV:Envelope>'''
+
+    return soap_envelope
+
+
+class Transport:
+    """Schnittstelle aller Transporte
+
+    call() führt eine Aktion aus und gibt die Antwort oder None (Netzwerk-
+    fehler) zurück. call_many() führt mehrere Aktionen aus; Transporte mit
+    Batch-Unterstützung überschreiben es und setzen batch = True. Jeder Transport hat einen
+    FloodScheduler, der die Aufrufe zählt und ggf. Pausen einhält.
+    """
+
+    name = "transport"
+    # True, wenn call_many() mehrere Aufrufe in einem Request verschickt
+    batch = False
+
+    def __init__(self, scheduler: Optional[FloodScheduler] = None):
+        self.scheduler = scheduler or FloodScheduler(fallback_delay=0.0)
+        self._io = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Schließe offene Verbindungen"""
+
+    def call(self, action: str, params: Dict,
+             timeout: Optional[float] = None) -> Optional[KasResponse]:
+        raise NotImplementedError
+
+    def _account(self, sent: int = 0, received: int = 0, flood_wait: float = 0.0):
+        """Zähle Bytes und Flood-Wartezeit für den laufenden Aufruf (pro Thread)"""
+        io = self._io
+        io.sent = getattr(io, "sent", 0) + sent
+        io.received = getattr(io, "received", 0) + received
+        io.flood_wait = getattr(io, "flood_wait", 0.0) + flood_wait
+
+    def take_io(self) -> tuple[int, int, float]:
+        """Bytes gesendet/empfangen und Flood-Wartezeit seit dem letzten take_io()"""
+        io = self._io
+        result = (getattr(io, "sent", 0), getattr(io, "received", 0),
+                  getattr(io, "flood_wait", 0.0))
+        io.sent, io.received, io.flood_wait = 0, 0, 0.0
+        return result
+
+    def call_many(self, calls: List[tuple]) -> List[Optional[KasResponse]]:
+        """Führe mehrere (action, params) aus, Ergebnis in derselben Reihenfolge"""
+        return [self.call(action, params) for action, params in calls]
+
+
+class SoapTransport(Transport):
+    """SOAP direkt an die KAS API
+
+    Hält eine einzige HTTP-Session offen; mehrere Aufrufe teilen sich den
+    Connection-Pool. Standardmäßig wird einmal ein Session-Token geholt und
+    statt des Passworts mitgeschickt (use_session_token=False schaltet auf
+    kas_auth_type "plain" zurück). Zwischen zwei Aufrufen wartet der
+    FloodScheduler genau den von KAS gemeldeten KasFloodDelay ab.
+    """
+
+    name = "kas"
+
+    def __init__(self, kas_user: str, kas_password: str,
+                 api_url: str = KAS_API_URL,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 use_session_token: bool = True,
+                 session_lifetime: int = DEFAULT_SESSION_LIFETIME,
+                 scheduler: Optional[FloodScheduler] = None,
+                 auth_url: str = KAS_AUTH_URL):
+        super().__init__(scheduler or FloodScheduler())
+        self.kas_user = kas_user
+        self.kas_password = kas_password
+        self.api_url = api_url
+        self.timeout = timeout
+        self.session = create_session(pool_size)
+        self.session.headers.update(SOAP_HEADERS)
+        self.auth = None
+        if use_session_token:
+            self.auth = KasAuthenticator(kas_user, kas_password, self.session,
+                                         auth_url=auth_url,
+                                         session_lifetime=session_lifetime,
+                                         timeout=timeout)
+
+    def close(self):
+        self.session.close()
+
+    def call(self, action: str, params: Dict,
+             timeout: Optional[float] = None) -> Optional[KasResponse]:
+        """Rufe All-Inkl KAS API auf, gibt die geparste Antwort oder None zurück
+
+        Ist das Session-Token abgelaufen, wird es einmal erneuert und der
+        Aufruf wiederholt.
+        """
+        response = self._post(action, params, timeout)
+
+        if response is not None and self.auth is not None:
+            if (response.fault_string and response.fault_code != AUTH_FAILED
+                    and is_session_fault(response.fault_string)):
+                self.auth.invalidate()
+                response = self._post(action, params, timeout)
+            elif response.fault_string is None:
+                self.auth.touch()
+
+        return response
+
+    def _post(self, action: str, params: Dict,
+              timeout: Optional[float]) -> Optional[KasResponse]:
+        """Sende einen einzelnen SOAP-Request im nächsten freien Flood-Slot"""
+        with self.scheduler.slot() as slot:
+            self._account(flood_wait=slot.last_wait)
+            response = None
+            try:
+                response = self._send(action, params, timeout)
+            finally:
+                self.scheduler.record(response)
+            return response
+
+    def _send(self, action: str, params: Dict,
+              timeout: Optional[float]) -> Optional[KasResponse]:
+        if self.auth is not None:
+            token = self.auth.get_token()
+            if token is None:
+                if self.auth.last_fault is None:
+                    return None
+                # KasAuth hat abgelehnt: als Fault melden, damit nicht wiederholt wird
+                return KasResponse(fault_code=AUTH_FAILED,
+                                   fault_string=f"{AUTH_FAILED}: {self.auth.last_fault}")
+            soap_envelope = create_soap_request(self.kas_user, token, action, params,
+                                                kas_auth_type="session")
+        else:
+            soap_envelope = create_soap_request(self.kas_user, self.kas_password, action, params)
+
+        data = soap_envelope.encode("utf-8")
+        self.scheduler.sent()
+        try:
+            response = self.session.post(
+                self.api_url,
+                data=data,
+                timeout=timeout or self.timeout
+            )
+            self._account(sent=len(data), received=len(response.content))
+            # KAS meldet Faults mit HTTP 500, der Body ist trotzdem auswertbar
+            if response.status_code != 500:
+                response.raise_for_status()
+            return parse_response(response.content)
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Fehler beim API-Aufruf: {e}")
+            return None
+
+
+class StubTransport(Transport):
+    """KAS-Verhalten mit Zonen im Speicher, ohne Netzwerk
+
+    zones: {zone_host: [Record-Dicts]} als Anfangszustand. Unbekannte Zonen
+    werden wie bei KAS mit einem Fault beantwortet; flood_delay wird als
+    KasFloodDelay zurückgemeldet (und vom Scheduler eingehalten).
+    """
+
+    name = "stub"
+
+    def __init__(self, zones: Optional[Dict[str, List[Dict]]] = None,
+                 flood_delay: float = 0.0,
+                 scheduler: Optional[FloodScheduler] = None):
+        super().__init__(scheduler)
+        self.flood_delay = flood_delay
+        self.zones: Dict[str, Dict[str, Dict]] = {}
+        # Indizes, damit Duplikat-Prüfung und Suche nach record_id O(1) sind
+        self._contents: Dict[str, set] = {}
+        self._zone_of: Dict[str, str] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        for zone_host, records in (zones or {}).items():
+            self.add_zone(zone_host, records)
+
+    def add_zone(self, zone_host: str, records: List[Dict] = ()):
+        """Lege eine Zone mit Einträgen ({name, type, data, aux} oder record_*) an"""
+        zone_host = zone_host.rstrip(".").lower()
+        self.zones.setdefault(zone_host, {})
+        self._contents.setdefault(zone_host, set())
+        for record in records:
+            self._store(zone_host, {
+                "record_name": record.get("name", record.get("record_name", "")),
+                "record_type": record.get("type", record.get("record_type", "")).upper(),
+                "record_data": record.get("data", record.get("record_data", "")),
+                "record_aux": str(record.get("aux", record.get("record_aux", "0"))),
+            })
+
+    @staticmethod
+    def _content(record: Dict) -> tuple:
+        return (record["record_name"], record["record_type"],
+                record["record_data"], record["record_aux"])
+
+    def _store(self, zone_host: str, record: Dict) -> str:
+        record_id = str(next(self._ids))
+        record["record_id"] = record_id
+        self.zones[zone_host][record_id] = record
+        self._contents[zone_host].add(self._content(record))
+        self._zone_of[record_id] = zone_host
+        return record_id
+
+    def call(self, action: str, params: Dict,
+             timeout: Optional[float] = None) -> Optional[KasResponse]:
+        with self.scheduler.slot() as slot:
+            self._account(flood_wait=slot.last_wait)
+            response = self.handle(action, params)
+            self.scheduler.record(response)
+        return response
+
+    def _reply(self, return_info=None) -> KasResponse:
+        return KasResponse({"Response": {
+            "KasFloodDelay": self.flood_delay,
+            "ReturnString": "TRUE",
+            "ReturnInfo": return_info
+        }})
+
+    @staticmethod
+    def _fault(fault_string: str) -> KasResponse:
+        return KasResponse(fault_code="SOAP-ENV:Server", fault_string=fault_string)
+
+    def handle(self, action: str, params: Dict) -> KasResponse:
+        """Führe eine Aktion auf den Zonen aus (ohne Scheduler, threadsicher)"""
+        with self._lock:
+            return self._handle(action, params)
+
+    def _handle(self, action: str, params: Dict) -> KasResponse:
+        if action == "get_dns_settings":
+            zone = self.zones.get(params.get("zone_host", "").rstrip(".").lower())
+            if zone is None:
+                return self._fault("zone_not_found")
+            return self._reply([dict(record) for record in zone.values()])
+
+        if action == "add_dns_settings":
+            zone_host = params.get("zone_host", "").rstrip(".").lower()
+            if zone_host not in self.zones:
+                return self._fault("zone_not_found")
+            record = {
+                "record_name": params.get("record_name", ""),
+                "record_type": params.get("record_type", "").upper(),
+                "record_data": params.get("record_data", ""),
+                "record_aux": str(params.get("record_aux", "0")),
+            }
+            if self._content(record) in self._contents[zone_host]:
+                return self._fault("record already exists")
+            return self._reply(self._store(zone_host, record))
+
+        if action in ("delete_dns_settings", "update_dns_settings"):
+            record_id = str(params.get("record_id", ""))
+            zone_host = self._zone_of.get(record_id)
+            if zone_host is None:
+                return self._fault("record_id_not_found")
+            record = self.zones[zone_host][record_id]
+            self._contents[zone_host].discard(self._content(record))
+            if action == "delete_dns_settings":
+                del self.zones[zone_host][record_id]
+                del self._zone_of[record_id]
+            else:
+                record.update({
+                    key: str(params[key]) for key in
+                    ("record_name", "record_type", "record_data", "record_aux")
+                    if key in params
+                })
+                record["record_type"] = record["record_type"].upper()
+                self._contents[zone_host].add(self._content(record))
+            return self._reply()
+
+        return self._fault(f"unknown_action: {action}")
@@ -0,0 +1,282 @@
+"""
+Prüfung der DNS-Propagation nach einer Änderung
+
+Für jeden geänderten Namen werden mehrere Resolver parallel abgefragt, bis
+der erwartete A/AAAA/CNAME-Wert zu sehen ist. Die Abfrage wird mit
+wachsendem Abstand (Backoff) wiederholt; am Ende steht pro Resolver, nach
+wie vielen Sekunden der Eintrag sichtbar war.
+
+Die DNS-Abfragen laufen direkt per UDP (nur Standardbibliothek). Für Tests
+ohne Netzwerk gibt es den StubResolver; ein lokaler DNS-Server lässt sich
+als --resolver 127.0.0.1:5353 angeben.
+
+Aufruf (aus scripts/):
+
+    python3 -m kas verify dns_zones.json
+    python3 -m kas verify dns_zones.json --resolver 1.1.1.1 --resolver 8.8.8.8 --timeout 600
+    python3 -m kas verify dns_zones.json --stub          # Probelauf ohne Netzwerk
+"""
+
+import itertools
+import random
+import socket
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from .client import DEFAULT_NAMESERVER
+from .zone import DnsRecord
+
+# Öffentliche Resolver plus der autoritative KAS-Nameserver
+DEFAULT_RESOLVERS = ("1.1.1.1", "8.8.8.8", "9.9.9.9", DEFAULT_NAMESERVER)
+
+RECORD_TYPES = {"A": 1, "NS": 2, "CNAME": 5, "AAAA": 28}
+TYPE_NAMES = {number: name for name, number in RECORD_TYPES.items()}
+
+DEFAULT_TIMEOUT = 3600
+DEFAULT_BASE_INTERVAL = 5.0
+DEFAULT_MAX_INTERVAL = 60.0
+QUERY_TIMEOUT = 3.0
+
+
+def normalize_host(value: str) -> str:
+    """Hostnamen ohne abschließenden Punkt, klein"""
+    return value.rstrip(".").lower()
+
+
+def build_query(name: str, record_type: str, query_id: int) -> bytes:
+    """DNS-Anfrage (RD gesetzt) für einen Namen und Typ"""
+    header = struct.pack(">HHHHHH", query_id, 0x0100, 1, 0, 0, 0)
+    qname = b"".join(bytes([len(label)]) + label.encode("idna")
+                     for label in normalize_host(name).split(".") if label) + b"\x00"
+    return header + qname + struct.pack(">HH", RECORD_TYPES[record_type], 1)
+
+
+def _read_name(data: bytes, offset: int) -> tuple[str, int]:
+    """Lies einen (ggf. komprimierten) Namen, gibt Name und Offset danach zurück"""
+    labels = []
+    end = None
+    for _ in range(128):
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            continue
+        offset += 1
+        if length == 0:
+            break
+        labels.append(data[offset:offset + length].decode("ascii", "replace"))
+        offset += length
+    return ".".join(labels), end if end is not None else offset
+
+
+def parse_answers(data: bytes, query_id: int) -> Optional[List[tuple]]:
+    """Antworten als [(typ, wert)], None bei fremder ID oder Fehler-Rcode"""
+    if len(data) < 12:
+        return None
+    response_id, flags, qdcount, ancount = struct.unpack(">HHHH", data[:8])
+    if response_id != query_id:
+        return None
+    rcode = flags & 0x000F
+    if rcode == 3:
+        return []  # NXDOMAIN: (noch) nicht vorhanden
+    if rcode != 0:
+        return None
+
+    offset = 12
+    for _ in range(qdcount):
+        _, offset = _read_name(data, offset)
+        offset += 4
+
+    answers = []
+    for _ in range(ancount):
+        _, offset = _read_name(data, offset)
+        rtype, _, _, rdlength = struct.unpack(">HHIH", data[offset:offset + 10])
+        offset += 10
+        rdata = data[offset:offset + rdlength]
+        if rtype == RECORD_TYPES["A"] and rdlength == 4:
+            answers.append(("A", socket.inet_ntop(socket.AF_INET, rdata)))
+        elif rtype == RECORD_TYPES["AAAA"] and rdlength == 16:
+            answers.append(("AAAA", socket.inet_ntop(socket.AF_INET6, rdata)))
+        elif rtype in (RECORD_TYPES["CNAME"], RECORD_TYPES["NS"]):
+            answers.append((TYPE_NAMES[rtype], _read_name(data, offset)[0]))
+        offset += rdlength
+    return answers
+
+
+class UdpResolver:
+    """Fragt einen DNS-Server per UDP (host oder host:port)"""
+
+    def __init__(self, address: str, timeout: float = QUERY_TIMEOUT):
+        host, _, port = address.rpartition(":") if address.count(":") == 1 else (address, "", "")
+        self.label = address
+        self.host = host
+        self.port = int(port) if port else 53
+        self.timeout = timeout
+        self._ids = itertools.count(random.randrange(1, 0xFFFF))
+        self._ids_lock = threading.Lock()
+
+    def resolve(self, name: str, record_type: str) -> Optional[List[tuple]]:
+        """Antworten für name/typ, None wenn der Server nicht (sinnvoll) antwortet"""
+        with self._ids_lock:
+            query_id = next(self._ids) & 0xFFFF
+        try:
+            info = socket.getaddrinfo(self.host, self.port, type=socket.SOCK_DGRAM)[0]
+            with socket.socket(info[0], socket.SOCK_DGRAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.sendto(build_query(name, record_type, query_id), info[4])
+                data, _ = sock.recvfrom(4096)
+        except OSError:
+            return None
+        try:
+            return parse_answers(data, query_id)
+        except (IndexError, struct.error):
+            return None  # kaputtes Paket zählt wie keine Antwort
+
+
+class StubResolver:
+    """Resolver im Speicher: records werden nach visible_after Sekunden sichtbar
+
+    records: {(name, typ): [werte]}. Damit lässt sich das Verhalten des
+    Verifiers ohne Netzwerk (und mit künstlicher Verzögerung) prüfen.
+    """
+
+    def __init__(self, label: str, records: Dict[tuple, List[str]],
+                 visible_after: float = 0.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.label = label
+        self.records = {(normalize_host(name), rtype): values
+                        for (name, rtype), values in records.items()}
+        self._clock = clock
+        self._visible_at = clock() + visible_after
+
+    def resolve(self, name: str, record_type: str) -> Optional[List[tuple]]:
+        if self._clock() < self._visible_at:
+            return []
+        return [(record_type, value)
+                for value in self.records.get((normalize_host(name), record_type), [])]
+
+
+class Expectation:
+    """Ein Name, der einen bestimmten Wert liefern soll"""
+
+    def __init__(self, fqdn: str, record_type: str, value: str):
+        self.fqdn = normalize_host(fqdn)
+        self.type = record_type.upper()
+        self.value = value
+
+    @classmethod
+    def from_record(cls, zone_host: str, record: DnsRecord) -> "Expectation":
+        fqdn = f"{record.name}.{zone_host}" if record.name else zone_host
+        return cls(fqdn, record.type, record.data)
+
+    def matches(self, answers: Optional[List[tuple]]) -> bool:
+        if not answers:
+            return False
+        if self.type == "CNAME":
+            expected = normalize_host(self.value)
+            return any(rtype == "CNAME" and normalize_host(value) == expected
+                       for rtype, value in answers)
+        return any(rtype == self.type and value == self.value for rtype, value in answers)
+
+    def __repr__(self):
+        return f"{self.fqdn} {self.type} {self.value}"
+
+
+class PropagationResult:
+    """Ergebnis für einen Namen bei einem Resolver"""
+
+    def __init__(self, expectation: Expectation, resolver: str, seen: bool,
+                 elapsed: float, attempts: int, last_answers: Optional[List[tuple]]):
+        self.expectation = expectation
+        self.resolver = resolver
+        self.seen = seen
+        self.elapsed = elapsed
+        self.attempts = attempts
+        self.last_answers = last_answers
+
+    def describe(self) -> str:
+        if self.seen:
+            return f"✅ {self.resolver:<20} nach {self.elapsed:6.1f}s ({self.attempts} Abfrage(n))"
+        last = ", ".join(f"{t} {v}" for t, v in self.last_answers or []) or "keine Antwort"
+        return f"❌ {self.resolver:<20} nicht gesehen nach {self.elapsed:.0f}s (zuletzt: {last})"
+
+
+class PropagationVerifier:
+    """Fragt alle Resolver für alle Namen parallel ab, mit Backoff pro Paar"""
+
+    def __init__(self, resolvers: List, timeout: float = DEFAULT_TIMEOUT,
+                 base_interval: float = DEFAULT_BASE_INTERVAL,
+                 max_interval: float = DEFAULT_MAX_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.resolvers = resolvers
+        self.timeout = timeout
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self._clock = clock
+        self._sleep = sleep
+
+    def _poll(self, resolver, expectation: Expectation, started: float) -> PropagationResult:
+        deadline = started + self.timeout
+        interval = self.base_interval
+        attempts = 0
+        while True:
+            answers = resolver.resolve(expectation.fqdn, expectation.type)
+            attempts += 1
+            now = self._clock()
+            if expectation.matches(answers):
+                return PropagationResult(expectation, resolver.label, True,
+                                         now - started, attempts, answers)
+            if now + interval > deadline:
+                return PropagationResult(expectation, resolver.label, False,
+                                         now - started, attempts, answers)
+            self._sleep(interval)
+            interval = min(self.max_interval, interval * 2)
+
+    def verify(self, expectations: List[Expectation]) -> List[PropagationResult]:
+        """Warte, bis alle Namen bei allen Resolvern sichtbar sind (oder Timeout)"""
+        pairs = [(resolver, expectation) for expectation in expectations
+                 for resolver in self.resolvers]
+        if not pairs:
+            return []
+        started = self._clock()
+        with ThreadPoolExecutor(max_workers=min(32, len(pairs)),
+                                thread_name_prefix="dns-verify") as pool:
+            futures = [pool.submit(self._poll, resolver, expectation, started)
+                       for resolver, expectation in pairs]
+            return [future.result() for future in futures]
+
+
+def expectations_from_state(state: Dict[str, List[DnsRecord]]) -> List[Expectation]:
+    """Prüfbare Einträge (A/AAAA/CNAME) aus dem gewünschten Zustand"""
+    return [Expectation.from_record(zone_host, record)
+            for zone_host, records in state.items()
+            for record in records if record.type in ("A", "AAAA", "CNAME")]
+
+
+def stub_resolvers(expectations: List[Expectation], labels: List[str],
+                   step: float = 1.0) -> List[StubResolver]:
+    """Stub pro Resolver-Name, der i-te wird erst nach i * step Sekunden konsistent"""
+    records: Dict[tuple, List[str]] = {}
+    for expectation in expectations:
+        records.setdefault((expectation.fqdn, expectation.type), []).append(expectation.value)
+    return [StubResolver(f"stub:{label}", records, visible_after=index * step)
+            for index, label in enumerate(labels)]
+
+
+def print_report(results: List[PropagationResult]):
+    """Ausgabe gruppiert nach Namen"""
+    by_name: Dict[str, List[PropagationResult]] = {}
+    for result in results:
+        by_name.setdefault(repr(result.expectation), []).append(result)
+    for name, name_results in by_name.items():
+        print(f"🌐 {name}")
+        for result in name_results:
+            print(f"  {result.describe()}")
+        if all(result.seen for result in name_results):
+            print(f"  ⏱️  Überall sichtbar nach {max(r.elapsed for r in name_results):.1f}s")
+        print()
@@ -0,0 +1,186 @@
+"""
+Indiziertes In-Memory-Modell einer DNS-Zone
+
+Einträge liegen als kompakte DnsRecord-Objekte (__slots__) vor und sind
+zusätzlich nach (name, type), nach name und nach record_id indiziert. Damit
+brauchen Abgleich, Löschen und Prüfen für jede Subdomain nur einen
+Dictionary-Zugriff statt eines Durchlaufs über alle Einträge.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Typen, deren record_data ein Hostname ist (abschließender Punkt optional)
+HOSTNAME_TYPES = frozenset({"CNAME", "MX", "NS", "SRV"})
+
+_TXT_STRINGS = re.compile(r'\s*"((?:[^"\\]|\\.)*)"')
+
+
+def txt_value(data: str) -> str:
+    """Wert eines TXT-Eintrags: mehrere Strings ("v=spf1 ..." "...") werden verbunden
+
+    So entspricht ein in 255-Zeichen-Stücke geteilter Eintrag (Zonendatei)
+    demselben Eintrag als ein String (KAS). Ungequotete Daten bleiben unverändert.
+    """
+    strings = []
+    position = 0
+    for match in _TXT_STRINGS.finditer(data):
+        if match.start() != position:
+            return data
+        strings.append(match.group(1).replace('\\"', '"'))
+        position = match.end()
+    if not strings or data[position:].strip():
+        return data
+    return "".join(strings)
+
+
+class DnsRecord:
+    """Ein DNS-Eintrag, unabhängig vom Provider
+
+    name ist relativ zur Zone ("" für die Zone selbst), aux die Priorität
+    (MX/SRV), ttl optional (nicht jeder Provider kennt TTLs pro Eintrag;
+    beim Abgleich wird sie nicht verglichen). record_id vergibt der
+    Provider, None solange der Eintrag nur gewünscht ist.
+    """
+
+    __slots__ = ("record_id", "name", "type", "data", "aux", "ttl")
+
+    def __init__(self, name: str, type: str, data: str, aux: str = "0",
+                 record_id: Optional[str] = None, ttl: Optional[int] = None):
+        self.name = name.lower()
+        self.type = type.upper()
+        self.data = data.strip()
+        self.aux = str(aux) if aux not in (None, "") else "0"
+        self.record_id = str(record_id) if record_id is not None else None
+        self.ttl = int(ttl) if ttl not in (None, "") else None
+
+    @classmethod
+    def from_dict(cls, record: Dict) -> "DnsRecord":
+        """Erstelle einen Eintrag aus API-Dict ({id, name, ...}) oder Datei ({record_name, ...})"""
+        return cls(
+            name=str(record.get("name", record.get("record_name", ""))),
+            type=str(record.get("type", record.get("record_type", ""))),
+            data=str(record.get("data", record.get("record_data", ""))),
+            aux=str(record.get("aux", record.get("record_aux", "0"))),
+            record_id=record.get("id", record.get("record_id")),
+            ttl=record.get("ttl", record.get("record_ttl"))
+        )
+
+    def to_dict(self) -> Dict:
+        """Dict im Format von KasResponse.records (ttl nur, wenn gesetzt)"""
+        record = {"id": self.record_id, "name": self.name, "type": self.type,
+                  "data": self.data, "aux": self.aux}
+        if self.ttl is not None:
+            record["ttl"] = self.ttl
+        return record
+
+    @property
+    def priority(self) -> int:
+        """aux als Zahl (MX/SRV-Priorität)"""
+        try:
+            return int(self.aux)
+        except ValueError:
+            return 0
+
+    @property
+    def key(self) -> tuple:
+        return self.name, self.type
+
+    @property
+    def content(self) -> tuple:
+        """Vergleichsschlüssel für den Inhalt (Hostnamen ohne Punkt, klein; TXT verbunden)"""
+        data = self.data
+        if self.type in HOSTNAME_TYPES:
+            data = data.rstrip(".").lower()
+        elif self.type == "TXT":
+            data = txt_value(data)
+        return self.type, data, self.aux
+
+    def __eq__(self, other):
+        if not isinstance(other, DnsRecord):
+            return NotImplemented
+        return (self.record_id, self.name, self.content) == \
+               (other.record_id, other.name, other.content)
+
+    def __hash__(self):
+        return hash((self.record_id, self.name, self.content))
+
+    def __repr__(self):
+        return (f"DnsRecord({self.name!r}, {self.type!r}, {self.data!r}, "
+                f"aux={self.aux!r}, record_id={self.record_id!r}, ttl={self.ttl!r})")
+
+
+class Zone:
+    """Alle Einträge einer Zone mit Indizes für O(1)-Zugriffe"""
+
+    def __init__(self, zone_host: str, records: Iterable[DnsRecord] = ()):
+        self.zone_host = zone_host.rstrip(".")
+        self._by_id: Dict[str, DnsRecord] = {}
+        self._by_key: Dict[tuple, List[DnsRecord]] = {}
+        self._by_name: Dict[str, List[DnsRecord]] = {}
+        self._unsaved: List[DnsRecord] = []
+        for record in records:
+            self.add(record)
+
+    @classmethod
+    def from_records(cls, zone_host: str, records: Iterable[Dict]) -> "Zone":
+        """Baue eine Zone aus Record-Dicts (API, Cache oder Datei)"""
+        return cls(zone_host, (DnsRecord.from_dict(record) for record in records))
+
+    def __len__(self):
+        return len(self._by_id) + len(self._unsaved)
+
+    def __iter__(self) -> Iterator[DnsRecord]:
+        for records in self._by_name.values():
+            yield from records
+
+    def __contains__(self, record_id: str) -> bool:
+        return str(record_id) in self._by_id
+
+    def add(self, record: DnsRecord):
+        """Nimm einen Eintrag in alle Indizes auf"""
+        if record.record_id is not None:
+            previous = self._by_id.get(record.record_id)
+            if previous is not None:
+                self.remove(previous.record_id)
+            self._by_id[record.record_id] = record
+        else:
+            self._unsaved.append(record)
+        self._by_key.setdefault(record.key, []).append(record)
+        self._by_name.setdefault(record.name, []).append(record)
+
+    def remove(self, record_id: str) -> Optional[DnsRecord]:
+        """Entferne einen Eintrag anhand der record_id"""
+        record = self._by_id.pop(str(record_id), None)
+        if record is None:
+            return None
+        self._discard(self._by_key, record.key, record)
+        self._discard(self._by_name, record.name, record)
+        return record
+
+    @staticmethod
+    def _discard(index: Dict, key, record: DnsRecord):
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket[:] = [r for r in bucket if r is not record]
+        if not bucket:
+            del index[key]
+
+    def get(self, record_id: str) -> Optional[DnsRecord]:
+        """Eintrag zu einer record_id"""
+        return self._by_id.get(str(record_id))
+
+    def find(self, name: str, type: Optional[str] = None) -> List[DnsRecord]:
+        """Alle Einträge eines Namens, optional nur eines Typs"""
+        if type is None:
+            return list(self._by_name.get(name.lower(), ()))
+        return list(self._by_key.get((name.lower(), type.upper()), ()))
+
+    def names(self) -> List[str]:
+        """Alle Namen der Zone"""
+        return list(self._by_name)
+
+    def to_records(self) -> List[Dict]:
+        """Alle Einträge als Dicts (z.B. für den Cache)"""
+        return [record.to_dict() for record in self]
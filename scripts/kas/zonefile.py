@@ -0,0 +1,353 @@
+"""
+Zonendateien nach RFC 1035 als DNS-Backend (ohne Netzwerk)
+
+Jede Zone liegt als <verzeichnis>/<zone>.zone im Master-File-Format:
+
+    $ORIGIN baltic-ihub.com.
+    $TTL 3600
+    @                 IN SOA   ns5.kasserver.com. hostmaster.baltic-ihub.com. (
+                               2026011301 7200 1800 1209600 3600 )
+    notstromaggregat  IN CNAME 7c6be46a197dc3f0.vercel-dns-017.com.
+
+Unterstützt werden $ORIGIN, $TTL, Kommentare, Klammern über mehrere
+Zeilen, leere Owner (= vorheriger Name), TTL/Klasse in beliebiger
+Reihenfolge und relative Namen. Beim Schreiben wird die SOA-Serial erhöht
+und die Datei atomar ersetzt. Damit lässt sich der komplette Abgleich
+offline testen:
+
+    python3 -m kas --provider zonefile --zone-dir zones plan dns_zones.json
+"""
+
+import os
+import re
+import tempfile
+import threading
+from datetime import date
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .executor import DEFAULT_MAX_WORKERS
+from .provider import Capabilities, Driver
+from .zone import DnsRecord, Zone, txt_value
+
+DEFAULT_TTL = 3600
+ZONE_SUFFIX = ".zone"
+
+CLASSES = {"IN", "CH", "HS", "CS"}
+# Typen, deren RDATA (bzw. letztes Feld) ein Hostname ist
+HOSTNAME_RDATA = {"CNAME", "NS", "PTR", "DNAME"}
+
+_TTL_PATTERN = re.compile(r"^(\d+[smhdw]?)+$", re.IGNORECASE)
+_TTL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_ttl(value: str) -> int:
+    """TTL wie 3600, 1h oder 1h30m in Sekunden"""
+    total = 0
+    for number, unit in re.findall(r"(\d+)([smhdw]?)", value.lower()):
+        total += int(number) * _TTL_UNITS.get(unit, 1)
+    return total
+
+
+def _is_ttl(token: str) -> bool:
+    return bool(_TTL_PATTERN.match(token))
+
+
+def _tokenize(text: str) -> Iterator[tuple[bool, List[str]]]:
+    """Logische Zeilen als (Owner leer?, Tokens); Klammern verbinden Zeilen"""
+    tokens: List[str] = []
+    depth = 0
+    blank_owner = False
+    for line in text.splitlines():
+        if depth == 0:
+            tokens = []
+            blank_owner = line[:1] in (" ", "\t")
+        i = 0
+        while i < len(line):
+            char = line[i]
+            if char == ";":
+                break
+            if char in " \t":
+                i += 1
+            elif char == "(":
+                depth += 1
+                i += 1
+            elif char == ")":
+                depth = max(0, depth - 1)
+                i += 1
+            elif char == '"':
+                j = i + 1
+                while j < len(line) and line[j] != '"':
+                    j += 2 if line[j] == "\\" else 1
+                tokens.append(line[i:j + 1])
+                i = j + 1
+            else:
+                j = i
+                while j < len(line) and line[j] not in ' \t;()"':
+                    j += 1
+                tokens.append(line[i:j])
+                i = j
+        if depth == 0 and tokens:
+            yield blank_owner, tokens
+
+
+def _absolute(name: str, origin: str) -> str:
+    """Name als FQDN mit Punkt am Ende"""
+    if name == "@":
+        return origin + "."
+    if name.endswith("."):
+        return name.lower()
+    return f"{name}.{origin}.".lower()
+
+
+def _relative(fqdn: str, zone_host: str) -> str:
+    """FQDN relativ zur Zone ("" für die Zone selbst)"""
+    name = fqdn.rstrip(".")
+    if name == zone_host:
+        return ""
+    if name.endswith("." + zone_host):
+        return name[:-len(zone_host) - 1]
+    return fqdn
+
+
+def _unquote(token: str) -> str:
+    if len(token) >= 2 and token[0] == token[-1] == '"':
+        return token[1:-1].replace('\\"', '"')
+    return token
+
+
+def parse_zone(text: str, zone_host: str) -> tuple[List[DnsRecord], Optional[int]]:
+    """Einträge und $TTL einer Zonendatei; Namen relativ zu zone_host"""
+    zone_host = zone_host.rstrip(".").lower()
+    origin = zone_host
+    default_ttl = None
+    owner = ""
+    records = []
+
+    for blank_owner, tokens in _tokenize(text):
+        keyword = tokens[0].upper()
+        if keyword == "$ORIGIN":
+            origin = tokens[1].rstrip(".").lower()
+            continue
+        if keyword == "$TTL":
+            default_ttl = parse_ttl(tokens[1])
+            continue
+        if keyword.startswith("$"):
+            continue  # $INCLUDE & Co. werden nicht unterstützt
+
+        if not blank_owner:
+            owner = _relative(_absolute(tokens.pop(0), origin), zone_host)
+        ttl = None
+        while tokens and (tokens[0].upper() in CLASSES or _is_ttl(tokens[0])):
+            token = tokens.pop(0)
+            if token.upper() not in CLASSES:
+                ttl = parse_ttl(token)
+        if not tokens:
+            continue
+        rtype = tokens.pop(0).upper()
+        aux = "0"
+
+        if rtype in HOSTNAME_RDATA and tokens:
+            data = _absolute(tokens[0], origin)
+        elif rtype == "MX" and len(tokens) >= 2:
+            aux, data = tokens[0], _absolute(tokens[1], origin)
+        elif rtype == "SRV" and len(tokens) >= 4:
+            aux = tokens[0]
+            data = f"{tokens[1]} {tokens[2]} {_absolute(tokens[3], origin)}"
+        elif rtype == "SOA" and len(tokens) >= 7:
+            data = " ".join([_absolute(tokens[0], origin), _absolute(tokens[1], origin)]
+                            + tokens[2:7])
+        elif rtype == "TXT" and len(tokens) == 1 and tokens[0].startswith('"'):
+            data = _unquote(tokens[0])
+        elif rtype == "TXT" and all(token.startswith('"') for token in tokens):
+            data = " ".join(tokens)  # mehrere Strings bleiben getrennt (siehe txt_value)
+        else:
+            data = " ".join(tokens)
+
+        records.append(DnsRecord(owner, rtype, data, aux,
+                                 record_id=str(len(records) + 1), ttl=ttl))
+    return records, default_ttl
+
+
+def _quote_txt(data: str) -> str:
+    """TXT-Daten in Strings zu höchstens 255 Zeichen (mehrere Strings bleiben wie sie sind)"""
+    if txt_value(data) != data:
+        return data
+    escaped = data.replace('"', '\\"')
+    chunks = [escaped[i:i + 255] for i in range(0, len(escaped), 255)] or [""]
+    return " ".join(f'"{chunk}"' for chunk in chunks)
+
+
+def _fqdn(name: str) -> str:
+    """Hostname mit Punkt am Ende (KAS und Desired State schreiben ihn ohne)"""
+    return name if name.endswith(".") else name + "."
+
+
+def _rdata(record: DnsRecord) -> str:
+    """RDATA wie parse_zone sie zurückliest: Hostnamen absolut, sonst gilt $ORIGIN"""
+    if record.type in HOSTNAME_RDATA:
+        return _fqdn(record.data)
+    if record.type == "MX":
+        return f"{record.aux} {_fqdn(record.data)}"
+    if record.type == "SRV":
+        fields = record.data.split()
+        if fields:
+            fields[-1] = _fqdn(fields[-1])
+        return f"{record.aux} {' '.join(fields)}"
+    if record.type == "TXT":
+        return _quote_txt(record.data)
+    return record.data
+
+
+def format_zone(zone_host: str, records: List[DnsRecord],
+                default_ttl: Optional[int] = DEFAULT_TTL) -> str:
+    """Zonendatei mit SOA und NS zuerst, danach sortiert nach Name und Typ"""
+    zone_host = zone_host.rstrip(".").lower()
+    order = {"SOA": 0, "NS": 1}
+    lines = [f"$ORIGIN {zone_host}."]
+    if default_ttl is not None:
+        lines.append(f"$TTL {default_ttl}")
+    for record in sorted(records, key=lambda r: (order.get(r.type, 2), r.name, r.type, r.data)):
+        owner = record.name or "@"
+        ttl = str(record.ttl) if record.ttl is not None else ""
+        lines.append(f"{owner:<24} {ttl:>6} IN {record.type:<6} {_rdata(record)}")
+    return "\n".join(lines) + "\n"
+
+
+def bump_serial(records: List[DnsRecord]):
+    """Erhöhe die SOA-Serial (Datumsformat YYYYMMDDnn, wenn schon verwendet)"""
+    for record in records:
+        if record.type != "SOA":
+            continue
+        fields = record.data.split()
+        try:
+            serial = int(fields[2])
+        except (IndexError, ValueError):
+            continue
+        new_serial = serial + 1
+        if serial >= 1990000000:
+            new_serial = max(new_serial, int(date.today().strftime("%Y%m%d")) * 100)
+        fields[2] = str(new_serial)
+        record.data = " ".join(fields)
+
+
+def _same(a: DnsRecord, b: DnsRecord) -> bool:
+    return a.name == b.name and a.content == b.content
+
+
+class ZoneFileDriver(Driver):
+    """Zonen als RFC-1035-Dateien in einem Verzeichnis
+
+    Jede Änderung liest die Datei, ändert sie im Speicher und ersetzt sie
+    atomar; add_records() schreibt alle Einträge einer Zone auf einmal.
+    Zonen sind eigene Dateien und laufen parallel.
+    """
+
+    name = "zonefile"
+
+    def __init__(self, directory: str, suffix: str = ZONE_SUFFIX,
+                 default_ttl: int = DEFAULT_TTL):
+        self.directory = directory
+        self.suffix = suffix
+        self.default_ttl = default_ttl
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self.writes = 0
+
+    @property
+    def capabilities(self) -> Capabilities:
+        return Capabilities(batch=True, max_concurrency=DEFAULT_MAX_WORKERS,
+                            update=True, ttl=True)
+
+    def path(self, zone_host: str) -> str:
+        return os.path.join(self.directory, zone_host.rstrip(".").lower() + self.suffix)
+
+    def _lock(self, zone_host: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(zone_host.rstrip(".").lower(), threading.Lock())
+
+    def _read(self, zone_host: str) -> Optional[tuple[List[DnsRecord], Optional[int]]]:
+        try:
+            with open(self.path(zone_host), 'r', encoding='utf-8') as f:
+                return parse_zone(f.read(), zone_host)
+        except OSError:
+            return None
+
+    def _write(self, zone_host: str, records: List[DnsRecord], default_ttl: Optional[int]):
+        bump_serial(records)
+        path = self.path(zone_host)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(format_zone(zone_host, records, default_ttl))
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self.writes += 1
+
+    def _modify(self, zone_host: str, func: Callable[[List[DnsRecord]], object]):
+        """Datei lesen, func(records) ändern lassen, bei Änderungen schreiben"""
+        with self._lock(zone_host):
+            parsed = self._read(zone_host)
+            if parsed is None:
+                return None
+            records, default_ttl = parsed
+            before = len(records), [record.content for record in records]
+            result = func(records)
+            if (len(records), [record.content for record in records]) != before:
+                self._write(zone_host, records, default_ttl)
+            return result
+
+    def get_zone(self, zone_host: str, max_age: Optional[float] = None) -> Optional[Zone]:
+        parsed = self._read(zone_host)
+        if parsed is None:
+            return None
+        return Zone(zone_host, parsed[0])
+
+    def add_records(self, zone_host: str, records: List[DnsRecord]) -> List[tuple[bool, str]]:
+        def add(existing: List[DnsRecord]) -> List[tuple[bool, str]]:
+            results = []
+            for record in records:
+                if any(_same(record, other) for other in existing):
+                    results.append((True, "Existiert bereits"))
+                    continue
+                existing.append(DnsRecord(record.name, record.type, record.data, record.aux,
+                                          ttl=record.ttl))
+                results.append((True, "Erfolgreich hinzugefügt"))
+            return results
+
+        results = self._modify(zone_host, add)
+        if results is None:
+            return [(False, f"Zonendatei nicht lesbar: {self.path(zone_host)}")] * len(records)
+        return results
+
+    def add_record(self, zone_host: str, record: DnsRecord) -> tuple[bool, str]:
+        return self.add_records(zone_host, [record])[0]
+
+    def delete_record(self, zone_host: str, record: DnsRecord) -> tuple[bool, str]:
+        def delete(existing: List[DnsRecord]) -> tuple[bool, str]:
+            for index, other in enumerate(existing):
+                if _same(record, other):
+                    del existing[index]
+                    return True, "Erfolgreich gelöscht"
+            return False, "Eintrag nicht gefunden"
+
+        return self._modify(zone_host, delete) or \
+            (False, f"Zonendatei nicht lesbar: {self.path(zone_host)}")
+
+    def update_record(self, zone_host: str, current: DnsRecord,
+                      desired: DnsRecord) -> tuple[bool, str]:
+        def update(existing: List[DnsRecord]) -> tuple[bool, str]:
+            for index, other in enumerate(existing):
+                if _same(current, other):
+                    existing[index] = DnsRecord(desired.name, desired.type, desired.data,
+                                                desired.aux, ttl=desired.ttl or other.ttl)
+                    return True, "Erfolgreich geändert"
+            return False, "Eintrag nicht gefunden"
+
+        return self._modify(zone_host, update) or \
+            (False, f"Zonendatei nicht lesbar: {self.path(zone_host)}")
+
+    def summary(self) -> List[str]:
+        return [f"💾 {self.writes} Zonendatei(en) geschrieben ({self.directory})"]
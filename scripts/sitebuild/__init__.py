@@ -0,0 +1,44 @@
+"""
+Build-Schritte für die statische Website (alle Sprachversionen)
+
+Aufruf (aus scripts/):
+
+    python3 -m sitebuild build          # Ausgabe für Vercel (dist/) mit Asset-Store bauen
+    python3 -m sitebuild write-config   # Rewrites in vercel.json aktualisieren
+    python3 -m sitebuild check          # Store und vercel.json aktuell? (Exit-Code 1 wenn nicht)
+    python3 -m sitebuild images         # Responsive Bildvarianten (AVIF/WebP/JPEG)
+    python3 -m sitebuild pages          # Seiten aller Sprachen aus templates/ rendern
+"""
+
+from .assets import (AssetManifest, asset_rewrites, build_output, build_store, hash_file,
+                     store_urls, update_vercel_config)
+from .cache import ImageCache
+from .config import LOCALE_DIRS, LOCALE_PREFIXES, SITE_ROOT
+from .graph import BuildGraph
+from .images import ImageReport, build_images, inject_html, inject_pages, load_manifest
+from .pages import PageReport, Template, build_pages, load_catalogs, render_locale
+
+__all__ = [
+    "LOCALE_DIRS",
+    "LOCALE_PREFIXES",
+    "SITE_ROOT",
+    "AssetManifest",
+    "BuildGraph",
+    "ImageCache",
+    "ImageReport",
+    "PageReport",
+    "Template",
+    "asset_rewrites",
+    "build_images",
+    "build_output",
+    "build_pages",
+    "build_store",
+    "hash_file",
+    "inject_html",
+    "inject_pages",
+    "load_catalogs",
+    "load_manifest",
+    "render_locale",
+    "store_urls",
+    "update_vercel_config",
+]
@@ -0,0 +1,7 @@
+"""
+Einstiegspunkt für python3 -m sitebuild
+"""
+
+from .cli import main
+
+main()
@@ -0,0 +1,323 @@
+"""
+Content-addressed Asset-Store für alle Sprachversionen
+
+Alle fünf Sprachversionen bringen ein eigenes assets/-Verzeichnis mit, die
+Dateien sind aber byte-gleich (und auch innerhalb einer Sprache gibt es
+Duplikate, z.B. IMG_3354.jpg = gallery-7.jpg). Der Build hasht jede Datei
+(SHA-256) und legt jeden Inhalt genau einmal in der Ausgabe für Vercel ab:
+
+    dist/assets-store/<hash[:2]>/<hash>.<endung>
+    dist/assets-store/manifest.json   # Sprache → Pfad → Hash
+    dist/website-xx/*.html            # Seiten ohne assets/, URLs zeigen in den Store
+
+build_output() kopiert die Seiten und setzt dabei jede assets/-URL auf den
+Blob (/assets-store/<hh>/<hash>.<endung>); nur diese URLs bekommen den
+immutable-Header, weil sich der Dateiname mit dem Inhalt ändert. Die
+Rewrites in vercel.json für /assets/... und /<sprache>/assets/... bleiben
+für alte Links (Bookmarks, og:image in geteilten Beiträgen).
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from typing import Dict, List, Optional
+
+from . import config
+
+CHUNK_SIZE = 1 << 20
+
+# Zeichen mit Sonderbedeutung in Vercel-Sources (path-to-regexp)
+_SOURCE_SPECIAL = set(":()*?+{}[]\\")
+
+# assets/-URL in einer Seite: relativ, absolut (/assets/) oder mit Host (//host/assets/)
+_ASSET_URL = re.compile(r'(?P<before>["\'(\s,]|//[^/"\'\s]+)/?assets/(?P<path>[^"\'\s),?#]+)')
+# Dateien, deren Asset-URLs build_output() auf den Store umschreibt
+PAGE_EXTENSIONS = (".html",)
+
+IMMUTABLE_HEADERS = [{"key": "Cache-Control", "value": "public, max-age=31536000, immutable"}]
+
+
+def hash_file(file_path: str) -> str:
+    """SHA-256 einer Datei (hex), blockweise gelesen"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_assets(root: str = config.SITE_ROOT,
+                locales: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, str]]:
+    """Sprache → {Pfad unter assets/ → SHA-256}
+
+    Gleiche Pfade mit gleicher Größe und Änderungszeit werden nur einmal
+    gehasht (die Sprachversionen sind in der Regel Kopien).
+    """
+    locales = locales or config.LOCALE_DIRS
+    known: Dict[tuple, str] = {}
+    result: Dict[str, Dict[str, str]] = {}
+    for locale, directory in locales.items():
+        assets_dir = os.path.join(root, directory, "assets")
+        files: Dict[str, str] = {}
+        for current, _, names in os.walk(assets_dir):
+            for name in sorted(names):
+                file_path = os.path.join(current, name)
+                relative = os.path.relpath(file_path, assets_dir).replace(os.sep, "/")
+                stat = os.stat(file_path)
+                key = (relative, stat.st_size, stat.st_mtime_ns)
+                if key not in known:
+                    known[key] = hash_file(file_path)
+                files[relative] = known[key]
+        result[locale] = dict(sorted(files.items()))
+    return result
+
+
+def blob_path(digest: str, relative: str) -> str:
+    """Pfad im Store (relativ zum Store-Verzeichnis) für einen Inhalt"""
+    _, extension = os.path.splitext(relative)
+    name = digest[:config.STORE_HASH_LENGTH] + extension.lower()
+    return f"{name[:2]}/{name}"
+
+
+class AssetManifest:
+    """Zuordnung Sprache/Pfad → Blob im Store"""
+
+    def __init__(self, files: Dict[str, Dict[str, str]]):
+        self.files = files
+        self.blobs: Dict[str, str] = {}
+        self.sources: Dict[str, str] = {}
+        for locale, paths in files.items():
+            for relative, digest in paths.items():
+                if digest not in self.blobs:
+                    self.blobs[digest] = blob_path(digest, relative)
+                    self.sources[digest] = os.path.join(config.LOCALE_DIRS.get(locale, locale),
+                                                        "assets", relative)
+
+    @classmethod
+    def scan(cls, root: str = config.SITE_ROOT) -> "AssetManifest":
+        return cls(scan_assets(root))
+
+    def blob_for(self, locale: str, relative: str) -> Optional[str]:
+        digest = self.files.get(locale, {}).get(relative)
+        return self.blobs.get(digest) if digest else None
+
+    def paths(self) -> List[str]:
+        """Alle Pfade unter assets/ über alle Sprachen"""
+        return sorted({relative for paths in self.files.values() for relative in paths})
+
+    @property
+    def total_files(self) -> int:
+        return sum(len(paths) for paths in self.files.values())
+
+    def to_dict(self) -> Dict:
+        return {
+            "blobs": {self.blobs[digest]: digest for digest in sorted(self.blobs)},
+            "files": {locale: {relative: self.blobs[digest] for relative, digest in paths.items()}
+                      for locale, paths in self.files.items()},
+        }
+
+
+def store_path(root: str = config.SITE_ROOT, store_dir: str = config.STORE_DIR) -> str:
+    """Verzeichnis des Stores in der Ausgabe"""
+    return os.path.join(root, config.OUTPUT_DIR, store_dir)
+
+
+def build_store(manifest: AssetManifest, root: str = config.SITE_ROOT,
+                store_dir: str = config.STORE_DIR) -> tuple[int, int]:
+    """Lege fehlende Blobs an, gibt (neu, Bytes im Store) zurück
+
+    Vorhandene Blobs werden nicht angefasst (der Name ist der Inhalt),
+    nicht mehr verwendete gelöscht. Neue Dateien werden per Hardlink
+    angelegt, sonst kopiert.
+    """
+    store = store_path(root, store_dir)
+    created = 0
+    total = 0
+    keep = {os.path.join(store, blob) for blob in manifest.blobs.values()}
+    keep.add(os.path.join(store, config.STORE_MANIFEST))
+    for current, _, names in os.walk(store):
+        for name in names:
+            if os.path.join(current, name) not in keep:
+                os.remove(os.path.join(current, name))
+    for digest, blob in manifest.blobs.items():
+        target = os.path.join(store, blob)
+        source = os.path.join(root, manifest.sources[digest])
+        total += os.path.getsize(source)
+        if os.path.exists(target):
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+        created += 1
+
+    with open(os.path.join(store, config.STORE_MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest.to_dict(), f, indent=2, sort_keys=True)
+        f.write("\n")
+    return created, total
+
+
+def missing_blobs(manifest: AssetManifest, root: str = config.SITE_ROOT,
+                  store_dir: str = config.STORE_DIR) -> List[str]:
+    """Blobs aus dem Manifest, die im Store fehlen"""
+    store = store_path(root, store_dir)
+    return [blob for blob in manifest.blobs.values()
+            if not os.path.exists(os.path.join(store, blob))]
+
+
+def store_urls(html: str, manifest: AssetManifest, locale: str,
+               store_dir: str = config.STORE_DIR) -> tuple[str, int]:
+    """assets/-URLs einer Seite auf /<store_dir>/<blob> setzen, gibt (html, Anzahl) zurück
+
+    Die responsive Varianten liegen nur in IMAGE_LOCALE und gelten für alle
+    Sprachen; URLs ohne Datei (z.B. ein fehlendes og-image.jpg) bleiben stehen.
+    """
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        relative = match.group("path")
+        blob = (manifest.blob_for(locale, relative)
+                or manifest.blob_for(config.IMAGE_LOCALE, relative))
+        if blob is None:
+            return match.group(0)
+        count += 1
+        return f"{match.group('before')}/{store_dir}/{blob}"
+
+    return _ASSET_URL.sub(replace, html), count
+
+
+def build_output(manifest: AssetManifest, root: str = config.SITE_ROOT,
+                 store_dir: str = config.STORE_DIR) -> tuple[List[str], int]:
+    """Seiten aller Sprachen ohne assets/ nach OUTPUT_DIR kopieren
+
+    Asset-URLs in HTML zeigen danach direkt in den Store (store_urls()).
+    Gibt (geschriebene Pfade, Anzahl umgeschriebener URLs) zurück.
+    """
+    output = os.path.join(root, config.OUTPUT_DIR)
+    written: List[str] = []
+    urls = 0
+    for locale, directory in config.LOCALE_DIRS.items():
+        source_dir = os.path.join(root, directory)
+        target_dir = os.path.join(output, directory)
+        if os.path.isdir(target_dir):
+            shutil.rmtree(target_dir)
+        for current, dirs, names in os.walk(source_dir):
+            if current == source_dir:
+                dirs[:] = [name for name in dirs if name != "assets"]
+            relative_dir = os.path.relpath(current, source_dir)
+            os.makedirs(os.path.join(target_dir, relative_dir), exist_ok=True)
+            for name in sorted(names):
+                source = os.path.join(current, name)
+                target = os.path.join(target_dir, relative_dir, name)
+                if name.endswith(PAGE_EXTENSIONS):
+                    with open(source, 'r', encoding='utf-8') as f:
+                        html, count = store_urls(f.read(), manifest, locale, store_dir)
+                    with open(target, 'w', encoding='utf-8') as f:
+                        f.write(html)
+                    urls += count
+                else:
+                    shutil.copyfile(source, target)
+                written.append(os.path.relpath(target, root))
+    return written, urls
+
+
+def _escape_source(relative: str) -> str:
+    return "".join("\\" + char if char in _SOURCE_SPECIAL else char for char in relative)
+
+
+def _locale_hosts(rewrites: List[Dict]) -> Dict[str, List[str]]:
+    """Sprache → Hosts aus den bestehenden host-Rewrites (/(.*) → /website-xx/$1)"""
+    by_dir = {directory: locale for locale, directory in config.LOCALE_DIRS.items()}
+    hosts: Dict[str, List[str]] = {}
+    for rule in rewrites:
+        destination = rule.get("destination", "")
+        if rule.get("source") != "/(.*)" or not destination.endswith("/$1"):
+            continue
+        locale = by_dir.get(destination.strip("/").split("/")[0])
+        for condition in rule.get("has", []):
+            if locale and condition.get("type") == "host":
+                hosts.setdefault(locale, []).append(condition["value"])
+    return hosts
+
+
+def asset_rewrites(manifest: AssetManifest, hosts: Dict[str, List[str]],
+                   store_dir: str = config.STORE_DIR) -> List[Dict]:
+    """Rewrites aller Asset-Pfade in den Store
+
+    Ist ein Pfad in allen Sprachen gleich, reicht eine Regel für /assets/...
+    und /<sprache>/assets/...; sonst gibt es Regeln pro Sprache (zuerst die
+    host-Regeln, weil /assets/... ohne Präfix sonst Deutsch treffen würde).
+    """
+    prefixes = [prefix for prefix in config.LOCALE_PREFIXES.values() if prefix]
+    any_prefix = f"/:locale({'|'.join(prefixes)})?" if prefixes else ""
+    shared, host_rules, prefix_rules = [], [], []
+
+    for relative in manifest.paths():
+        escaped = _escape_source(relative)
+        blobs = {locale: manifest.blob_for(locale, relative) for locale in manifest.files}
+        distinct = {blob for blob in blobs.values() if blob}
+        if len(distinct) == 1:
+            shared.append({"source": f"{any_prefix}/assets/{escaped}",
+                           "destination": f"/{store_dir}/{distinct.pop()}"})
+            continue
+        for locale, blob in blobs.items():
+            if not blob:
+                continue
+            destination = f"/{store_dir}/{blob}"
+            for host in hosts.get(locale, []):
+                host_rules.append({"has": [{"type": "host", "value": host}],
+                                   "source": f"/assets/{escaped}", "destination": destination})
+            prefix = config.LOCALE_PREFIXES.get(locale, locale)
+            source = f"/{prefix}/assets/{escaped}" if prefix else f"/assets/{escaped}"
+            prefix_rules.append({"source": source, "destination": destination})
+
+    # Regeln ohne Präfix (Deutsch) ans Ende, damit die Sprachpräfixe vorher greifen
+    prefix_rules.sort(key=lambda rule: rule["source"].startswith("/assets/"))
+    return shared + host_rules + prefix_rules
+
+
+def _is_asset_rewrite(rule: Dict, store_dir: str) -> bool:
+    """Alte Asset-Regel (→ /website-xx/assets/$1) oder bereits generierte Store-Regel"""
+    destination = rule.get("destination", "")
+    if destination.startswith(f"/{store_dir}/"):
+        return True
+    directories = set(config.LOCALE_DIRS.values())
+    parts = destination.strip("/").split("/")
+    return len(parts) >= 2 and parts[0] in directories and parts[1] == "assets"
+
+
+def update_vercel_config(vercel: Dict, manifest: AssetManifest,
+                         store_dir: str = config.STORE_DIR) -> Dict:
+    """vercel.json mit Ausgabeverzeichnis, Store-Rewrites und Cache-Header für den Store"""
+    rewrites = vercel.get("rewrites", [])
+    hosts = _locale_hosts(rewrites)
+    positions = [index for index, rule in enumerate(rewrites) if _is_asset_rewrite(rule, store_dir)]
+    insert_at = positions[0] if positions else next(
+        (index + 1 for index, rule in enumerate(rewrites)
+         if rule.get("source", "").startswith("/api/")), 0)
+    remaining = [rule for rule in rewrites if not _is_asset_rewrite(rule, store_dir)]
+    insert_at -= sum(1 for index in positions if index < insert_at)
+
+    updated = dict(vercel)
+    updated["outputDirectory"] = config.OUTPUT_DIR
+    updated["rewrites"] = (remaining[:insert_at] + asset_rewrites(manifest, hosts, store_dir)
+                           + remaining[insert_at:])
+
+    store_source = f"/{store_dir}/(.*)"
+    headers = [rule for rule in vercel.get("headers", []) if rule.get("source") != store_source]
+    headers.append({"source": store_source, "headers": IMMUTABLE_HEADERS})
+    updated["headers"] = headers
+    return updated
+
+
+def load_vercel_config(root: str = config.SITE_ROOT) -> Dict:
+    with open(os.path.join(root, config.VERCEL_CONFIG), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def format_vercel_config(vercel: Dict) -> str:
+    return json.dumps(vercel, indent=2, ensure_ascii=False) + "\n"
@@ -0,0 +1,153 @@
+"""
+Build-Cache für Bildvarianten auf der Festplatte
+
+Der Schlüssel ist der SHA-256 des Originals plus Transform-Parameter
+(Breiten, Formate mit Qualität, PIPELINE_VERSION aus sitebuild.images),
+nicht der Dateiname: Byte-gleiche Originale unter verschiedenen Namen
+(IMG_3354.jpg und gallery-7.jpg) werden einmal kodiert. Pro Schlüssel
+liegt ein Verzeichnis mit den fertigen Varianten und entry.json (Eintrag
+für images.json, ohne Namen):
+
+    <cache>/<schlüssel[:2]>/<schlüssel>/<breite>.<endung>
+    <cache>/<schlüssel[:2]>/<schlüssel>/entry.json
+    <cache>/hashes.json      # Pfad → (Größe, Änderungszeit, SHA-256)
+
+Ein Treffer wird nur noch als <name>-<breite>.<endung> nach responsive/
+verlinkt, nicht neu kodiert.
+hashes.json erspart bei unveränderten Originalen auch das Hashen.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Optional
+
+from . import config
+from .assets import hash_file
+
+ENTRY_FILE = "entry.json"
+HASHES_FILE = "hashes.json"
+
+
+class ImageCache:
+    """Fertige Varianten pro (Original, Parameter) in einem Verzeichnis"""
+
+    def __init__(self, cache_dir: str = config.IMAGE_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._hashes: Optional[Dict[str, list]] = None
+        self._hashes_changed = False
+
+    def _load_hashes(self) -> Dict[str, list]:
+        if self._hashes is None:
+            try:
+                with open(os.path.join(self.cache_dir, HASHES_FILE), 'r', encoding='utf-8') as f:
+                    self._hashes = json.load(f)
+            except (OSError, ValueError):
+                self._hashes = {}
+        return self._hashes
+
+    def source_hash(self, source: str) -> str:
+        """SHA-256 des Originals; gleiche Größe und Änderungszeit → gemerkter Wert"""
+        hashes = self._load_hashes()
+        stat = os.stat(source)
+        key = os.path.abspath(source)
+        known = hashes.get(key)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+        digest = hash_file(source)
+        hashes[key] = [stat.st_size, stat.st_mtime_ns, digest]
+        self._hashes_changed = True
+        return digest
+
+    def save_hashes(self):
+        """hashes.json schreiben (atomar per rename), nur wenn sich etwas geändert hat"""
+        if not self._hashes_changed:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._hashes, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, os.path.join(self.cache_dir, HASHES_FILE))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._hashes_changed = False
+
+    @staticmethod
+    def key(digest: str, params: Dict) -> str:
+        """Cache-Schlüssel aus Hash des Originals und Parametern"""
+        payload = json.dumps({"source": digest, "params": params}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Manifest-Eintrag, wenn alle Varianten im Cache liegen, sonst None"""
+        directory = self.entry_dir(key)
+        try:
+            with open(os.path.join(directory, ENTRY_FILE), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        for variants in entry["variants"].values():
+            for variant in variants:
+                if not os.path.exists(os.path.join(directory, variant["file"])):
+                    return None
+        return entry
+
+    def staging_dir(self) -> str:
+        """Leeres Verzeichnis im Cache für einen Kodier-Lauf (siehe commit)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        return tempfile.mkdtemp(dir=self.cache_dir, prefix="staging-")
+
+    def commit(self, key: str, staging: str, entry: Dict):
+        """Fertiges Staging-Verzeichnis unter dem Schlüssel ablegen"""
+        with open(os.path.join(staging, ENTRY_FILE), 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=1, sort_keys=True)
+        target = self.entry_dir(key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.isdir(target):
+            shutil.rmtree(target)
+        os.replace(staging, target)
+
+    def discard(self, staging: str):
+        shutil.rmtree(staging, ignore_errors=True)
+
+    def link_into(self, key: str, entry: Dict, stem: str, output_dir: str) -> int:
+        """Varianten eines Eintrags als <stem>-<datei> nach output_dir verlinken
+
+        Hardlink, sonst Kopie; bereits verlinkte Dateien bleiben unverändert.
+        Gibt die Anzahl neuer Dateien zurück.
+        """
+        directory = self.entry_dir(key)
+        linked = 0
+        for variants in entry["variants"].values():
+            for variant in variants:
+                source = os.path.join(directory, variant["file"])
+                target = os.path.join(output_dir, f"{stem}-{variant['file']}")
+                changed = True
+                if os.path.exists(target):
+                    if os.path.samefile(source, target):
+                        continue
+                    # Gleicher Inhalt (z.B. nach git checkout): trotzdem verlinken,
+                    # damit der nächste Lauf nicht wieder vergleicht
+                    changed = not _same_content(source, target)
+                    os.remove(target)
+                try:
+                    os.link(source, target)
+                except OSError:
+                    shutil.copyfile(source, target)
+                linked += changed
+        return linked
+
+
+def _same_content(first: str, second: str) -> bool:
+    """Gleicher Inhalt zweier Dateien"""
+    if os.path.getsize(first) != os.path.getsize(second):
+        return False
+    return hash_file(first) == hash_file(second)
@@ -0,0 +1,178 @@
+"""
+Kommandozeile für den Website-Build
+
+Aufruf (aus scripts/):
+
+    python3 -m sitebuild build          # Ausgabe bauen (dist/: Seiten + assets-store/)
+    python3 -m sitebuild write-config   # Asset-Rewrites in vercel.json neu schreiben
+    python3 -m sitebuild check          # Prüfen, ob Store und vercel.json aktuell sind
+    python3 -m sitebuild images         # Responsive Varianten (AVIF/WebP/JPEG) bauen
+    python3 -m sitebuild images --inject   # ... und die Seiten mit <picture> neu rendern
+    python3 -m sitebuild pages          # Seiten aller Sprachen aus templates/ rendern
+    python3 -m sitebuild pages --force  # ... auch unveränderte (Build-Graph ignorieren)
+
+Auf Vercel läuft 'build' als buildCommand, ausgeliefert wird nur dist/
+(outputDirectory); 'write-config' nach geänderten
+Bildern lokal ausführen und vercel.json committen ('check' schlägt sonst fehl).
+'images' braucht Pillow und pillow-heif und läuft ebenfalls lokal; die
+Varianten werden mit committet. Die HTML-Seiten in website*/ entstehen mit
+'pages' aus templates/ – dort (und in templates/locales/) ändern, nicht in
+den erzeugten Dateien; 'check' meldet veraltete Seiten. 'pages' und 'images'
+bauen nur, was sich laut build-manifest.json geändert hat (mit committen).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from . import config, images, pages
+from .assets import (AssetManifest, build_output, build_store, format_vercel_config,
+                     load_vercel_config, missing_blobs, update_vercel_config)
+from .cache import ImageCache
+
+
+def _size(total: int) -> str:
+    return f"{total / 1024 / 1024:.1f} MB"
+
+
+def cmd_build(args):
+    """Ausgabe für Vercel bauen: Store aus allen assets/-Verzeichnissen, Seiten ohne assets/"""
+    started = time.perf_counter()
+    manifest = AssetManifest.scan(args.root)
+    created, total = build_store(manifest, args.root, args.store)
+    written, urls = build_output(manifest, args.root, args.store)
+    duplicated = sum(os.path.getsize(os.path.join(args.root, config.LOCALE_DIRS[locale],
+                                                  "assets", relative))
+                     for locale, paths in manifest.files.items() for relative in paths)
+    print(f"📦 {manifest.total_files} Dateien → {len(manifest.blobs)} Blobs "
+          f"({created} neu) in {config.OUTPUT_DIR}/{args.store}/")
+    print(f"   {_size(duplicated)} → {_size(total)} "
+          f"({duplicated / total if total else 0:.1f}x kleiner)")
+    print(f"📄 {len(written)} Seite(n) nach {config.OUTPUT_DIR}/, {urls} Asset-URLs "
+          f"→ /{args.store}/")
+    print(f"⏱️  {time.perf_counter() - started:.2f}s")
+
+
+def cmd_write_config(args):
+    """Asset-Rewrites in vercel.json auf den Store umstellen"""
+    manifest = AssetManifest.scan(args.root)
+    vercel = update_vercel_config(load_vercel_config(args.root), manifest, args.store)
+    with open(os.path.join(args.root, config.VERCEL_CONFIG), 'w', encoding='utf-8') as f:
+        f.write(format_vercel_config(vercel))
+    asset_rules = sum(1 for rule in vercel["rewrites"]
+                      if rule.get("destination", "").startswith(f"/{args.store}/"))
+    print(f"✅ {config.VERCEL_CONFIG}: {asset_rules} Asset-Rewrites → /{args.store}/")
+
+
+def cmd_check(args):
+    """Exit-Code 1, wenn vercel.json oder der Store nicht zu den Assets passen"""
+    manifest = AssetManifest.scan(args.root)
+    problems = []
+
+    current = load_vercel_config(args.root)
+    if update_vercel_config(current, manifest, args.store) != current:
+        problems.append(f"{config.VERCEL_CONFIG} veraltet → python3 -m sitebuild write-config")
+    page_report = pages.build_pages(args.root, write=False)
+    problems.extend(page_report.errors)
+    if page_report.written:
+        problems.append(f"{len(page_report.written)} Seite(n) weichen von templates/ ab "
+                        f"({', '.join(page_report.written[:3])}) → python3 -m sitebuild pages")
+    if args.store_required:
+        missing = missing_blobs(manifest, args.root, args.store)
+        if missing:
+            problems.append(f"{len(missing)} Blob(s) fehlen im Store → python3 -m sitebuild build")
+
+    for problem in problems:
+        print(f"❌ {problem}")
+    if problems:
+        sys.exit(1)
+    print(f"✅ {manifest.total_files} Assets, {len(manifest.blobs)} Blobs – alles aktuell")
+
+
+def cmd_images(args):
+    """Responsive Varianten bauen, optional <picture> in die Seiten einsetzen"""
+    started = time.perf_counter()
+    if args.skip_build:
+        manifest = images.load_manifest(args.root)
+    else:
+        manifest, report = images.build_images(args.root, cache=ImageCache(args.cache_dir),
+                                               workers=args.workers, force=args.force)
+        for line in report.summary():
+            print(line)
+    if manifest is None:
+        sys.exit(1)
+    output_dir = os.path.relpath(images.responsive_dir(args.root), args.root)
+    print(f"🖼️  {len(manifest)} Bilder in {output_dir}/")
+
+    if args.inject:
+        for line in pages.build_pages(args.root).summary():
+            print(line)
+        print("📋 Danach: python3 -m sitebuild write-config")
+    print(f"⏱️  {time.perf_counter() - started:.2f}s")
+
+
+def cmd_pages(args):
+    """Seiten aus templates/ und den Sprachkatalogen rendern"""
+    report = pages.build_pages(args.root, args.locale or None, force=args.force)
+    for line in report.summary():
+        print(line)
+    for page in report.written:
+        print(f"✅ {page}")
+    print(f"⏱️  {report.elapsed * 1000:.0f} ms")
+    unused = {locale: keys for locale, keys in pages.unused_keys(args.root).items() if keys}
+    for locale, keys in sorted(unused.items()):
+        print(f"📋 {locale}: {len(keys)} Schlüssel ohne Verwendung ({', '.join(keys[:5])})")
+    if report.errors:
+        sys.exit(1)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python3 -m sitebuild",
+                                     description="Build-Schritte für die Website")
+    parser.add_argument("--root", default=config.SITE_ROOT, help="Repository-Verzeichnis")
+    parser.add_argument("--store", default=config.STORE_DIR,
+                        help=f"Store-Verzeichnis in {config.OUTPUT_DIR}/ (und URL-Pfad)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Ausgabe mit Asset-Store bauen")
+    build.set_defaults(func=cmd_build)
+
+    write_config = commands.add_parser("write-config", help="Asset-Rewrites in vercel.json schreiben")
+    write_config.set_defaults(func=cmd_write_config)
+
+    check = commands.add_parser("check", help="Store und vercel.json prüfen")
+    check.add_argument("--store-required", action="store_true",
+                       help="Auch prüfen, ob alle Blobs im Store liegen")
+    check.set_defaults(func=cmd_check)
+
+    images_parser = commands.add_parser("images", help="Responsive Bildvarianten bauen")
+    images_parser.add_argument("--inject", action="store_true",
+                               help="Seiten mit <picture> in Hero und Galerie neu rendern")
+    images_parser.add_argument("--skip-build", action="store_true",
+                               help="Varianten nicht neu bauen, nur images.json verwenden")
+    images_parser.add_argument("--workers", type=int, default=config.IMAGE_WORKERS,
+                               help="Prozesse zum Kodieren (Standard: CPU-Kerne)")
+    images_parser.add_argument("--cache-dir", default=config.IMAGE_CACHE_DIR,
+                               help="Build-Cache für fertige Varianten")
+    images_parser.add_argument("--force", action="store_true",
+                               help="Auch laut build-manifest.json unveränderte Bilder bauen")
+    images_parser.set_defaults(func=cmd_images)
+
+    pages_parser = commands.add_parser("pages", help="Seiten aller Sprachen aus templates/ rendern")
+    pages_parser.add_argument("--locale", action="append",
+                              help="Nur diese Sprache (mehrfach möglich), Standard: alle Kataloge")
+    pages_parser.add_argument("--force", action="store_true",
+                              help="Auch laut build-manifest.json unveränderte Seiten rendern")
+    pages_parser.set_defaults(func=cmd_pages)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Gemeinsame Einstellungen für den Website-Build
+
+Pfade beziehen sich auf das Repository (SITE_ROOT überschreibt das, z.B.
+für Tests in einer Kopie). Die Sprachen entsprechen den Schlüsseln von
+LANGUAGES in api/contact.js.
+"""
+
+import os
+
+SITE_ROOT = os.getenv("SITE_ROOT", os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))))
+
+# Sprache → Verzeichnis der Sprachversion
+LOCALE_DIRS = {
+    "de": "website",
+    "en": "website-en",
+    "fr": "website-fr",
+    "nl": "website-nl",
+    "pl": "website-pl",
+}
+
+# Sprache → URL-Präfix (Deutsch liegt ohne Präfix unter /)
+LOCALE_PREFIXES = {
+    "de": "",
+    "en": "en",
+    "fr": "fr",
+    "nl": "nl",
+    "pl": "pl",
+}
+
+VERCEL_CONFIG = "vercel.json"
+
+# Ausgabe für Vercel (outputDirectory, nicht im Git): Seiten ohne assets/,
+# dazu der Store unter OUTPUT_DIR/STORE_DIR (= URL-Pfad /assets-store/)
+OUTPUT_DIR = "dist"
+# Content-addressed Asset-Store
+STORE_DIR = "assets-store"
+STORE_MANIFEST = "manifest.json"
+# Länge des Hash-Präfixes im Dateinamen (SHA-256, hex)
+STORE_HASH_LENGTH = 20
+
+
+def path(*parts: str) -> str:
+    """Pfad relativ zum Repository"""
+    return os.path.join(SITE_ROOT, *parts)
+
+# Responsive Bilder (sitebuild.images): Quellen liegen in der deutschen
+# Version, die Varianten darunter in responsive/ (gelten per Rewrite für alle Sprachen)
+IMAGE_LOCALE = "de"
+IMAGES_DIR = "assets/images"
+RESPONSIVE_DIR = "responsive"
+RESPONSIVE_MANIFEST = "images.json"
+# Bildname in den Templates (<img src="assets/images/<name>.jpg">) → Original
+# in IMAGES_DIR (ohne Endung, HEIC vor JPEG). Nicht eingetragene Namen nehmen
+# eine gleichnamige Datei; fehlt auch die, meldet 'images' den Platz als leer.
+# Kodiert werden nur Originale, die eine Seite verwendet.
+IMAGE_SLOTS = {
+    "hero": "IMG_3346",  # Bedienfeld: Generator bereit
+    "gallery-3": "IMG_3344",  # Deep Sea Electronics Bedienfeld
+    "gallery-4": "IMG_3343",  # Display Betriebsstunden 24h
+    "gallery-6": "IMG_3352",  # Atlas Copco Typenschild
+    "gallery-7": "IMG_3354",  # Generator Alternator
+}
+# Zielbreiten in Pixeln; größer als das Original wird nie skaliert
+IMAGE_WIDTHS = (480, 800, 1200, 1600)
+# Format → Qualität (in dieser Reihenfolge als <source> im <picture>)
+IMAGE_FORMATS = {
+    "avif": 50,
+    "webp": 75,
+    "jpeg": 80,
+}
+
+# Build-Cache für Bildvarianten (Schlüssel: Hash des Originals + Parameter)
+IMAGE_CACHE_DIR = os.getenv(
+    "SITEBUILD_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "notstrom-sitebuild", "images")
+)
+# Prozesse für das Kodieren (0 = ein Prozess pro CPU-Kern)
+IMAGE_WORKERS = int(os.getenv("SITEBUILD_WORKERS", "0")) or os.cpu_count() or 1
+
+# Seiten-Generator (sitebuild.pages): ein Template pro Seite, ein Katalog pro Sprache
+DEFAULT_LOCALE = "de"
+TEMPLATES_DIR = "templates"
+CATALOGS_DIR = "templates/locales"
+PAGES = ("index.html", "blog.html", "danke.html")
+# In allen Sprachen gleiche Seiten (deutscher Katalog, die Sprache wählt ?lang im Browser)
+SHARED_PAGES = ("danke.html",)
+# Sprachen der E-Mail-Texte (LANGUAGES), Quelle der Sprachcodes
+CONTACT_API = "api/contact.js"
+
+# Abhängigkeitsgraph mit Content-Hashes (sitebuild.graph), wird mit committet
+BUILD_MANIFEST = "build-manifest.json"
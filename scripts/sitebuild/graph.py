@@ -0,0 +1,150 @@
+"""
+Abhängigkeitsgraph des Builds (build-manifest.json)
+
+Für jede erzeugte Datei steht im Build-Manifest, woraus sie entstanden ist,
+jeweils mit Content-Hash (SHA-256, gekürzt):
+
+    pages:  website-en/index.html → Template, jeder Katalogschlüssel des
+            Templates (aufgelöster Text), eingesetzte Bilder, Ausgabe
+    images: IMG_3343 → Cache-Schlüssel (Original + Parameter), Varianten
+
+Beim nächsten Lauf wird nur neu erzeugt, was sich laut Graph geändert hat;
+der Grund steht im Bericht ("hero.price geändert", "Template geändert", ...).
+Eine neue Preisangabe rendert so nur die Seiten, die den Schlüssel nutzen,
+ohne Bilder anzufassen.
+
+Das Manifest wird mit committet: Auch nach einem frischen Checkout (ohne
+Build-Cache) gelten unveränderte Bilder dann als aktuell.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from . import config
+
+# Bei Änderungen am Aufbau erhöhen (alter Graph wird verworfen, alles neu gebaut)
+GRAPH_VERSION = 1
+# Länge der gespeicherten Hashes (hex)
+HASH_LENGTH = 16
+
+
+def hash_value(value: Any) -> str:
+    """Content-Hash eines Texts oder JSON-fähigen Werts"""
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+
+
+def manifest_path(root: str = config.SITE_ROOT) -> str:
+    return os.path.join(root, config.BUILD_MANIFEST)
+
+
+class BuildGraph:
+    """Gespeicherte Abhängigkeiten pro Ausgabe, Abschnitte 'pages' und 'images'"""
+
+    def __init__(self, root: str = config.SITE_ROOT):
+        self.root = root
+        self.data: Dict[str, Dict] = {"version": GRAPH_VERSION, "pages": {}, "images": {}}
+        self._saved = ""
+
+    @classmethod
+    def load(cls, root: str = config.SITE_ROOT) -> "BuildGraph":
+        """Graph aus build-manifest.json, leer bei fehlender oder veralteter Datei"""
+        graph = cls(root)
+        try:
+            with open(manifest_path(root), 'r', encoding='utf-8') as f:
+                graph._saved = f.read()
+            data = json.loads(graph._saved)
+        except (OSError, ValueError):
+            return graph
+        if data.get("version") == GRAPH_VERSION:
+            graph.data.update(data)
+        return graph
+
+    def save(self):
+        """Manifest schreiben, unverändert bleibt die Datei (und ihre mtime) stehen"""
+        content = json.dumps(self.data, indent=1, sort_keys=True) + "\n"
+        if content == self._saved:
+            return
+        with open(manifest_path(self.root), 'w', encoding='utf-8') as f:
+            f.write(content)
+        self._saved = content
+
+    @property
+    def pages(self) -> Dict[str, Dict]:
+        return self.data["pages"]
+
+    @property
+    def images(self) -> Dict[str, Dict]:
+        return self.data["images"]
+
+    def page_changes(self, relative: str, code: str, template_hash: str, resolve,
+                     image_entries: Dict[str, Dict]) -> List[str]:
+        """Gründe, eine Seite neu zu rendern (leer = Seite ist aktuell)
+
+        code ist der Hash des Generators (geänderte Render-Logik betrifft
+        alle Seiten). resolve liefert den aktuellen Wert eines Schlüssels;
+        fehlt er inzwischen, wird die Seite ebenfalls neu gerendert (und
+        meldet dort den Fehler).
+        """
+        record = self.pages.get(relative)
+        if record is None:
+            return ["nicht im Build-Manifest"]
+        if record["code"] != code:
+            return ["Generator geändert"]
+        if record["template"] != template_hash:
+            return ["Template geändert"]
+        changed = []
+        for key, digest in record["keys"].items():
+            try:
+                current = hash_value(resolve(key))
+            except KeyError:
+                current = None
+            if current != digest:
+                changed.append(key)
+        changed += [f"Bild {stem}" for stem, digest in record["images"].items()
+                    if hash_value(image_entries.get(stem)) != digest]
+        if changed:
+            shown = ", ".join(changed[:3]) + (" ..." if len(changed) > 3 else "")
+            return [f"{shown} geändert"]
+        output = os.path.join(self.root, relative)
+        if not os.path.exists(output):
+            return ["Ausgabe fehlt"]
+        with open(output, 'r', encoding='utf-8') as f:
+            if hash_value(f.read()) != record["output"]:
+                return ["Ausgabe von Hand geändert"]
+        return []
+
+    def record_page(self, relative: str, code: str, template_hash: str, values: Dict[str, Any],
+                    image_entries: Dict[str, Optional[Dict]], html: str, fallbacks: List[str]):
+        self.pages[relative] = {
+            "code": code,
+            "template": template_hash,
+            "keys": {key: hash_value(value) for key, value in values.items()},
+            "images": {stem: hash_value(entry) for stem, entry in image_entries.items()},
+            "output": hash_value(html),
+            "fallbacks": fallbacks,
+        }
+
+    def image_current(self, stem: str, key: str, output_dir: str) -> bool:
+        """Varianten eines Originals liegen unverändert in output_dir (gleicher Cache-Schlüssel)"""
+        record = self.images.get(stem)
+        if record is None or record["key"] != key:
+            return False
+        for name, size in record["files"].items():
+            try:
+                if os.path.getsize(os.path.join(output_dir, name)) != size:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def record_image(self, stem: str, key: str, entry: Dict, output_dir: str):
+        files = [variant["file"] for variants in entry["variants"].values()
+                 for variant in variants]
+        self.images[stem] = {
+            "key": key,
+            "files": {name: os.path.getsize(os.path.join(output_dir, name)) for name in files},
+        }
@@ -0,0 +1,559 @@
+"""
+Responsive Bilder aus den Originalen (HEIC/JPEG)
+
+Die Originale in website/assets/images sind iPhone-Fotos (HEIC, zeigt kein
+Browser an) oder JPEGs in voller Auflösung. Welches Original hinter einem
+Bild der Seiten steht (hero, gallery-4, ...), legt config.IMAGE_SLOTS fest.
+Der Build dekodiert jedes verwendete Original, dreht es laut
+EXIF-Orientierung, entfernt alle Metadaten (EXIF, GPS, XMP; Farbprofile
+werden nach sRGB umgerechnet) und schreibt pro Zielbreite AVIF, WebP und JPEG:
+
+    website/assets/images/responsive/<name>-<breite>.<avif|webp|jpg>
+    website/assets/images/responsive/images.json   # Name → Maße und Varianten
+
+inject_pages() ersetzt danach in Hero und Galerie jedes <img> mit Varianten
+durch ein <picture> mit srcset/sizes und width/height (kein Springen beim
+Laden). Die Varianten liegen nur in der deutschen Version; die Rewrites aus
+sitebuild.assets gelten für alle Sprachen.
+
+Benötigt Pillow und pillow-heif (AVIF: Pillow >= 11.3 oder pillow-avif-plugin):
+
+    pip install Pillow pillow-heif
+
+Aufruf (aus scripts/):
+
+    python3 -m sitebuild images            # Varianten bauen
+    python3 -m sitebuild images --inject   # ... und die Seiten mit <picture> neu rendern
+
+Kodiert wird parallel (ein Prozess pro CPU-Kern, SITEBUILD_WORKERS); fertige
+Varianten liegen im Build-Cache (sitebuild.cache), ein Lauf ohne geänderte
+Originale verlinkt nur noch. Stehen Original und Varianten unverändert im
+Build-Graph (sitebuild.graph), wird das Bild ganz übersprungen – auch ohne
+Cache und ohne Pillow.
+"""
+
+import io
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from . import config
+from .cache import ImageCache
+from .graph import BuildGraph
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+    ImageOps = None
+
+try:
+    from PIL import ImageCms
+except ImportError:
+    ImageCms = None
+
+try:
+    from pillow_heif import register_heif_opener
+    register_heif_opener()
+    HEIF_SUPPORT = True
+except ImportError:
+    HEIF_SUPPORT = False
+
+try:
+    import pillow_avif  # noqa: F401 (registriert AVIF bei Pillow < 11.3)
+except ImportError:
+    pass
+
+# Bei Änderungen an load_image()/process_image() erhöhen (macht den Cache ungültig)
+PIPELINE_VERSION = 2
+
+SOURCE_EXTENSIONS = (".heic", ".heif", ".png", ".jpg", ".jpeg")
+# Gibt es ein Bild in mehreren Formaten, gewinnt das Original (HEIC vor Export)
+SOURCE_PRIORITY = {".heic": 0, ".heif": 0, ".png": 1, ".jpg": 2, ".jpeg": 2}
+
+FORMAT_EXTENSIONS = {"avif": "avif", "webp": "webp", "jpeg": "jpg"}
+FORMAT_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg"}
+
+# Container-Klasse in index.html → sizes. Breakpoints aus dem CSS:
+# .hero-container max. 1400px zweispaltig, .gallery-grid max. 1200px mit
+# 4 Spalten (.large über 2), bis 1024px Hero einspaltig und Galerie 2 Spalten
+SIZES = {
+    "hero-image": "(max-width: 1024px) 100vw, 700px",
+    "gallery-item large": "(max-width: 1024px) 50vw, 600px",
+    "gallery-item": "(max-width: 1024px) 50vw, 300px",
+}
+# Oberhalb des Falzes: nicht lazy laden, sondern mit Vorrang
+EAGER_CONTAINERS = ("hero-image",)
+
+# Attribute, die inject_html() setzt (und beim erneuten Lauf wieder entfernt)
+MANAGED_ATTRIBUTES = ("src", "srcset", "sizes", "width", "height", "loading",
+                      "decoding", "fetchpriority")
+
+_ATTRIBUTE = re.compile(r'([\w:-]+)(\s*=\s*"([^"]*)")?')
+_PICTURE = re.compile(r'<picture data-responsive="(?P<name>[^"]*)">.*?'
+                      r'(?P<img><img\b[^>]*>)\s*</picture>', re.S)
+_CONTAINER = re.compile(r'(?P<open><div class="(?P<cls>[^"]*)"[^>]*>)(?P<space>\s*)'
+                        r'(?P<img><img\b[^>]*>)')
+_LIGHTBOX = re.compile(r"openLightbox\('(?P<path>[^']*)'\)")
+_VARIANT = re.compile(r"(?P<stem>.+)-\d+\.(?:avif|webp|jpg)$")
+_IMG_SRC = re.compile(r'<img\b[^>]*\bsrc="' + re.escape(config.IMAGES_DIR) + r'/(?P<name>[^"/]+)"')
+
+
+def images_dir(root: str = config.SITE_ROOT) -> str:
+    return os.path.join(root, config.LOCALE_DIRS[config.IMAGE_LOCALE], config.IMAGES_DIR)
+
+
+def responsive_dir(root: str = config.SITE_ROOT) -> str:
+    return os.path.join(images_dir(root), config.RESPONSIVE_DIR)
+
+
+def available_formats(formats: Dict[str, int]) -> Dict[str, int]:
+    """Formate, die Pillow schreiben kann (AVIF fehlt bei älteren Versionen)"""
+    Image.init()
+    return {fmt: quality for fmt, quality in formats.items() if fmt.upper() in Image.SAVE}
+
+
+def find_sources(directory: str, extensions=SOURCE_EXTENSIONS) -> Dict[str, str]:
+    """Bildname (ohne Endung) → Original; HEIC vor PNG vor JPEG"""
+    found: Dict[str, tuple] = {}
+    for name in sorted(os.listdir(directory)):
+        stem, extension = os.path.splitext(name)
+        extension = extension.lower()
+        if extension not in extensions or not os.path.isfile(os.path.join(directory, name)):
+            continue
+        priority = SOURCE_PRIORITY[extension]
+        if stem not in found or priority < found[stem][0]:
+            found[stem] = (priority, os.path.join(directory, name))
+    return {stem: source for stem, (_, source) in found.items()}
+
+
+def referenced_images(root: str = config.SITE_ROOT) -> List[str]:
+    """Bildnamen, die die Templates (auch Varianten) als <img src="assets/images/<name>.<endung>"> verwenden"""
+    referenced = set()
+    directory = os.path.join(root, config.TEMPLATES_DIR)
+    for name in sorted(os.listdir(directory)) if os.path.isdir(directory) else []:
+        if not name.endswith(".html"):
+            continue
+        try:
+            with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                html = f.read()
+        except OSError:
+            continue
+        for match in _IMG_SRC.finditer(html):
+            stem, extension = os.path.splitext(match.group("name"))
+            if extension.lower() in SOURCE_EXTENSIONS:
+                referenced.add(stem)
+    return sorted(referenced)
+
+
+def slot_sources(originals: Dict[str, str], referenced: List[str],
+                 slots: Dict[str, str] = config.IMAGE_SLOTS) -> tuple[Dict[str, str], List[str]]:
+    """Verwendeter Bildname → Original (laut slots, sonst gleichnamig) und Namen ohne Original"""
+    sources, missing = {}, []
+    for stem in referenced:
+        source = originals.get(slots.get(stem, stem))
+        if source is None:
+            missing.append(stem)
+        else:
+            sources[stem] = source
+    return sources, missing
+
+
+def target_widths(width: int, widths=config.IMAGE_WIDTHS) -> List[int]:
+    """Zielbreiten für ein Original; nie hochskalieren, das größte ist max. widths[-1]"""
+    widths = sorted(widths)
+    result = [target for target in widths if target < width]
+    largest = min(width, widths[-1])
+    return result if largest in result else result + [largest]
+
+
+def variant_name(width: int, fmt: str) -> str:
+    """Dateiname einer Variante im Cache (in responsive/ mit <name>- davor)"""
+    return f"{width}.{FORMAT_EXTENSIONS[fmt]}"
+
+
+def named_entry(entry: Dict, stem: str, source: str) -> Dict:
+    """Cache-Eintrag (Dateien <breite>.<endung>) als images.json-Eintrag für einen Bildnamen
+
+    Die Dateinamen entsprechen dem, was ImageCache.link_into() in responsive/ anlegt.
+    """
+    named = dict(entry, source=os.path.basename(source))
+    named["variants"] = {fmt: [dict(variant, file=f"{stem}-{variant['file']}")
+                               for variant in variants]
+                         for fmt, variants in entry["variants"].items()}
+    return named
+
+
+def _to_srgb(image, icc_profile: Optional[bytes]):
+    """RGB in sRGB (iPhone-Fotos sind Display P3), ohne Profil einfach RGB"""
+    image = image.convert("RGB")
+    if not icc_profile or ImageCms is None:
+        return image
+    try:
+        source = ImageCms.ImageCmsProfile(io.BytesIO(icc_profile))
+        return ImageCms.profileToProfile(image, source, ImageCms.createProfile("sRGB"),
+                                         outputMode="RGB")
+    except (OSError, ImageCms.PyCMSError):
+        return image
+
+
+def load_image(source: str):
+    """Original öffnen, EXIF-Orientierung anwenden, Metadaten verwerfen"""
+    with Image.open(source) as original:
+        icc_profile = original.info.get("icc_profile")
+        image = _to_srgb(ImageOps.exif_transpose(original), icc_profile)
+    # convert() übernimmt info (exif, xmp, ...); die Encoder würden es sonst mitschreiben
+    image.info = {}
+    return image
+
+
+def _save_options(fmt: str, quality: int) -> Dict:
+    if fmt == "jpeg":
+        return {"quality": quality, "optimize": True, "progressive": True}
+    if fmt == "webp":
+        return {"quality": quality, "method": 6}
+    return {"quality": quality}
+
+
+def process_image(source: str, output_dir: str, widths=config.IMAGE_WIDTHS,
+                  formats: Optional[Dict[str, int]] = None) -> Dict:
+    """Alle Varianten eines Originals als <breite>.<endung> schreiben
+
+    Gibt den Cache-Eintrag zurück (ohne Bildnamen, siehe named_entry()).
+    """
+    formats = formats or config.IMAGE_FORMATS
+    image = load_image(source)
+    width, height = image.size
+    entry = {"width": width, "height": height, "variants": {fmt: [] for fmt in formats}}
+
+    for target in target_widths(width, widths):
+        target_height = round(height * target / width)
+        resized = image if target == width else image.resize((target, target_height),
+                                                               Image.LANCZOS)
+        for fmt, quality in formats.items():
+            name = variant_name(target, fmt)
+            resized.save(os.path.join(output_dir, name), format=fmt.upper(),
+                         **_save_options(fmt, quality))
+            entry["variants"][fmt].append({"width": target, "file": name})
+        entry["width"], entry["height"] = target, target_height
+    return entry
+
+
+def load_manifest(root: str = config.SITE_ROOT) -> Dict[str, Dict]:
+    """Bildname → Eintrag aus responsive/images.json (leer, wenn noch nicht gebaut)"""
+    manifest_path = os.path.join(responsive_dir(root), config.RESPONSIVE_MANIFEST)
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_manifest(output_dir: str, manifest: Dict[str, Dict]):
+    """images.json schreiben, unverändert bleibt die Datei (und ihre mtime) stehen"""
+    manifest_path = os.path.join(output_dir, config.RESPONSIVE_MANIFEST)
+    content = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return
+    except OSError:
+        pass
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _remove_stale(output_dir: str, manifest: Dict[str, Dict]) -> int:
+    """Varianten löschen, die zu keinem Original mehr gehören"""
+    keep = {variant["file"] for entry in manifest.values()
+            for variants in entry["variants"].values() for variant in variants}
+    keep.add(config.RESPONSIVE_MANIFEST)
+    removed = 0
+    for name in os.listdir(output_dir):
+        if name not in keep:
+            os.remove(os.path.join(output_dir, name))
+            removed += 1
+    return removed
+
+
+class ImageReport:
+    """Was build_images() getan hat: übersprungen, Cache-Treffer, Kodierzeit pro Bild"""
+
+    def __init__(self):
+        self.skipped: List[str] = []
+        self.hits: List[str] = []
+        self.encoded: Dict[str, float] = {}
+        self.failed: List[str] = []
+        self.missing: List[str] = []
+        self.workers = 0
+        self.elapsed = 0.0
+
+    @property
+    def total(self) -> int:
+        return len(self.hits) + len(self.encoded) + len(self.failed)
+
+    @property
+    def hit_rate(self) -> float:
+        return len(self.hits) / self.total if self.total else 1.0
+
+    def summary(self) -> List[str]:
+        lines = []
+        if self.skipped:
+            lines.append(f"⏭️  {len(self.skipped)} übersprungen – Original und Varianten "
+                         f"unverändert ({config.BUILD_MANIFEST})")
+        if self.total or not self.skipped:
+            lines.append(f"📊 Cache: {len(self.hits)}/{self.total} Treffer ({self.hit_rate:.0%})")
+        if self.encoded:
+            cpu = sum(self.encoded.values())
+            slowest = max(self.encoded, key=self.encoded.get)
+            lines.append(f"   {len(self.encoded)} Bild(er) kodiert: {cpu:.2f}s Kodierzeit in "
+                         f"{self.elapsed:.2f}s mit {self.workers} Prozess(en), "
+                         f"langsamstes {slowest} ({self.encoded[slowest]:.2f}s)")
+        if self.failed:
+            lines.append(f"   ❌ fehlgeschlagen: {', '.join(self.failed)}")
+        if self.missing:
+            lines.append(f"⚠️  {len(self.missing)} Bild(er) in den Seiten ohne Original "
+                         f"(config.IMAGE_SLOTS): {', '.join(self.missing)}")
+        return lines
+
+
+def _encode(source: str, staging: str, widths, formats: Dict[str, int]) -> tuple[Dict, float]:
+    """Ein Original kodieren (läuft im Worker-Prozess)"""
+    started = time.perf_counter()
+    entry = process_image(source, staging, widths, formats)
+    return entry, time.perf_counter() - started
+
+
+def build_images(root: str = config.SITE_ROOT, widths=config.IMAGE_WIDTHS,
+                 formats: Optional[Dict[str, int]] = None, cache: Optional[ImageCache] = None,
+                 workers: int = config.IMAGE_WORKERS, force: bool = False,
+                 slots: Dict[str, str] = config.IMAGE_SLOTS) -> tuple[Optional[Dict[str, Dict]], ImageReport]:
+    """Varianten der Bilder bauen, die die Templates verwenden, und images.json schreiben
+
+    Das Original eines Bildnamens steht in slots (config.IMAGE_SLOTS), sonst
+    gilt die gleichnamige Datei; Namen ohne Original stehen in report.missing,
+    nicht verwendete Originale werden nicht kodiert. Gibt (Manifest, Bericht) zurück. Originale, deren Cache-Schlüssel laut
+    Build-Graph unverändert ist und deren Varianten vollständig in
+    responsive/ liegen, werden übersprungen (außer mit force=True). Treffer
+    im Cache werden nur verlinkt, der Rest wird parallel in bis zu workers
+    Prozessen kodiert. Das Manifest ist None, wenn kodiert werden müsste, Pillow aber
+    fehlt. Ohne pillow-heif werden HEIC-Originale übersprungen, ohne
+    AVIF-Encoder fehlt nur das AVIF-<source>.
+    """
+    started = time.perf_counter()
+    report = ImageReport()
+    cache = cache or ImageCache()
+    requested = formats or config.IMAGE_FORMATS
+    formats = available_formats(requested) if Image is not None else dict(requested)
+    for fmt in requested:
+        if fmt not in formats:
+            print(f"⚠️  {fmt.upper()} wird von Pillow nicht unterstützt, übersprungen "
+                  f"(Pillow >= 11.3 oder pip install pillow-avif-plugin)")
+    extensions = SOURCE_EXTENSIONS
+    if Image is not None and not HEIF_SUPPORT:
+        extensions = tuple(ext for ext in SOURCE_EXTENSIONS if ext not in (".heic", ".heif"))
+        print("⚠️  pillow-heif fehlt, HEIC-Originale übersprungen (pip install pillow-heif)")
+    output_dir = responsive_dir(root)
+    os.makedirs(output_dir, exist_ok=True)
+
+    params = {"version": PIPELINE_VERSION, "widths": sorted(widths), "formats": formats}
+    graph = BuildGraph.load(root)
+    built = load_manifest(root)
+    manifest: Dict[str, Dict] = {}
+    keys: Dict[str, str] = {}
+    entries: Dict[str, Dict] = {}
+    # Schlüssel → (Original, Bildnamen): Byte-gleiche Originale werden einmal kodiert
+    pending: Dict[str, tuple[str, List[str]]] = {}
+    sources, report.missing = slot_sources(find_sources(images_dir(root), extensions),
+                                           referenced_images(root), slots)
+    for stem, source in sources.items():
+        key = cache.key(cache.source_hash(source), params)
+        if not force and stem in built and graph.image_current(stem, key, output_dir):
+            manifest[stem] = built[stem]
+            report.skipped.append(stem)
+            continue
+        entry = entries.get(key) or cache.get(key)
+        if entry is None:
+            pending.setdefault(key, (source, []))[1].append(stem)
+            continue
+        entries[key], keys[stem] = entry, key
+        report.hits.append(stem)
+    cache.save_hashes()
+
+    if pending and Image is None:
+        print(f"❌ {len(pending)} Bild(er) müssen kodiert werden, aber Pillow fehlt "
+              f"→ pip install Pillow pillow-heif")
+        return None, report
+
+    if pending:
+        report.workers = max(1, min(workers, len(pending)))
+        staging = {key: cache.staging_dir() for key in pending}
+        with ProcessPoolExecutor(max_workers=report.workers) as pool:
+            futures = {pool.submit(_encode, source, staging[key], widths, formats): key
+                       for key, (source, _) in pending.items()}
+            for future in as_completed(futures):
+                key = futures[future]
+                first, *same = pending[key][1]
+                try:
+                    entry, seconds = future.result()
+                except (OSError, ValueError) as e:
+                    cache.discard(staging[key])
+                    report.failed += [first] + same
+                    print(f"❌ {first}: {e}")
+                    continue
+                cache.commit(key, staging[key], entry)
+                entries[key] = entry
+                keys.update((stem, key) for stem in [first] + same)
+                report.encoded[first] = seconds
+                report.hits += same
+                files = sum(len(variants) for variants in entry["variants"].values())
+                print(f"✅ {first}: {entry['width']}x{entry['height']}, {files} Varianten "
+                      f"({seconds:.2f}s)" + (f", identisch: {', '.join(same)}" if same else ""))
+
+    for stem, key in keys.items():
+        manifest[stem] = named_entry(entries[key], stem, sources[stem])
+    manifest = dict(sorted(manifest.items()))
+    for stem, key in keys.items():
+        cache.link_into(key, entries[key], stem, output_dir)
+        graph.record_image(stem, key, manifest[stem], output_dir)
+    _write_manifest(output_dir, manifest)
+    removed = _remove_stale(output_dir, manifest)
+    if removed:
+        print(f"🗑️  {removed} veraltete Variante(n) entfernt")
+    for stem in set(graph.images) - set(manifest):
+        del graph.images[stem]
+    graph.save()
+    report.elapsed = time.perf_counter() - started
+    return manifest, report
+
+
+def _parse_attributes(tag: str) -> Dict[str, Optional[str]]:
+    """Attribute eines <img ...> in Reihenfolge (Werte bleiben HTML-escaped)"""
+    body = tag[len("<img"):].rstrip(">").rstrip("/")
+    return {name: value if assignment else None
+            for name, assignment, value in _ATTRIBUTE.findall(body)}
+
+
+def _format_tag(attributes: Dict[str, Optional[str]]) -> str:
+    parts = [name if value is None else f'{name}="{value}"'
+             for name, value in attributes.items()]
+    return "<img " + " ".join(parts) + ">"
+
+
+def _srcset(variants: List[Dict], prefix: str) -> str:
+    return ", ".join(f"{prefix}/{config.RESPONSIVE_DIR}/{variant['file']} {variant['width']}w"
+                     for variant in variants)
+
+
+def picture_markup(name: str, entry: Dict, attributes: Dict[str, Optional[str]], sizes: str,
+                   eager: bool = False, indent: str = "",
+                   prefix: str = config.IMAGES_DIR) -> str:
+    """<picture> mit <source> pro Format und <img> (JPEG) als Fallback"""
+    variants = entry["variants"]
+    fallback = "jpeg" if variants.get("jpeg") else list(variants)[-1]
+    inner = indent + "    "
+    lines = [f'<picture data-responsive="{name}">']
+    for fmt, files in variants.items():
+        if fmt != fallback and files:
+            lines.append(f'{inner}<source type="{FORMAT_TYPES[fmt]}" '
+                         f'srcset="{_srcset(files, prefix)}" sizes="{sizes}">')
+
+    image = {
+        "src": f"{prefix}/{config.RESPONSIVE_DIR}/{variants[fallback][-1]['file']}",
+        "srcset": _srcset(variants[fallback], prefix),
+        "sizes": sizes,
+        "width": str(entry["width"]),
+        "height": str(entry["height"]),
+    }
+    image.update({key: value for key, value in attributes.items()
+                  if key not in MANAGED_ATTRIBUTES})
+    if eager:
+        image["fetchpriority"] = "high"
+    else:
+        image["loading"] = "lazy"
+    image["decoding"] = "async"
+    lines.append(inner + _format_tag(image))
+    lines.append(indent + "</picture>")
+    return "\n".join(lines)
+
+
+def _restore_picture(match, prefix: str) -> str:
+    """<picture data-responsive> aus einem früheren Lauf zurück zum schlichten <img>"""
+    attributes = _parse_attributes(match.group("img"))
+    image = {"src": f"{prefix}/{match.group('name')}"}
+    image.update({key: value for key, value in attributes.items()
+                  if key not in MANAGED_ATTRIBUTES})
+    return _format_tag(image)
+
+
+def _stem_for(path: str, prefix: str) -> Optional[str]:
+    """Bildname zu assets/images/<datei> oder einer Variante in responsive/"""
+    if not path.startswith(prefix + "/"):
+        return None
+    relative = path[len(prefix) + 1:]
+    responsive = config.RESPONSIVE_DIR + "/"
+    if relative.startswith(responsive):
+        match = _VARIANT.match(relative[len(responsive):])
+        return match.group("stem") if match else None
+    if "/" in relative:
+        return None
+    return os.path.splitext(relative)[0]
+
+
+def inject_html(html: str, manifest: Dict[str, Dict],
+                prefix: str = config.IMAGES_DIR) -> tuple[str, int]:
+    """<picture> für Hero und Galerie einsetzen, gibt (html, Anzahl Bilder) zurück
+
+    Mehrfach aufrufbar: frühere <picture data-responsive> werden erst auf das
+    ursprüngliche <img> zurückgesetzt und dann neu erzeugt.
+    """
+    html = _PICTURE.sub(lambda match: _restore_picture(match, prefix), html)
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        sizes = SIZES.get(match.group("cls"))
+        attributes = _parse_attributes(match.group("img"))
+        src = attributes.get("src") or ""
+        stem = _stem_for(src, prefix)
+        entry = manifest.get(stem) if stem else None
+        if not sizes or not entry or "/" in src[len(prefix) + 1:]:
+            return match.group(0)
+        count += 1
+        indent = match.group("space").rsplit("\n", 1)[-1]
+        return (match.group("open") + match.group("space")
+                + picture_markup(src[len(prefix) + 1:], entry, attributes, sizes,
+                                 match.group("cls") in EAGER_CONTAINERS, indent, prefix))
+
+    html = _CONTAINER.sub(replace, html)
+
+    def lightbox(match):
+        stem = _stem_for(match.group("path"), prefix)
+        entry = manifest.get(stem) if stem else None
+        if not entry or not entry["variants"].get("jpeg"):
+            return match.group(0)
+        largest = entry["variants"]["jpeg"][-1]["file"]
+        return f"openLightbox('{prefix}/{config.RESPONSIVE_DIR}/{largest}')"
+
+    return _LIGHTBOX.sub(lightbox, html), count
+
+
+def inject_pages(manifest: Dict[str, Dict], root: str = config.SITE_ROOT,
+                 pages=("index.html",)) -> Dict[str, int]:
+    """inject_html() für die Seiten aller Sprachen, gibt Pfad → Anzahl Bilder zurück"""
+    result = {}
+    for directory in config.LOCALE_DIRS.values():
+        for page in pages:
+            page_path = os.path.join(root, directory, page)
+            if not os.path.exists(page_path):
+                continue
+            with open(page_path, 'r', encoding='utf-8') as f:
+                html = f.read()
+            updated, count = inject_html(html, manifest)
+            if updated != html:
+                with open(page_path, 'w', encoding='utf-8') as f:
+                    f.write(updated)
+            result[os.path.join(directory, page)] = count
+    return result
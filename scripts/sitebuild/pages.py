@@ -0,0 +1,496 @@
+"""
+Mehrsprachige Seiten aus einem Template und Sprachkatalogen
+
+Statt fünf handgepflegter Kopien gibt es pro Seite ein Template
+(templates/index.html, blog.html, danke.html) und pro Sprache einen Katalog
+(templates/locales/<sprache>.json; die Sprachcodes sind die Schlüssel von
+LANGUAGES in api/contact.js). Platzhalter im Template:
+
+    {{ hero.title }}        Text aus dem Katalog (HTML, wird unverändert eingesetzt)
+    {{ form.error|js }}     ... als Inhalt eines JavaScript-Strings ('...')
+    {{ danke|js }}          alle Texte danke.* aller Sprachen als JavaScript-Objekt
+    {{ danke|json }}        ... als JSON-Objekt
+    {{ lang }}              Sprachcode der gerenderten Seite
+    {{ languages }}         Links des Sprachumschalters (eine Zeile pro Sprache)
+    {{ languages|local }}   ... mit relativem Link auf die eigene Sprache
+    {{ hreflang }}          <link rel="alternate" hreflang=...> aller Sprachen
+
+Sprachumschalter und hreflang-Links entstehen aus site.url und site.label
+der Kataloge – eine neue Sprache ist damit nur eine neue Katalogdatei.
+
+Sprachen mit eigenem Seitenaufbau nennen im Katalog ein anderes Template
+("site.template.blog.html": "blog.en.html"); ohne Eintrag gilt
+templates/<seite>. Seiten aus SHARED_PAGES (danke.html) sind in allen
+Sprachen gleich und werden mit dem deutschen Katalog gerendert.
+
+Fehlt ein Schlüssel in einem Katalog, wird der Text aus dem deutschen
+Katalog verwendet und als Warnung gemeldet. Die Sprachen werden parallel
+gerendert, geschrieben wird nur bei geändertem Inhalt. Sind responsive
+Bilder gebaut (sitebuild.images), werden die <picture>-Elemente gleich mit
+eingesetzt.
+
+Gerendert werden nur Seiten, deren Template, Platzhalter-Werte oder Bilder
+sich laut Build-Graph (sitebuild.graph, build-manifest.json) geändert haben;
+eine Preisänderung in en.json rendert also nur website-en/index.html.
+
+Aufruf (aus scripts/):
+
+    python3 -m sitebuild pages              # alle Sprachen rendern
+    python3 -m sitebuild pages --locale en  # nur eine Sprache
+    python3 -m sitebuild pages --force      # alles neu rendern (Graph ignorieren)
+"""
+
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from . import config, images
+from .graph import BuildGraph, hash_value
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([\w.-]+)\s*(?:\|\s*(\w+)\s*)?\}\}")
+_CONTACT_LANGUAGES = re.compile(r"const LANGUAGES = \{(.*?)\n\};", re.S)
+_CONTACT_LOCALE = re.compile(r"^  (\w+): \{", re.M)
+_RESPONSIVE = re.compile(r'data-responsive="([^"]+)"')
+_IMAGE_SOURCE = re.compile(r'assets/images/([^"\'/\s]+)\.\w+["\']')
+_ABSOLUTE_HREF = re.compile(r'href="https?://[^/"]+(/[^"]*)?"')
+
+
+def _escape_js(value: str) -> str:
+    """Inhalt eines JavaScript-Strings in einfachen Anführungszeichen"""
+    return value.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
+
+
+def _js_object(value: Dict[str, Any], indent: str = "    ") -> str:
+    """JavaScript-Objekt (Schlüssel ohne Anführungszeichen, Texte in '...'), eine Zeile pro Eintrag"""
+    lines = ["{"]
+    for position, (key, item) in enumerate(value.items()):
+        comma = "," if position < len(value) - 1 else ""
+        if isinstance(item, dict):
+            nested = _js_object(item, indent).split("\n")
+            lines.append(f"{indent}{key}: {nested[0]}")
+            lines.extend(indent + line for line in nested[1:-1])
+            lines.append(f"{indent}{nested[-1]}{comma}")
+        else:
+            lines.append(f"{indent}{key}: '{_escape_js(item)}'{comma}")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def _to_js(value: Any) -> str:
+    return _js_object(value) if isinstance(value, dict) else _escape_js(value)
+
+
+def _to_json(value: Any) -> str:
+    """JSON für ein <script>-Element ('</' darf dort nicht vorkommen)"""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, indent=4).replace("</", "<\\/")
+
+
+def _local_links(links: List[str]) -> str:
+    """Sprachumschalter mit relativem Link (/, /blog.html) auf die eigene Sprache"""
+    return "\n".join(_ABSOLUTE_HREF.sub(lambda m: f'href="{m.group(1) or "/"}"', link)
+                     if ' class="active"' in link else link for link in links)
+
+
+FILTERS: Dict[str, Callable[[Any], str]] = {
+    "js": _to_js,
+    "json": _to_json,
+    "local": _local_links,
+}
+
+
+class Template:
+    """Template, einmal in Text und Platzhalter zerlegt
+
+    Listen (languages, hreflang) und JSON werden zeilenweise mit der
+    Einrückung der Zeile des Platzhalters eingesetzt, Katalogtexte unverändert.
+    """
+
+    def __init__(self, name: str, text: str):
+        self.name = name
+        self.digest = hash_value(text)
+        self.parts: List = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(text):
+            self.parts.append(text[position:match.start()])
+            key, filter_name = match.group(1), match.group(2)
+            if filter_name and filter_name not in FILTERS:
+                raise ValueError(f"{name}: unbekannter Filter '{filter_name}' bei {key}")
+            line_start = text.rfind("\n", 0, match.start()) + 1
+            indent = re.match(r"[ \t]*", text[line_start:]).group(0)
+            self.parts.append((key, filter_name, indent))
+            position = match.end()
+        self.parts.append(text[position:])
+
+    @classmethod
+    def load(cls, path: str) -> "Template":
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(os.path.basename(path), f.read())
+
+    @property
+    def keys(self) -> List[str]:
+        """Alle Platzhalter in Reihenfolge ihres ersten Auftretens"""
+        seen = {}
+        for part in self.parts:
+            if isinstance(part, tuple):
+                seen.setdefault(part[0], None)
+        return list(seen)
+
+    def render(self, resolve: Callable[[str], Any]) -> str:
+        out = []
+        for part in self.parts:
+            if isinstance(part, str):
+                out.append(part)
+                continue
+            key, filter_name, indent = part
+            value = resolve(key)
+            if isinstance(value, str):
+                out.append(FILTERS[filter_name](value) if filter_name else value)
+                continue
+            lines = FILTERS[filter_name](value).split("\n") if filter_name else value
+            out.append(("\n" + indent).join(lines))
+        return "".join(out)
+
+
+def templates_dir(root: str = config.SITE_ROOT) -> str:
+    return os.path.join(root, config.TEMPLATES_DIR)
+
+
+def catalogs_dir(root: str = config.SITE_ROOT) -> str:
+    return os.path.join(root, config.CATALOGS_DIR)
+
+
+def load_templates(root: str = config.SITE_ROOT) -> Dict[str, Template]:
+    """Dateiname → Template für alle Templates (Seiten und Varianten)"""
+    directory = templates_dir(root)
+    return {name: Template.load(os.path.join(directory, name))
+            for name in sorted(os.listdir(directory))
+            if name.endswith(".html") and os.path.isfile(os.path.join(directory, name))}
+
+
+def load_catalogs(root: str = config.SITE_ROOT) -> Dict[str, Dict[str, str]]:
+    """Sprache → Katalog (Schlüssel → Text) aus templates/locales/*.json"""
+    directory = catalogs_dir(root)
+    catalogs = {}
+    for name in sorted(os.listdir(directory)):
+        locale, extension = os.path.splitext(name)
+        if extension == ".json":
+            with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                catalogs[locale] = json.load(f)
+    return catalogs
+
+
+def contact_locales(root: str = config.SITE_ROOT) -> List[str]:
+    """Sprachcodes aus LANGUAGES in api/contact.js (Texte der E-Mails)"""
+    try:
+        with open(os.path.join(root, config.CONTACT_API), 'r', encoding='utf-8') as f:
+            match = _CONTACT_LANGUAGES.search(f.read())
+    except OSError:
+        return []
+    return _CONTACT_LOCALE.findall(match.group(1)) if match else []
+
+
+def page_locale(locale: str, page: str) -> str:
+    """Sprache, deren Katalog die Seite füllt (SHARED_PAGES: immer die Standardsprache)"""
+    return config.DEFAULT_LOCALE if page in config.SHARED_PAGES else locale
+
+
+def template_name(locale: str, page: str, catalogs: Dict[str, Dict[str, str]]) -> str:
+    """Template einer Seite in einer Sprache: site.template.<seite> oder die Seite selbst"""
+    return catalogs.get(page_locale(locale, page), {}).get(f"site.template.{page}", page)
+
+
+def page_url(catalog: Dict[str, str], page: str) -> str:
+    """Absolute URL einer Seite in einer Sprache (index.html = Startseite)"""
+    return catalog.get("site.url", "/") + ("" if page == "index.html" else page)
+
+
+def locale_context(locale: str, page: str,
+                   catalogs: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+    """Werte, die nicht im Katalog stehen: Sprachcode, Sprachumschalter, hreflang"""
+    languages, hreflang = [], []
+    for other, catalog in catalogs.items():
+        url = page_url(catalog, page)
+        active = ' class="active"' if other == locale else ""
+        label = catalog.get("site.label", other.upper())
+        languages.append(f'<a href="{url}"{active}>{label}</a>')
+        hreflang.append(f'<link rel="alternate" hreflang="{other}" href="{url}">')
+    default = catalogs.get(config.DEFAULT_LOCALE)
+    if default is not None:
+        hreflang.append(f'<link rel="alternate" hreflang="x-default" '
+                        f'href="{page_url(default, page)}">')
+    return {"lang": locale, "languages": languages, "hreflang": hreflang}
+
+
+def catalog_group(prefix: str, catalogs: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """Sprache → {name: Text} für alle Schlüssel prefix.name (für {{ prefix|js }})
+
+    Reihenfolge der Namen wie im deutschen Katalog, dann wie in den übrigen.
+    """
+    default = catalogs.get(config.DEFAULT_LOCALE, {})
+    names: Dict[str, None] = {}
+    for catalog in [default, *catalogs.values()]:
+        for key in catalog:
+            name = key[len(prefix) + 1:]
+            if key.startswith(prefix + ".") and "." not in name:
+                names.setdefault(name)
+    return {locale: {name: catalog.get(f"{prefix}.{name}", default.get(f"{prefix}.{name}", ""))
+                     for name in names}
+            for locale, catalog in catalogs.items()}
+
+
+class PageReport:
+    """Ergebnis eines Laufs: geschriebene und übersprungene Seiten mit Grund, Zeit pro Sprache"""
+
+    def __init__(self):
+        self.written: List[str] = []
+        self.unchanged: List[str] = []
+        self.skipped: List[str] = []
+        self.rendered: Dict[str, str] = {}
+        self.fallbacks: Dict[str, List[str]] = {}
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.timings: Dict[str, float] = {}
+        self.elapsed = 0.0
+
+    def summary(self) -> List[str]:
+        lines = []
+        for locale, keys in sorted(self.fallbacks.items()):
+            shown = ", ".join(keys[:5]) + (" ..." if len(keys) > 5 else "")
+            lines.append(f"⚠️  {locale}: {len(keys)} Text(e) fehlen, deutscher Text verwendet "
+                         f"({shown})")
+        for warning in self.warnings:
+            lines.append(f"⚠️  {warning}")
+        for error in self.errors:
+            lines.append(f"❌ {error}")
+        by_reason: Dict[str, List[str]] = {}
+        for relative, reason in sorted(self.rendered.items()):
+            by_reason.setdefault(reason, []).append(relative)
+        for reason, pages in by_reason.items():
+            shown = ", ".join(pages[:3]) + (" ..." if len(pages) > 3 else "")
+            lines.append(f"🔄 {len(pages)} gerendert – {reason}: {shown}")
+        if self.skipped:
+            lines.append(f"⏭️  {len(self.skipped)} übersprungen – Template, Texte, Bilder und "
+                         f"Ausgabe unverändert ({config.BUILD_MANIFEST})")
+        slowest = max(self.timings.values(), default=0.0)
+        lines.append(f"📄 {len(self.written)} geschrieben, {len(self.unchanged)} unverändert – "
+                     f"{len(self.timings)} Sprache(n) in {self.elapsed * 1000:.0f} ms "
+                     f"(langsamste {slowest * 1000:.0f} ms)")
+        return lines
+
+
+def output_path(locale: str, page: str) -> str:
+    """Zielpfad relativ zum Repository (website-xx/seite)"""
+    return os.path.join(config.LOCALE_DIRS.get(locale, f"website-{locale}"), page)
+
+
+def page_resolver(locale: str, page: str, catalogs: Dict[str, Dict[str, str]],
+                  fallbacks: List[str]) -> Callable[[str], Any]:
+    """Platzhalter auflösen: Kontext, Katalog, deutscher Katalog (→ fallbacks), Gruppe
+
+    KeyError, wenn ein Schlüssel nirgends steht.
+    """
+    locale = page_locale(locale, page)
+    context = locale_context(locale, page, catalogs)
+    catalog = catalogs[locale]
+    default = catalogs.get(config.DEFAULT_LOCALE, {})
+
+    def resolve(key: str) -> Any:
+        if key in context:
+            return context[key]
+        if key in catalog:
+            return catalog[key]
+        if key in default:
+            fallbacks.append(key)
+            return default[key]
+        group = catalog_group(key, catalogs)
+        if any(group.values()):
+            return group
+        raise KeyError(f"{key} fehlt in allen Katalogen")
+
+    return resolve
+
+
+def image_stems(html: str) -> List[str]:
+    """Bildnamen, deren Einträge aus images.json in die Seite eingehen können"""
+    return sorted(set(_RESPONSIVE.findall(html)) | set(_IMAGE_SOURCE.findall(html)))
+
+
+def render_page(locale: str, page: str, template: Template,
+                catalogs: Dict[str, Dict[str, str]],
+                manifest: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
+    """Eine Seite rendern, mit allem, wovon sie abhängt (für den Build-Graphen)
+
+    Gibt {html, values (Schlüssel → Wert), images (Name → Eintrag), fallbacks} zurück.
+    """
+    fallbacks: List[str] = []
+    resolve = page_resolver(locale, page, catalogs, fallbacks)
+    values = {}
+
+    def recording(key: str) -> Any:
+        values[key] = resolve(key)
+        return values[key]
+
+    try:
+        html = template.render(recording)
+    except KeyError as e:
+        raise KeyError(f"{template.name}: {e.args[0]}") from None
+    if manifest:
+        html, _ = images.inject_html(html, manifest)
+    manifest = manifest or {}
+    return {"html": html, "values": values, "fallbacks": sorted(set(fallbacks)),
+            "images": {stem: manifest.get(stem) for stem in image_stems(html)}}
+
+
+def render_locale(locale: str, templates: Dict[str, Template],
+                  catalogs: Dict[str, Dict[str, str]],
+                  manifest: Optional[Dict[str, Dict]] = None) -> tuple[Dict[str, str], List[str]]:
+    """Alle Seiten einer Sprache, gibt ({Zielpfad: HTML}, [Fallback-Schlüssel]) zurück
+
+    KeyError, wenn ein Platzhalter weder im Katalog noch im deutschen Katalog
+    steht oder das Template der Sprache fehlt.
+    """
+    pages, fallbacks = {}, set()
+    for page in config.PAGES:
+        template = _template(templates, locale, page, catalogs)
+        result = render_page(locale, page, template, catalogs, manifest)
+        pages[output_path(locale, page)] = result["html"]
+        fallbacks.update(result["fallbacks"])
+    return pages, sorted(fallbacks)
+
+
+def _template(templates: Dict[str, Template], locale: str, page: str,
+              catalogs: Dict[str, Dict[str, str]]) -> Template:
+    name = template_name(locale, page, catalogs)
+    if name not in templates:
+        raise KeyError(f"{locale}: Template {name} für {page} fehlt in {config.TEMPLATES_DIR}/")
+    return templates[name]
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def generator_hash() -> str:
+    """Hash des Generator-Codes: geänderte Render-Logik macht alle Seiten ungültig"""
+    sources = []
+    for module in (__file__, images.__file__):
+        with open(module, 'r', encoding='utf-8') as f:
+            sources.append(f.read())
+    return hash_value(sources)
+
+
+def build_pages(root: str = config.SITE_ROOT, locales: Optional[List[str]] = None,
+                write: bool = True, force: bool = False) -> PageReport:
+    """Geänderte Seiten aller (oder der angegebenen) Sprachen parallel rendern
+
+    Welche Seiten betroffen sind, entscheidet der Build-Graph
+    (build-manifest.json): Template, die Werte aller Platzhalter der Seite,
+    die eingesetzten Bilder und die Ausgabe selbst. force=True rendert alles.
+    Mit write=False wird nur verglichen (report.written = veraltete Seiten)
+    und der Graph nicht gespeichert.
+    """
+    started = time.perf_counter()
+    report = PageReport()
+    templates = load_templates(root)
+    catalogs = load_catalogs(root)
+    manifest = images.load_manifest(root)
+    graph = BuildGraph.load(root)
+    code = generator_hash()
+    all_locales = locales is None
+    locales = locales or list(catalogs)
+
+    def run(locale: str):
+        locale_started = time.perf_counter()
+        results = []
+        for page in config.PAGES:
+            template = _template(templates, locale, page, catalogs)
+            relative = output_path(locale, page)
+            if force:
+                reasons = ["--force"]
+            else:
+                resolve = page_resolver(locale, page, catalogs, [])
+                reasons = graph.page_changes(relative, code, template.digest, resolve, manifest)
+            if not reasons:
+                results.append((page, relative, None, None))
+                continue
+            result = render_page(locale, page, template, catalogs, manifest)
+            target = os.path.join(root, relative)
+            result["changed"] = _read(target) != result["html"]
+            if result["changed"] and write:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, 'w', encoding='utf-8') as f:
+                    f.write(result["html"])
+            result["template"] = template.digest
+            results.append((page, relative, reasons[0], result))
+        return locale, results, time.perf_counter() - locale_started
+
+    unknown = [locale for locale in locales if locale not in catalogs]
+    for locale in unknown:
+        report.errors.append(f"{locale}: kein Katalog in {config.CATALOGS_DIR}/")
+    fallbacks: Dict[str, set] = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(locales))) as pool:
+        futures = [pool.submit(run, locale) for locale in locales if locale in catalogs]
+        for future in futures:
+            try:
+                locale, results, seconds = future.result()
+            except KeyError as e:
+                report.errors.append(str(e.args[0]))
+                continue
+            report.timings[locale] = seconds
+            for page, relative, reason, result in results:
+                if result is None:
+                    report.skipped.append(relative)
+                    fallbacks.setdefault(locale, set()).update(
+                        graph.pages[relative].get("fallbacks", []))
+                    continue
+                report.rendered[relative] = reason
+                (report.written if result["changed"] else report.unchanged).append(relative)
+                fallbacks.setdefault(locale, set()).update(result["fallbacks"])
+                graph.record_page(relative, code, result["template"], result["values"],
+                                  result["images"], result["html"], result["fallbacks"])
+    report.fallbacks = {locale: sorted(keys) for locale, keys in fallbacks.items() if keys}
+
+    if write and not report.errors:
+        if all_locales:
+            current = {output_path(locale, page) for locale in catalogs for page in config.PAGES}
+            for relative in set(graph.pages) - current:
+                del graph.pages[relative]
+        graph.save()
+
+    mail_locales = contact_locales(root)
+    missing_mail = sorted(set(catalogs) - set(mail_locales))
+    if mail_locales and missing_mail:
+        report.warnings.append(f"{', '.join(missing_mail)}: fehlt in LANGUAGES in "
+                               f"{config.CONTACT_API}, E-Mails kommen auf Deutsch")
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def unused_keys(root: str = config.SITE_ROOT) -> Dict[str, List[str]]:
+    """Sprache → Katalogschlüssel, die in keinem Template dieser Sprache vorkommen
+
+    Gruppen ({{ danke|js }}) zählen für alle Sprachen, gemeinsame Seiten
+    (SHARED_PAGES) nur für den deutschen Katalog.
+    """
+    templates = load_templates(root)
+    catalogs = load_catalogs(root)
+    unused = {}
+    for locale, catalog in catalogs.items():
+        used = {"site.url", "site.label"}
+        for page in config.PAGES:
+            template = templates.get(template_name(locale, page, catalogs))
+            if template is not None:
+                used.update(template.keys)
+        used.update(key for template in templates.values() for key in template.keys
+                    if "." not in key)
+        unused[locale] = sorted(key for key in catalog
+                                if key not in used and key.split(".")[0] not in used
+                                and not key.startswith("site.template."))
+    return unused
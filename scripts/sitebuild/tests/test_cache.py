@@ -0,0 +1,41 @@
+"""Cache-Schlüssel der Bildvarianten: Inhalt des Originals plus Parameter, nicht der Name"""
+
+from sitebuild.cache import ImageCache
+
+PARAMS = {"version": 2, "widths": [480, 800], "formats": {"avif": 60, "webp": 80, "jpeg": 82}}
+
+
+def test_key_depends_on_content_and_params():
+    key = ImageCache.key("a" * 64, PARAMS)
+
+    assert key == ImageCache.key("a" * 64, dict(reversed(list(PARAMS.items()))))
+    assert key != ImageCache.key("b" * 64, PARAMS)
+    assert key != ImageCache.key("a" * 64, dict(PARAMS, version=3))
+    assert key != ImageCache.key("a" * 64, dict(PARAMS, widths=[480, 800, 1200]))
+    assert key != ImageCache.key("a" * 64, dict(PARAMS, formats={"avif": 50, "webp": 80, "jpeg": 82}))
+
+
+def test_same_photo_under_two_names_shares_a_key(tmp_path):
+    cache = ImageCache(str(tmp_path / "cache"))
+    (tmp_path / "IMG_3354.jpg").write_bytes(b"jpeg-bytes")
+    (tmp_path / "gallery-7.jpg").write_bytes(b"jpeg-bytes")
+    (tmp_path / "IMG_3352.jpg").write_bytes(b"other-bytes")
+
+    keys = {name: cache.key(cache.source_hash(str(tmp_path / name)), PARAMS)
+            for name in ("IMG_3354.jpg", "gallery-7.jpg", "IMG_3352.jpg")}
+
+    assert keys["IMG_3354.jpg"] == keys["gallery-7.jpg"]
+    assert keys["IMG_3352.jpg"] != keys["IMG_3354.jpg"]
+
+
+def test_changed_original_gets_a_new_key(tmp_path):
+    cache = ImageCache(str(tmp_path / "cache"))
+    source = tmp_path / "IMG_3343.jpg"
+    source.write_bytes(b"first")
+    first = cache.key(cache.source_hash(str(source)), PARAMS)
+    cache.save_hashes()
+
+    source.write_bytes(b"second, longer")
+    reloaded = ImageCache(str(tmp_path / "cache"))
+
+    assert reloaded.key(reloaded.source_hash(str(source)), PARAMS) != first
@@ -0,0 +1,65 @@
+"""<picture>-Einbau mit einem synthetischen images.json in die echten Seiten"""
+
+import os
+import re
+
+from sitebuild import config
+from sitebuild.images import (find_sources, images_dir, inject_html, named_entry,
+                              referenced_images, slot_sources, variant_name)
+
+WIDTHS = (480, 800)
+FORMATS = ("avif", "webp", "jpeg")
+
+
+def _manifest(stems):
+    """images.json-Einträge wie nach build_images(), ohne Pillow"""
+    entry = {"width": WIDTHS[-1], "height": 600,
+             "variants": {fmt: [{"width": width, "file": variant_name(width, fmt)}
+                                for width in WIDTHS] for fmt in FORMATS}}
+    return {stem: named_entry(entry, stem, f"IMG_{stem}.HEIC") for stem in stems}
+
+
+def _page(directory="website"):
+    with open(os.path.join(config.SITE_ROOT, directory, "index.html"), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_every_referenced_image_has_an_original():
+    _, missing = slot_sources(find_sources(images_dir()), referenced_images())
+
+    assert missing == []
+
+
+def test_hero_and_gallery_get_pictures():
+    stems = referenced_images()
+    html, count = inject_html(_page(), _manifest(stems))
+
+    assert count == len(stems)
+    for stem in stems:
+        assert f'<picture data-responsive="{stem}.jpg">' in html
+        assert (f'<source type="image/avif" srcset="assets/images/responsive/{stem}-480.avif 480w, '
+                f'assets/images/responsive/{stem}-800.avif 800w"') in html
+    assert not re.search(r'<img src="assets/images/[^"/]+\.jpg"', html)
+
+    hero = re.search(r'<div class="hero-image">\s*<picture.*?</picture>', html, re.S).group(0)
+    assert 'fetchpriority="high"' in hero and 'loading="lazy"' not in hero
+    assert 'width="800" height="600"' in hero
+    assert "openLightbox('assets/images/responsive/gallery-3-800.jpg')" in html
+
+
+def test_legacy_layout_gets_pictures():
+    html, count = inject_html(_page("website-fr"), _manifest(referenced_images()))
+
+    # Hero und gallery-3/4/6, gallery-7 gibt es im alten Layout nicht
+    assert count == 4
+    assert '<div class="gallery-item" onclick="openLightbox(' \
+           "'assets/images/responsive/gallery-6-800.jpg')\"><picture" in html
+
+
+def test_injection_is_repeatable():
+    manifest = _manifest(referenced_images())
+    once, _ = inject_html(_page(), manifest)
+    twice, count = inject_html(once, manifest)
+
+    assert twice == once
+    assert count == len(manifest)